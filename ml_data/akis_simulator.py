@@ -0,0 +1,331 @@
+"""
+CafeML – Sipariş Akışı Simülatörü
+=================================
+generate_dataset.py ile aynı olasılık modelinden, zaman sırasıyla, sınırsız
+(ya da -n ile sınırlı) sipariş akışı üretir ve istenen hızda bir hedefe
+NDJSON satırları olarak oynatır (her satır bir sipariş; one_hot hariç
+siparis_uret() alanları).
+
+Zaman modeli:
+    Her gün için sipariş sayısı Poisson(--gunluk), saatlere SAAT_DAGITIM
+    ağırlıklarıyla (multinomial) dağıtılır, saat içindeki dakikalar düzgün
+    çekilip sıralanır. Gün tablosu (ay, hafta sonu, özel gün) takvim() ile
+    her gün için ayrıca kurulur; akış BITIS_TARIHI'ni geçebilir.
+
+Motorlar:
+    vektorel : vektorel_blok_uret() blokları doğrudan NDJSON'a çevrilir
+               (sipariş başına sözlük / json.dumps yok; tek çekirdekte
+               ≥ 50k sipariş/sn)
+    klasik   : her sipariş siparis_uret() ile (yalnızca stdlib, yavaş)
+
+Hedefler:
+    dosya yolu          : dosyaya yazar (adlandırılmış boru / FIFO da olur)
+    -                   : stdout (boru hattı)
+    tcp://host:port     : TCP soketine bağlanır
+    unix:///yol/soket   : Unix soketine bağlanır
+
+Kullanım:
+    python akis_simulator.py -n 1000000 --hedef siparisler.ndjson
+    python akis_simulator.py --hiz 20000 --hedef - | tuketici.py
+    python akis_simulator.py --hiz 5000 --sure 60 --hedef tcp://127.0.0.1:9000
+    python akis_simulator.py --gunluk 20000 --baslangic 2026-06-01 --hedef unix:///tmp/cafe.sock
+"""
+
+import itertools
+import json
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import generate_dataset as gd
+
+GUNLUK_SIPARIS = 5_000    # gün başına ortalama sipariş (Poisson ortalaması)
+HIZ_ARALIGI = 0.01        # hız sınırlı oynatmada yazma aralığı (sn)
+ILERLEME_ARALIGI = 5.0    # stderr ilerleme satırı aralığı (sn)
+
+
+# ─── 1. ZAMAN SIRALI ÜRETİM ───
+def _gunler(baslangic: datetime, gun_sayisi: int = None):
+    adim = itertools.count() if gun_sayisi is None else range(gun_sayisi)
+    for g in adim:
+        yield baslangic + timedelta(days=g)
+
+def _vektorel_bloklar(gunluk: float, baslangic: datetime, gun_sayisi: int,
+                      masa_sayisi: int, tohum: int):
+    """(blok, gun_tablosu) çiftleri; bloklar zaman sıralı, en fazla AKIS_BLOK_BOYUTU."""
+    import numpy as np
+    T = gd._tablolari_hazirla()
+    rng = np.random.default_rng(tohum)
+    no = 1
+    for tarih in _gunler(baslangic, gun_sayisi):
+        tablo = gd.takvim([tarih])
+        n = int(rng.poisson(gunluk))
+        saat_adet = rng.multinomial(n, T["saat_p"])
+        saat = np.repeat(T["saatler"], saat_adet)
+        dakika = np.concatenate([np.sort(rng.integers(0, 60, a)) for a in saat_adet])
+        for bas in range(0, n, gd.AKIS_BLOK_BOYUTU):
+            son = min(n, bas + gd.AKIS_BLOK_BOYUTU)
+            zaman = (np.zeros(son - bas, dtype=np.int64), saat[bas:son], dakika[bas:son])
+            yield gd.vektorel_blok_uret(rng, son - bas, masa_sayisi, id_baslangic=no,
+                                        zaman=zaman, gun_tablosu=tablo), tablo
+            no += son - bas
+
+def _poisson(rng, ortalama: float) -> int:
+    if ortalama < 30:  # Knuth
+        esik, k, p = math.exp(-ortalama), 0, rng.random()
+        while p > esik:
+            k += 1
+            p *= rng.random()
+        return k
+    return max(0, round(rng.gauss(ortalama, math.sqrt(ortalama))))
+
+def _klasik_bloklar(gunluk: float, baslangic: datetime, gun_sayisi: int,
+                    masa_sayisi: int, tohum: int):
+    """siparis_uret() sözlüklerinden listeler; gün içinde zaman sıralı."""
+    rng = random.Random(tohum)
+    saatler, agirliklar = list(gd.SAAT_DAGITIM), list(gd.SAAT_DAGITIM.values())
+    no = 1
+    for gun in _gunler(baslangic, gun_sayisi):
+        n = _poisson(rng, gunluk)
+        anlar = sorted((s, rng.randrange(60)) for s in rng.choices(saatler, agirliklar, k=n))
+        for bas in range(0, n, gd.AKIS_BLOK_BOYUTU):
+            blok = []
+            for saat, dakika in anlar[bas:bas + gd.AKIS_BLOK_BOYUTU]:
+                tarih = gun.replace(hour=saat, minute=dakika)
+                blok.append(gd.siparis_uret(no, tarih, rng.randint(1, masa_sayisi), rng))
+                no += 1
+            yield blok
+
+def siparis_akisi(n: int = None, motor: str = "vektorel", gunluk: float = GUNLUK_SIPARIS,
+                  baslangic: datetime = gd.BASLANGIC_TARIHI, gun_sayisi: int = None,
+                  masa_sayisi: int = 20, tohum: int = gd.TOHUM):
+    """Siparişleri (siparis_uret() sözlükleri) zaman sırasıyla üreten generator.
+
+    n ve gun_sayisi None ise akış sonsuzdur.
+    """
+    if motor not in gd.MOTORLAR:
+        raise ValueError(f"Bilinmeyen motor: {motor} (seçenekler: {', '.join(gd.MOTORLAR)})")
+    baslangic = baslangic.replace(hour=0, minute=0)
+    if motor == "vektorel":
+        akis = itertools.chain.from_iterable(
+            gd.blok_siparis_akisi(blok, tablo)
+            for blok, tablo in _vektorel_bloklar(gunluk, baslangic, gun_sayisi,
+                                                 masa_sayisi, tohum))
+    else:
+        akis = itertools.chain.from_iterable(
+            _klasik_bloklar(gunluk, baslangic, gun_sayisi, masa_sayisi, tohum))
+    return akis if n is None else itertools.islice(akis, n)
+
+
+# ─── 2. NDJSON ───
+# Satırlar json.dumps(sipariş - one_hot, ensure_ascii=False) ile birebir
+# aynıdır. Vektörel motorda sözlük kurulmaz: sepet matrisinin sıfır
+# olmayanları blok başına bir kez alınır, "adet ürün" ve id metinleri
+# önceden hazırlanmış tablolardan indekslenir.
+_icerik_tablosu = None
+
+def _icerik_metinleri(en_fazla: int):
+    """(adet × genislik + ürün) → '3 Lahmacun' (JSON kaçışlı) tablosu."""
+    global _icerik_tablosu
+    import numpy as np
+    T = gd._tablolari_hazirla()
+    if _icerik_tablosu is None or len(_icerik_tablosu) < (en_fazla + 1) * T["genislik"]:
+        adlar = [json.dumps(ad, ensure_ascii=False)[1:-1] for ad in T["urun_adlari"]]
+        _icerik_tablosu = np.array([f"{q} {ad}" for q in range(2 * en_fazla + 1)
+                                    for ad in adlar], dtype=object)
+    return _icerik_tablosu
+
+def _j(metinler) -> list:
+    return [json.dumps(m, ensure_ascii=False) for m in metinler]
+
+def ndjson_satirlari(blok: dict, gun_tablosu: dict) -> list:
+    """Vektörel bloğu NDJSON satırlarına (sonunda \\n olmadan) çevir."""
+    import numpy as np
+    T = gd._tablolari_hazirla()
+    adet = blok["adet"]
+    n = adet.shape[0]
+    satir, sutun = np.nonzero(adet)
+    miktar = adet[satir, sutun]
+    ogeler = _icerik_metinleri(int(miktar.max(initial=0)))[
+        miktar.astype(np.int64) * T["genislik"] + sutun].tolist()
+    idler = sutun.astype(str).tolist()
+    sinir = np.searchsorted(satir, np.arange(n + 1)).tolist()
+
+    tarih = gun_tablosu["gun_tarih"]
+    gun_adi = _j(gun_tablosu["gun_adi"])
+    ay = gun_tablosu["gun_ay"].tolist()
+    hs = gun_tablosu["gun_hs"].astype(int).tolist()
+    ozel, yas, hava = _j(T["ozel_adlari"]), _j(T["yas_adlari"]), _j(T["hava_adlari"])
+
+    sutunlar = zip(
+        blok["siparis_no"].tolist(), blok["masa"].tolist(), blok["gun"].tolist(),
+        blok["saat"].tolist(), blok["dakika"].tolist(), blok["yas"].tolist(),
+        blok["hava"].tolist(), blok["sicaklik"].tolist(), blok["kisi"].tolist(),
+        blok["ozel"].tolist(), blok["ikram"].tolist(), blok["iptal"].tolist(),
+        blok["toplam_urun"].tolist(), blok["toplam_tutar"].tolist(), sinir, sinir[1:],
+    )
+    return [
+        f'{{"siparis_id": "ORD-{no:05d}", "qr_masa_id": "QR-M{masa:02d}", '
+        f'"tarih_saat": "{tarih[g]} {s:02d}:{dk:02d}", "gun": {gun_adi[g]}, "saat": {s}, '
+        f'"ay": {ay[g]}, "hafta_sonu": {hs[g]}, "ozel_gun": {ozel[o]}, '
+        f'"yas_grubu": {yas[y]}, "kisi_sayisi": {kisi}, "hava_durumu": {hava[h]}, '
+        f'"sicaklik_c": {sic}, "siparis_icerigi": "{", ".join(ogeler[a:b])}", '
+        f'"toplam_tutar": {tutar!r}, "ikram_var": {ikram:d}, "iptal_var": {iptal:d}, '
+        f'"urun_sayisi": {urun}, "sepet_ids": [{", ".join(idler[a:b])}]}}'
+        for no, masa, g, s, dk, y, h, sic, kisi, o, ikram, iptal, urun, tutar, a, b in sutunlar
+    ]
+
+def ndjson_akisi(n: int = None, motor: str = "vektorel", gunluk: float = GUNLUK_SIPARIS,
+                 baslangic: datetime = gd.BASLANGIC_TARIHI, gun_sayisi: int = None,
+                 masa_sayisi: int = 20, tohum: int = gd.TOHUM):
+    """siparis_akisi() ile aynı siparişleri NDJSON satır listeleri (blok blok) olarak üret."""
+    if motor not in gd.MOTORLAR:
+        raise ValueError(f"Bilinmeyen motor: {motor} (seçenekler: {', '.join(gd.MOTORLAR)})")
+    baslangic = baslangic.replace(hour=0, minute=0)
+    if motor == "vektorel":
+        bloklar = (ndjson_satirlari(blok, tablo) for blok, tablo in
+                   _vektorel_bloklar(gunluk, baslangic, gun_sayisi, masa_sayisi, tohum))
+    else:
+        bloklar = ([json.dumps({k: v for k, v in s.items() if k != "one_hot"},
+                               ensure_ascii=False) for s in blok]
+                   for blok in _klasik_bloklar(gunluk, baslangic, gun_sayisi,
+                                               masa_sayisi, tohum))
+    kalan = n
+    for satirlar in bloklar:
+        if kalan is not None:
+            if kalan <= 0:
+                return
+            satirlar = satirlar[:kalan]
+            kalan -= len(satirlar)
+        if satirlar:
+            yield satirlar
+
+
+# ─── 3. HEDEFLER ───
+def hedef_ac(hedef: str):
+    """Hedef tanımından ikili yazılabilir dosya nesnesi aç."""
+    if hedef == "-":
+        return sys.stdout.buffer
+    if hedef.startswith(("tcp://", "unix://")):
+        import socket
+        if hedef.startswith("tcp://"):
+            host, _, port = hedef[len("tcp://"):].rpartition(":")
+            soket = socket.create_connection((host.strip("[]") or "127.0.0.1", int(port)))
+        else:
+            soket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            soket.connect(hedef[len("unix://"):])
+        cikis = soket.makefile("wb")
+        soket.close()  # makefile kendi referansını tutar; soket cikis kapanınca kapanır
+        return cikis
+    return open(hedef, "wb")
+
+
+# ─── 4. OYNATMA ───
+def oynat(bloklar, cikis, hiz: float = 0, sure: float = None, ilerleme=None) -> dict:
+    """NDJSON satır bloklarını cikis'a yaz.
+
+    hiz > 0 ise sipariş/sn hedefi: her HIZ_ARALIGI'lık dilim kadar satır
+    yazılıp bir sonraki dilimin zamanına kadar beklenir (geride kalınırsa
+    beklemeden yetişilir). hiz = 0 ise olabildiğince hızlı.
+    sure (sn) dolunca ya da karşı taraf bağlantıyı kapatınca durur.
+    ilerleme(istatistik) verilirse ILERLEME_ARALIGI'nda bir çağrılır.
+    """
+    dilim = max(1, int(hiz * HIZ_ARALIGI)) if hiz > 0 else None
+    baslangic = time.perf_counter()
+    son_ilerleme = baslangic
+    ist = {"siparis": 0, "bayt": 0, "en_fazla_gecikme_sn": 0.0, "kesildi": None}
+
+    def yaz(satirlar) -> bool:
+        veri = ("\n".join(satirlar) + "\n").encode("utf-8")
+        try:
+            cikis.write(veri)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            ist["kesildi"] = type(e).__name__
+            return False
+        ist["siparis"] += len(satirlar)
+        ist["bayt"] += len(veri)
+        return True
+
+    devam = True
+    for satirlar in bloklar:
+        parcalar = [satirlar] if dilim is None else \
+            [satirlar[i:i + dilim] for i in range(0, len(satirlar), dilim)]
+        for parca in parcalar:
+            simdi = time.perf_counter()
+            if sure is not None and simdi - baslangic >= sure:
+                devam = False
+                break
+            if hiz > 0:
+                fark = baslangic + ist["siparis"] / hiz - simdi
+                if fark > 0:
+                    time.sleep(fark)
+                else:
+                    ist["en_fazla_gecikme_sn"] = max(ist["en_fazla_gecikme_sn"], -fark)
+            if not yaz(parca):
+                devam = False
+                break
+            if ilerleme is not None and simdi - son_ilerleme >= ILERLEME_ARALIGI:
+                son_ilerleme = simdi
+                ilerleme({**ist, "sure_sn": simdi - baslangic})
+        if not devam:
+            break
+    try:
+        cikis.flush()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+
+    gecen = time.perf_counter() - baslangic
+    ist["en_fazla_gecikme_sn"] = round(ist["en_fazla_gecikme_sn"], 4)
+    ist["sure_sn"] = round(gecen, 3)
+    ist["siparis_sn"] = round(ist["siparis"] / gecen, 1) if gecen > 0 else None
+    return ist
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="CafeML sipariş akışı simülatörü")
+    parser.add_argument("-n", "--siparis", type=int, default=None,
+                        help="üretilecek sipariş sayısı (varsayılan: sınırsız)")
+    parser.add_argument("--hedef", default="-",
+                        help="dosya yolu, - (stdout), tcp://host:port ya da unix:///yol")
+    parser.add_argument("--hiz", type=float, default=0,
+                        help="hedef sipariş/sn (0 = olabildiğince hızlı)")
+    parser.add_argument("--sure", type=float, default=None, help="en fazla oynatma süresi (sn)")
+    parser.add_argument("--gunluk", type=float, default=GUNLUK_SIPARIS,
+                        help="gün başına ortalama sipariş")
+    parser.add_argument("--baslangic", default=gd.BASLANGIC_TARIHI.strftime("%Y-%m-%d"),
+                        help="akışın ilk günü (YYYY-AA-GG)")
+    parser.add_argument("--gun", type=int, default=None, help="akışın gün sayısı")
+    parser.add_argument("--masa", type=int, default=20, help="masa sayısı")
+    parser.add_argument("--motor", choices=gd.MOTORLAR, default="vektorel",
+                        help="vektorel: hızlı NumPy blokları, klasik: siparis_uret()")
+    parser.add_argument("--tohum", type=int, default=gd.TOHUM, help="rastgelelik tohumu")
+    args = parser.parse_args()
+
+    def ilerleme(ist):
+        print(f"   {ist['siparis']:,} sipariş, {ist['sure_sn']:.0f} sn "
+              f"({ist['siparis'] / ist['sure_sn']:,.0f}/sn)", file=sys.stderr)
+
+    bloklar = ndjson_akisi(args.siparis, args.motor, args.gunluk,
+                           datetime.strptime(args.baslangic, "%Y-%m-%d"), args.gun,
+                           args.masa, args.tohum)
+    try:
+        cikis = hedef_ac(args.hedef)
+    except OSError as e:
+        sys.exit(f"❌ Hedef açılamadı: {args.hedef} ({e})")
+    hiz_metni = f"{args.hiz:g}/sn" if args.hiz else "sınırsız"
+    print(f"▶ Akış → {args.hedef} (hız: {hiz_metni})", file=sys.stderr)
+    try:
+        ist = oynat(bloklar, cikis, args.hiz, args.sure, ilerleme)
+    except KeyboardInterrupt:
+        ist = None
+    finally:
+        if cikis is not sys.stdout.buffer:
+            cikis.close()
+    if ist is not None:
+        print(f"✓ {ist['siparis']:,} sipariş, {ist['bayt'] / (1 << 20):,.1f} MB, "
+              f"{ist['sure_sn']} sn ({ist['siparis_sn']:,.0f}/sn)"
+              + (f" – bağlantı kapandı ({ist['kesildi']})" if ist["kesildi"] else ""),
+              file=sys.stderr)
@@ -2,22 +2,58 @@
 CafeML – Apriori Birliktelik Kuralları Eğitim Scripti
 ======================================================
 Girdi : market_basket.csv  (generate_dataset.py çıktısı)
-Çıktı : association_rules.csv  +  konsol raporu
+        ya da apriori_transactions.csv, orders.arrow / orders.parquet
+Çıktı : association_rules.csv  +  association_rules.bin (ikili, mmap)  +  konsol raporu
+        + egitim_raporu.json (aşama süreleri, tepe bellek, küme/aday sayıları)
 
 Kullanım:
     python apriori_train.py
+    python apriori_train.py --girdi orders.arrow     # kolonsal girdi (pyarrow)
+    python apriori_train.py --girdi apriori_transactions.csv --seyrek
+    python apriori_train.py --madenci eclat          # bit tid-listeli Eclat
+    python apriori_train.py --madenci paralel --isci 16
+    python apriori_train.py --destek 0.01 --guven 0.5 --lift 1.5
+    python apriori_train.py --tarama --destek 0.05 0.02 0.01 --guven 0.4 0.55 --lift 1.2 2
+                                                     # tek madencilik, ızgara karşılaştırması
+    python apriori_train.py --lift 2.0               # sık kümeler önbellekten, madencilik atlanır
+    python apriori_train.py --segment                # gün dilimi / hafta içi-sonu / hava
+                                                     # segmentleri → segment_kurallari.csv
+    python apriori_train.py --orneklem 0.05          # %5 örneklem, güven aralıklı yaklaşık kurallar
+    python apriori_train.py --orneklem 200000 --dogrula   # adayları tam veride kesinleştir
+    python apriori_train.py --buda --kume kapali     # baskın kuralları at, kapalı kümelerle sınırla
+    python apriori_train.py --kategori 0.1 --destek 0.002
+                                                     # çok seviyeli: kategori kuralları
+                                                     # (kategori_kurallari.csv) + yalnız sık kategori
+                                                     # örüntüleri içinde düşük destekli ürün kuralları
+    python apriori_train.py --artimsal durum/ --girdi yeni_siparisler.arrow
+                                                     # ilk çalıştırmada durumu kurar,
+                                                     # sonrakilerde yalnız yeni partiyi işler
+    python apriori_train.py --profil --bellek-izi    # cProfile (egitim_raporu.prof) + tracemalloc
+    python apriori_train.py --cikti-klasor kiraci_a/ # tüm çıktılar başka klasöre
 
-Ayarlar:
+Python'dan (uzun ömürlü işçi; pandas/mlxtend ilk eğitimde bir kez yüklenir):
+    from apriori_train import egit
+    sonuc = egit("orders.arrow", madenci="eclat", min_support=0.01, cikti_klasor="kiraci_a")
+    sonuc["rules"], sonuc["dosyalar"]
+
+    # ya da adım adım
+    sepet = veri_oku("orders.arrow", madenci="eclat")
+    fi = sik_kumeleri_bul(sepet, 0.01, madenci="eclat")
+    rules = kurallari_turet(fi, 0.4, 1.2)
+    disa_aktar(rules, "kiraci_a")
+
+Ayarlar (varsayılanlar; --destek/--guven/--lift ile değiştirilebilir):
     MIN_SUPPORT    = 0.05   (en az 100 siparişte görülen)
     MIN_CONFIDENCE = 0.40
     MIN_LIFT       = 1.2
 """
 
-import pandas as pd
-from mlxtend.frequent_patterns import apriori, association_rules
-from mlxtend.preprocessing import TransactionEncoder
-import csv
+import argparse
+import json
 import os
+from collections import namedtuple
+
+from olcum import Olcer
 
 # ─────────────────────────────────────────────
 # AYARLAR
@@ -25,103 +61,615 @@ import os
 MIN_SUPPORT    = 0.05
 MIN_CONFIDENCE = 0.40
 MIN_LIFT       = 1.2
+ONERI_GUVEN    = 0.55   # menu_oneriler.json'a girecek en düşük güven
 CIKTI_CSV      = "association_rules.csv"
+CIKTI_IKILI    = "association_rules.bin"
+CIKTI_ONERI    = "menu_oneriler.json"
+CIKTI_TARAMA   = "esik_taramasi.csv"
+CIKTI_SEGMENT  = "segment_kurallari.csv"
+CIKTI_KATEGORI = "kategori_kurallari.csv"
+CIKTI_RAPOR    = "egitim_raporu.json"
+MADENCILER     = ("mlxtend", "seyrek", "eclat", "paralel")
+ONBELLEK       = ".cafeml_onbellek"
+# sık küme yokken üretilen boş kural tablosunun sütunları (association_rules ile aynı)
+KURAL_SUTUNLARI = ("antecedents", "consequents", "antecedent support", "consequent support",
+                   "support", "confidence", "lift", "representativity", "leverage",
+                   "conviction", "zhangs_metric", "jaccard", "certainty", "kulczynski")
+
+# X: CSR sepet matrisi (yerleşik madenciler), df: yoğun DataFrame (mlxtend);
+# n_toplam: örneklemde tüm veri sipariş sayısı
+Sepet = namedtuple("Sepet", ["X", "urun_adlari", "df", "n_toplam"])
+
+
+def _yol(klasor: str, ad: str) -> str:
+    return os.path.normpath(os.path.join(klasor, ad)) if klasor else ad
+
+
+def madenci_etiketi(madenci: str = "mlxtend", artimsal_klasor: str = None,
+                    orneklem: float = None, kategori_destek: float = None) -> str:
+    """Raporlarda ve önbellek anahtarında kullanılan madenci adı."""
+    return ("örneklem" if orneklem else "artımsal" if artimsal_klasor
+            else "kategori" if kategori_destek else madenci)
+
+
+def kume_sayilari(frequent_itemsets) -> dict:
+    uzunluk = frequent_itemsets["itemsets"].map(len).value_counts().sort_index()
+    return {"toplam": len(frequent_itemsets),
+            "uzunluga_gore": {str(k): int(v) for k, v in uzunluk.items()}}
+
+
+def _rapor_yaz(olcer: Olcer, cikti_klasor: str, **ek) -> dict:
+    """Aşama ölçümlerini CIKTI_RAPOR'a yaz ve özetini bas."""
+    olcer.bitir()
+    olcer.ozet_yazdir()
+    yol = _yol(cikti_klasor, CIKTI_RAPOR)
+    rapor = olcer.rapor_yaz(yol, **ek)
+    print(f"✓ {yol} kaydedildi")
+    return rapor
+
 
 # ─────────────────────────────────────────────
 # 1. VERİ OKU
 # ─────────────────────────────────────────────
-print("📥 market_basket.csv okunuyor…")
-if not os.path.exists("market_basket.csv"):
-    print("❌ market_basket.csv bulunamadı! Önce generate_dataset.py çalıştırın.")
-    exit(1)
+def veri_oku(girdi: str, madenci: str = "mlxtend", orneklem: float = None) -> Sepet:
+    """Sepet dosyasını madenciye uygun biçimde oku.
+
+    madenci="mlxtend" → yoğun boolean DataFrame; diğerleri → CSR matrisi
+    (bellek satılan kalem sayısıyla orantılı). orneklem verilirse yalnız
+    örneklem okunur (orneklem.orneklem_oku).
+    """
+    if not os.path.exists(girdi):
+        raise FileNotFoundError(girdi)
+    if orneklem:
+        from orneklem import orneklem_oku
+        X, urun_adlari, n_toplam = orneklem_oku(girdi, orneklem)
+        print(f"   örneklem: {X.shape[0]} / {n_toplam} sipariş, {X.shape[1]} farklı ürün")
+        return Sepet(X, urun_adlari, None, n_toplam)
+    if madenci != "mlxtend":
+        from sepet_okuyucu import seyrek_sepet_oku
+        X, urun_adlari = seyrek_sepet_oku(girdi)
+        print(f"   {X.shape[0]} sipariş, {X.shape[1]} farklı ürün, {X.nnz} sepet kalemi (seyrek)")
+        return Sepet(X, urun_adlari, None, X.shape[0])
+    from sepet_okuyucu import sepet_oku
+    df = sepet_oku(girdi)
+    print(f"   {len(df)} sipariş, {len(df.columns)} farklı ürün")
+    return Sepet(None, list(df.columns), df, len(df))
+
+
+def seyrek_hale_getir(sepet: Sepet) -> Sepet:
+    """mlxtend için okunmuş yoğun sepetin CSR karşılığı (tarama kapsamı için)."""
+    if sepet.X is not None:
+        return sepet
+    from scipy.sparse import csr_matrix
+    return sepet._replace(X=csr_matrix(sepet.df.to_numpy(dtype=bool)))
 
-# one-hot formatında oku (siparis_id sütununu atla)
-df = pd.read_csv("market_basket.csv", index_col=0)
-# Boolean'a çevir
-df = df.astype(bool)
-print(f"   {len(df)} sipariş, {len(df.columns)} farklı ürün")
 
 # ─────────────────────────────────────────────
 # 2. APRIORI – SIKÇA GÖRÜLEN ÜRÜN KÜMELERİ
 # ─────────────────────────────────────────────
-print(f"\n⚙️  Apriori çalıştırılıyor (min_support={MIN_SUPPORT})…")
-frequent_itemsets = apriori(
-    df,
-    min_support=MIN_SUPPORT,
-    use_colnames=True,
-    verbose=0
-)
-frequent_itemsets["length"] = frequent_itemsets["itemsets"].apply(len)
-print(f"   {len(frequent_itemsets)} sık geçen itemset bulundu")
+def sik_kumeleri_bul(sepet: Sepet, min_support: float, madenci: str = "mlxtend",
+                     isci: int = None, sayac: dict = None):
+    """mlxtend biçimli (support, itemsets) sık küme tablosu.
+
+    sayac verilirse yerleşik madenciler uzunluk başına aday sayısını ekler.
+    """
+    if madenci == "mlxtend":
+        from mlxtend.frequent_patterns import apriori
+        return apriori(sepet.df, min_support=min_support, use_colnames=True, verbose=0)
+    from madencilik import eclat, paralel_apriori, seyrek_apriori
+    if madenci == "seyrek":
+        return seyrek_apriori(sepet.X, sepet.urun_adlari, min_support, sayac=sayac)
+    if madenci == "eclat":
+        return eclat(sepet.X, sepet.urun_adlari, min_support, sayac=sayac)
+    if madenci == "paralel":
+        return paralel_apriori(sepet.X, sepet.urun_adlari, min_support, isci_sayisi=isci,
+                               sayac=sayac)
+    raise ValueError(f"Bilinmeyen madenci: {madenci} (seçenekler: {', '.join(MADENCILER)})")
+
+
+def orneklem_sik_kumeleri(sepet: Sepet, girdi: str, min_support: float, dogrula: bool = False):
+    """Örneklemde düşürülmüş eşikle madenle; dogrula=True ise tam veride kesinleştir.
+
+    Dönüş: (sık kümeler, kuralların sayıldığı sepet – doğrulamada tam veri)
+    """
+    from madencilik import eclat
+    from orneklem import dogrula as tam_veride_dogrula, dusurulmus_esik
+    esik = dusurulmus_esik(min_support, sepet.X.shape[0])
+    adaylar = eclat(sepet.X, sepet.urun_adlari, esik)
+    print(f"   örneklemde eşik {esik:.4f} ile {len(adaylar)} aday küme")
+    if not dogrula:
+        return adaylar[adaylar["support"] >= min_support].reset_index(drop=True), sepet
+    from sepet_okuyucu import seyrek_sepet_oku
+    X, urun_adlari = seyrek_sepet_oku(girdi)
+    frequent_itemsets, kacan = tam_veride_dogrula(X, urun_adlari, adaylar, min_support)
+    print(f"   doğrulama: adaylar {X.shape[0]} siparişte yeniden sayıldı, destekler kesin")
+    if kacan:
+        print(f"   örneklemin kaçırdığı {kacan} sık küme negatif sınır taramasıyla eklendi")
+    return frequent_itemsets, Sepet(X, urun_adlari, None, X.shape[0])
+
+
+def artimsal_sik_kumeler(sepet: Sepet, klasor: str, min_support: float):
+    """klasor'deki sayım durumunu sepet partisiyle güncelle (yoksa oluştur)."""
+    import artimsal
+    if artimsal.durum_var_mi(klasor):
+        durum, ozet = artimsal.durum_guncelle(klasor, sepet.X, sepet.urun_adlari, min_support)
+        if ozet["tekrar"]:
+            print("   artımsal: bu parti durumda zaten kayıtlı, yeniden sayılmadı")
+        print(f"   artımsal: +{ozet['yeni_siparis']} sipariş, {ozet['yeni_urun']} yeni ürün, "
+              f"{ozet['terfi']} küme eşiği geçti, {ozet['taranan']} aday geçmişte yeniden sayıldı")
+    else:
+        durum = artimsal.durum_olustur(klasor, sepet.X, sepet.urun_adlari, min_support)
+        print(f"   artımsal: durum {klasor} içinde oluşturuldu")
+    print(f"   toplam {durum['n']} sipariş, {len(durum['sayimlar'])} izlenen küme")
+    return artimsal.sik_kume_tablosu(durum)
+
+
+def _oku_ve_madenle(girdi: str, min_support: float, madenci: str, isci: int,
+                    artimsal_klasor: str, orneklem: float, dogrula: bool,
+                    onbellek_klasor: str, onbellek_mb: float, olcer: Olcer,
+                    sayac: dict, sepet_gerekli: bool = False, kategori_destek: float = None):
+    """Önbellek → okuma → madencilik; (sık kümeler, sepet ya da None, kategori sık kümeleri ya da None)."""
+    etiket = madenci_etiketi(madenci, artimsal_klasor, orneklem, kategori_destek)
+    print(f"📥 {girdi} okunuyor…")
+    if not os.path.exists(girdi):
+        raise FileNotFoundError(girdi)
+
+    # Önbellek: aynı içerik + aynı parametrelerle madencilik atlanır
+    onbellek, anahtar, frequent_itemsets, kategori_kumeleri = None, None, None, None
+    if onbellek_klasor and not (artimsal_klasor or orneklem or kategori_destek):
+        from onbellek import Onbellek
+        olcer.baslat("onbellek")
+        onbellek = Onbellek(onbellek_klasor, onbellek_mb)
+        anahtar = onbellek.anahtar(girdi, min_support=min_support, madenci=etiket)
+        frequent_itemsets = onbellek.getir(anahtar)
+
+    olcer.baslat("oku")
+    sepet = None
+    if frequent_itemsets is not None and not sepet_gerekli:
+        print(f"   sık kümeler önbellekte ({anahtar[:12]}…), sepet matrisi kurulmadı")
+    else:
+        sepet = veri_oku(girdi, etiket, orneklem)  # artımsal da seyrek okur
+
+    olcer.baslat("madencilik")
+    if frequent_itemsets is not None:
+        print(f"\n⚡ Sık kümeler önbellekten yüklendi (min_support={min_support}, madenci={etiket})")
+    else:
+        print(f"\n⚙️  Apriori çalıştırılıyor (min_support={min_support}, madenci={etiket})…")
+        if orneklem:
+            frequent_itemsets, sepet = orneklem_sik_kumeleri(sepet, girdi, min_support, dogrula)
+        elif artimsal_klasor:
+            frequent_itemsets = artimsal_sik_kumeler(sepet, artimsal_klasor, min_support)
+        elif kategori_destek:
+            from hiyerarsi import cok_seviyeli_madencilik
+            kategori_kumeleri, frequent_itemsets = cok_seviyeli_madencilik(
+                sepet.X, sepet.urun_adlari, kategori_destek, min_support, sayac=sayac)
+            print(f"   kategori düzeyinde (min_support={kategori_destek}) "
+                  f"{len(kategori_kumeleri)} sık küme; ürünler yalnız bunların içinde arandı")
+        else:
+            frequent_itemsets = sik_kumeleri_bul(sepet, min_support, madenci, isci, sayac)
+        if onbellek:
+            olcer.baslat("onbellek_yaz")
+            onbellek.koy(anahtar, frequent_itemsets)
+    frequent_itemsets["length"] = frequent_itemsets["itemsets"].apply(len)
+    print(f"   {len(frequent_itemsets)} sık geçen itemset bulundu")
+    return frequent_itemsets, sepet, kategori_kumeleri
+
 
 # ─────────────────────────────────────────────
 # 3. BİRLİKTELİK KURALLARI
 # ─────────────────────────────────────────────
-print(f"\n⚙️  Birliktelik kuralları hesaplanıyor (conf≥{MIN_CONFIDENCE}, lift≥{MIN_LIFT})…")
-rules = association_rules(
-    frequent_itemsets,
-    metric="confidence",
-    min_threshold=MIN_CONFIDENCE
-)
-rules = rules[rules["lift"] >= MIN_LIFT].copy()
-rules = rules.sort_values("lift", ascending=False).reset_index(drop=True)
+def kume_metinleri(kumeler):
+    """Ürün kümelerini "A, B" metnine çevir; her farklı küme bir kez birleştirilir.
+
+    Kurallarda aynı öncül/sonuç çok kez tekrarlar; kümeler pd.factorize ile
+    numaralanır, metin yalnız tekil kümeler için kurulup numaralarla yayılır.
+    """
+    import numpy as np
+    import pandas as pd
+    kodlar, tekiller = pd.factorize(kumeler)
+    metinler = np.array([", ".join(sorted(k)) for k in tekiller] + [""], dtype=object)
+    return metinler[kodlar]
+
+
+def kurallari_turet(frequent_itemsets, min_confidence: float = MIN_CONFIDENCE,
+                    min_lift: float = MIN_LIFT, buda: bool = False, kume: str = "tum",
+                    orneklem_boyutu: int = None):
+    """Sık kümelerden lift'e göre azalan sıralı kural tablosu.
 
-# Okunabilir format
-rules["antecedents_str"] = rules["antecedents"].apply(lambda x: ", ".join(sorted(x)))
-rules["consequents_str"] = rules["consequents"].apply(lambda x: ", ".join(sorted(x)))
+    kume="kapali"/"maksimal" kuralları o kümelerden türeyenlerle sınırlar,
+    buda=True baskın kuralları atar. orneklem_boyutu verilirse (yaklaşık mod)
+    *_alt / *_ust güven aralığı sütunları eklenir. antecedents_str /
+    consequents_str okunabilir sütunları eklenir. Sık küme yoksa boş tablo döner.
+    """
+    from mlxtend.frequent_patterns import association_rules
+    print(f"\n⚙️  Birliktelik kuralları hesaplanıyor (conf≥{min_confidence}, lift≥{min_lift})…")
+    if frequent_itemsets.empty:
+        import pandas as pd
+        print("   sık küme yok, kural üretilemedi – --destek değerini düşürün")
+        rules = pd.DataFrame(columns=KURAL_SUTUNLARI)
+    else:
+        rules = association_rules(
+            frequent_itemsets,
+            metric="confidence",
+            min_threshold=min_confidence
+        )
+        rules = rules[rules["lift"] >= min_lift].copy()
+    if kume != "tum" or buda:
+        from budama import baskin_kurallari_buda, kapali_kumeler, maksimal_kumeler, kume_filtresi
+        onceki = len(rules)
+        if kume == "kapali":
+            rules = kume_filtresi(rules, kapali_kumeler(frequent_itemsets))
+        elif kume == "maksimal":
+            rules = kume_filtresi(rules, maksimal_kumeler(frequent_itemsets))
+        if buda:
+            rules = baskin_kurallari_buda(rules)
+        print(f"   budama: {onceki} → {len(rules)} kural (kume={kume}, baskın={'at' if buda else 'tut'})")
+    rules = rules.sort_values("lift", ascending=False).reset_index(drop=True)
+    if orneklem_boyutu:
+        from orneklem import guven_araliklari
+        rules = guven_araliklari(rules, orneklem_boyutu)
+
+    # Okunabilir format
+    rules["antecedents_str"] = kume_metinleri(rules["antecedents"])
+    rules["consequents_str"] = kume_metinleri(rules["consequents"])
+
+    print(f"   {len(rules)} kural üretildi")
+    return rules
 
-print(f"   {len(rules)} kural üretildi")
 
 # ─────────────────────────────────────────────
 # 4. KONSOL RAPORU – EN İYİ 20 KURAL
 # ─────────────────────────────────────────────
-print("\n" + "─" * 80)
-print(f"{'Kural (X → Y)':<55} {'Sup':>6} {'Conf':>6} {'Lift':>6}")
-print("─" * 80)
-for _, row in rules.head(20).iterrows():
-    kural = f"{{{row['antecedents_str']}}} → {{{row['consequents_str']}}}"
-    print(f"{kural:<55} {row['support']:>6.3f} {row['confidence']:>6.3f} {row['lift']:>6.3f}")
-print("─" * 80)
+def konsol_raporu(rules, adet: int = 20):
+    print("\n" + "─" * 80)
+    print(f"{'Kural (X → Y)':<55} {'Sup':>6} {'Conf':>6} {'Lift':>6}")
+    print("─" * 80)
+    for _, row in rules.head(adet).iterrows():
+        kural = f"{{{row['antecedents_str']}}} → {{{row['consequents_str']}}}"
+        print(f"{kural:<55} {row['support']:>6.3f} {row['confidence']:>6.3f} {row['lift']:>6.3f}")
+    print("─" * 80)
+
 
 # ─────────────────────────────────────────────
 # 5. CSV ÇIKTISI
 # ─────────────────────────────────────────────
-cikti_df = rules[["antecedents_str","consequents_str","support","confidence","lift","leverage","conviction"]]
-cikti_df.columns = ["antecedent","consequent","support","confidence","lift","leverage","conviction"]
-cikti_df = cikti_df.round(4)
-cikti_df.to_csv(CIKTI_CSV, index=False, encoding="utf-8")
-print(f"\n✓ {CIKTI_CSV} kaydedildi ({len(rules)} kural)")
+def csv_yaz(rules, yol: str, aralikli: bool = False):
+    cikti_df = rules[["antecedents_str","consequents_str","support","confidence","lift","leverage","conviction"]]
+    cikti_df.columns = ["antecedent","consequent","support","confidence","lift","leverage","conviction"]
+    if aralikli:
+        # yaklaşık modda %95 güven aralıkları
+        aralik_sutunlari = [f"{m}_{u}" for m in ("support", "confidence", "lift") for u in ("alt", "ust")]
+        cikti_df = cikti_df.join(rules[aralik_sutunlari])
+    cikti_df = cikti_df.round(4)
+    cikti_df.to_csv(yol, index=False, encoding="utf-8")
+
 
 # ─────────────────────────────────────────────
 # 6. MENÜ ÖNERİ JSON'U (API için)
 # ─────────────────────────────────────────────
-import json
+ONERI_SABLONU = (
+    '  {{\n'
+    '    "tetikleyici": "{0}",\n'
+    '    "oneri": "{1}",\n'
+    '    "confidence": {2!r},\n'
+    '    "lift": {3!r},\n'
+    '    "support": {4!r},\n'
+    '    "oneri_metni": "\'{0}\' ile birlikte \'{1}\' de ekleyin? (%{5} müşteri tercih etti)"\n'
+    '  }}'
+)
+JSON_PARTI = 10_000   # diske bir seferde yazılan öneri sayısı
+
+
+def _json_kacis(metinler) -> list:
+    """json.dumps(…, ensure_ascii=False) ile aynı kaçışlı metinler (tırnaksız); tekil başına bir kez."""
+    onbellek = {}
+    return [onbellek.get(m) or onbellek.setdefault(m, json.dumps(m, ensure_ascii=False)[1:-1])
+            for m in metinler]
+
 
-oneriler = []
-for _, row in rules[rules["confidence"] >= 0.55].iterrows():
-    oneriler.append({
-        "tetikleyici":  row["antecedents_str"],
-        "oneri":        row["consequents_str"],
-        "confidence":   round(float(row["confidence"]), 3),
-        "lift":         round(float(row["lift"]), 3),
-        "support":      round(float(row["support"]), 3),
-        "oneri_metni":  f"'{row['antecedents_str']}' ile birlikte "
-                        f"'{row['consequents_str']}' de ekleyin? "
-                        f"(%{int(row['confidence']*100)} müşteri tercih etti)"
-    })
+def oneri_json_yaz(rules, yol: str) -> int:
+    """confidence ≥ ONERI_GUVEN kuralları menü önerisi olarak yaz; öneri sayısını döndür.
+
+    Çıktı json.dump(liste, ensure_ascii=False, indent=2) ile bayt bayt aynıdır;
+    satır başına sözlük kurulmaz, sütunlar toplu hazırlanıp parti parti yazılır.
+    """
+    secim = rules["confidence"].to_numpy() >= ONERI_GUVEN
+    guven = rules["confidence"].to_numpy()[secim]
+    tetikleyici = _json_kacis(rules["antecedents_str"].to_numpy()[secim])
+    oneri = _json_kacis(rules["consequents_str"].to_numpy()[secim])
+    # round(float, 3) → json'un yazdığı float repr'i; yüzde int() gibi sıfıra doğru kesilir
+    kolonlar = zip(tetikleyici, oneri,
+                   [round(v, 3) for v in guven.tolist()],
+                   [round(v, 3) for v in rules["lift"].to_numpy()[secim].tolist()],
+                   [round(v, 3) for v in rules["support"].to_numpy()[secim].tolist()],
+                   (guven * 100).astype(int).tolist())
+    adet = len(guven)
+    with open(yol, "w", encoding="utf-8") as f:
+        if not adet:
+            f.write("[]")
+            return 0
+        f.write("[\n")
+        for bas in range(0, adet, JSON_PARTI):
+            parti = [ONERI_SABLONU.format(*k) for _, k in zip(range(JSON_PARTI), kolonlar)]
+            f.write(("" if bas == 0 else ",\n") + ",\n".join(parti))
+        f.write("\n]")
+    return adet
+
+
+def disa_aktar(rules, cikti_klasor: str = ".", aralikli: bool = False,
+               olcer: Olcer = None) -> dict:
+    """CSV, ikili kural dosyası ve öneri JSON'unu yaz; {çıktı: yol} (+ oneri_sayisi)."""
+    from kural_dosyasi import kural_dosyasi_yaz
+    olcer = olcer or Olcer()
+    if cikti_klasor:
+        os.makedirs(cikti_klasor, exist_ok=True)
+    dosyalar = {"csv": _yol(cikti_klasor, CIKTI_CSV), "ikili": _yol(cikti_klasor, CIKTI_IKILI),
+                "oneri": _yol(cikti_klasor, CIKTI_ONERI)}
+
+    olcer.baslat("disa_aktar_csv")
+    csv_yaz(rules, dosyalar["csv"], aralikli)
+    print(f"\n✓ {dosyalar['csv']} kaydedildi ({len(rules)} kural)")
+    olcer.baslat("disa_aktar_ikili")
+    kural_dosyasi_yaz(rules, dosyalar["ikili"])
+    print(f"✓ {dosyalar['ikili']} kaydedildi (kural_dosyasi.KuralDosyasi ile mmap açılır)")
+    olcer.baslat("disa_aktar_json")
+    oneri_sayisi = oneri_json_yaz(rules, dosyalar["oneri"])
+    print(f"✓ {dosyalar['oneri']} kaydedildi ({oneri_sayisi} yüksek güvenli kural)")
+    olcer.bitir()
+    return {**dosyalar, "oneri_sayisi": oneri_sayisi}
 
-with open("menu_oneriler.json", "w", encoding="utf-8") as f:
-    json.dump(oneriler, f, ensure_ascii=False, indent=2)
-print(f"✓ menu_oneriler.json kaydedildi ({len(oneriler)} yüksek güvenli kural)")
 
 # ─────────────────────────────────────────────
 # 7. ÖZET İSTATİSTİK
 # ─────────────────────────────────────────────
-print("\n── Özet ──────────────────────────────────────")
-print(f"Yüksek lift (≥2.0) kural sayısı : {len(rules[rules['lift']>=2.0])}")
-print(f"Yüksek conf (≥0.7) kural sayısı : {len(rules[rules['confidence']>=0.7])}")
-en_iyi = rules.iloc[0]
-print(f"\n🏆 En iyi kural:")
-print(f"   {{{en_iyi['antecedents_str']}}} → {{{en_iyi['consequents_str']}}}")
-print(f"   Support={en_iyi['support']:.3f}  Confidence={en_iyi['confidence']:.3f}  Lift={en_iyi['lift']:.3f}")
-print("\n✅ Apriori eğitimi tamamlandı!")
+def ozet_yazdir(rules):
+    print("\n── Özet ──────────────────────────────────────")
+    print(f"Yüksek lift (≥2.0) kural sayısı : {len(rules[rules['lift']>=2.0])}")
+    print(f"Yüksek conf (≥0.7) kural sayısı : {len(rules[rules['confidence']>=0.7])}")
+    if rules.empty:
+        return
+    en_iyi = rules.iloc[0]
+    print(f"\n🏆 En iyi kural:")
+    print(f"   {{{en_iyi['antecedents_str']}}} → {{{en_iyi['consequents_str']}}}")
+    print(f"   Support={en_iyi['support']:.3f}  Confidence={en_iyi['confidence']:.3f}  Lift={en_iyi['lift']:.3f}")
+
+
+# ─────────────────────────────────────────────
+# 8. UÇTAN UCA EĞİTİM
+# ─────────────────────────────────────────────
+def egit(girdi: str, min_support: float = MIN_SUPPORT, min_confidence: float = MIN_CONFIDENCE,
+         min_lift: float = MIN_LIFT, madenci: str = "mlxtend", isci: int = None,
+         artimsal_klasor: str = None, orneklem: float = None, dogrula: bool = False,
+         buda: bool = False, kume: str = "tum", onbellek_klasor: str = None,
+         onbellek_mb: float = 512, cikti_klasor: str = ".", olcer: Olcer = None,
+         parametreler: dict = None, kategori_destek: float = None) -> dict:
+    """Oku → madenle → kural türet → dışa aktar; çıktılar cikti_klasor'e yazılır.
+
+    Önbellek isteğe bağlıdır: onbellek_klasor verilmedikçe kullanılmaz. kategori_destek verilirse çok
+    seviyeli madencilik (hiyerarsi.py): kategori kuralları CIKTI_KATEGORI'ye,
+    ürün kümeleri yalnız sık kategori örüntüleri içinde aranır (madenci
+    yok sayılır). Dönüş: {"rules", "frequent_itemsets", "dosyalar", "rapor"}
+    (+ "kategori_rules"). Girdi yoksa FileNotFoundError.
+    """
+    olcer = olcer or Olcer()
+    aday_sayaci = {}   # küme uzunluğu → desteği sayılan aday (yerleşik madenciler)
+    frequent_itemsets, sepet, kategori_kumeleri = _oku_ve_madenle(
+        girdi, min_support, madenci, isci, artimsal_klasor, orneklem, dogrula,
+        onbellek_klasor, onbellek_mb, olcer, aday_sayaci, kategori_destek=kategori_destek)
+
+    olcer.baslat("kurallar")
+    aralikli = bool(orneklem) and not dogrula
+    rules = kurallari_turet(frequent_itemsets, min_confidence, min_lift, buda, kume,
+                            orneklem_boyutu=sepet.X.shape[0] if aralikli else None)
+    olcer.baslat("konsol")
+    konsol_raporu(rules)
+    dosyalar = disa_aktar(rules, cikti_klasor, aralikli, olcer)
+    kategori_ek, kategori_rules = {}, None
+    if kategori_kumeleri is not None:
+        olcer.baslat("kategori_kurallari")
+        kategori_rules = kurallari_turet(kategori_kumeleri, min_confidence, min_lift, buda)
+        konsol_raporu(kategori_rules, 10)
+        dosyalar["kategori"] = _yol(cikti_klasor, CIKTI_KATEGORI)
+        csv_yaz(kategori_rules, dosyalar["kategori"])
+        print(f"✓ {dosyalar['kategori']} kaydedildi ({len(kategori_rules)} kategori kuralı)")
+        kategori_ek = {"kategori_sik_kume": kume_sayilari(kategori_kumeleri),
+                       "kategori_kural_sayisi": len(kategori_rules)}
+    ozet_yazdir(rules)
+    rapor = _rapor_yaz(
+        olcer, cikti_klasor,
+        parametreler=parametreler or {"girdi": girdi, "min_support": min_support,
+                                      "min_confidence": min_confidence, "min_lift": min_lift,
+                                      "kategori_destek": kategori_destek},
+        madenci=madenci_etiketi(madenci, artimsal_klasor, orneklem, kategori_destek),
+        sik_kume=kume_sayilari(frequent_itemsets),
+        aday={str(k): v for k, v in sorted(aday_sayaci.items())},
+        kural_sayisi=len(rules), oneri_sayisi=dosyalar["oneri_sayisi"], **kategori_ek)
+    sonuc = {"rules": rules, "frequent_itemsets": frequent_itemsets, "dosyalar": dosyalar,
+             "rapor": rapor}
+    if kategori_rules is not None:
+        sonuc["kategori_rules"] = kategori_rules
+    return sonuc
+
+
+def tarama_egit(girdi: str, destekler, guvenler, liftler, madenci: str = "mlxtend",
+                isci: int = None, onbellek_klasor: str = None, onbellek_mb: float = 512,
+                cikti_klasor: str = ".", olcer: Olcer = None, parametreler: dict = None):
+    """En düşük destekte bir kez madenle, ızgarayı CIKTI_TARAMA'ya yaz; tabloyu döndür."""
+    from tarama import esik_taramasi, tablo_yazdir
+    olcer = olcer or Olcer()
+    aday_sayaci = {}
+    frequent_itemsets, sepet, _ = _oku_ve_madenle(
+        girdi, min(destekler), madenci, isci, None, None, False,
+        onbellek_klasor, onbellek_mb, olcer, aday_sayaci, sepet_gerekli=True)
+
+    olcer.baslat("tarama")
+    sepet = seyrek_hale_getir(sepet)
+    noktalar = len(destekler) * len(guvenler) * len(liftler)
+    print(f"\n⚙️  Eşik taraması: {noktalar} nokta, kurallar conf≥{min(guvenler)} ile bir kez türetiliyor…")
+    tablo, turetme = esik_taramasi(frequent_itemsets, sepet.X, sepet.urun_adlari,
+                                   destekler, guvenler, liftler)
+    print(f"   kural türetme {turetme:.2f} sn")
+    tablo_yazdir(tablo)
+    yol = _yol(cikti_klasor, CIKTI_TARAMA)
+    if cikti_klasor:
+        os.makedirs(cikti_klasor, exist_ok=True)
+    tablo.round(4).to_csv(yol, index=False, encoding="utf-8")
+    print(f"✓ {yol} kaydedildi")
+    _rapor_yaz(olcer, cikti_klasor, parametreler=parametreler or {"girdi": girdi},
+               madenci=madenci, sik_kume=kume_sayilari(frequent_itemsets),
+               aday={str(k): v for k, v in sorted(aday_sayaci.items())}, tarama_noktasi=len(tablo))
+    return tablo
+
+
+def segment_egit(girdi: str, min_support: float = MIN_SUPPORT,
+                 min_confidence: float = MIN_CONFIDENCE, min_lift: float = MIN_LIFT,
+                 nitelik: str = None, cikti_klasor: str = ".", olcer: Olcer = None,
+                 parametreler: dict = None):
+    """Segment başına kurallar (segmentler.segment_kurallari) → CIKTI_SEGMENT; tabloyu döndür.
+
+    Girdi sipariş numarası taşımıyorsa (apriori_transactions.csv) ValueError.
+    """
+    from segmentler import segment_kurallari, segment_maskeleri, siparis_nitelikleri
+    from sepet_okuyucu import seyrek_sepet_oku
+    olcer = olcer or Olcer()
+    print(f"📥 {girdi} okunuyor…")
+    if not os.path.exists(girdi):
+        raise FileNotFoundError(girdi)
+    olcer.baslat("oku")
+    X, urun_adlari, siparisler = seyrek_sepet_oku(girdi, idler=True)
+    if siparisler is None:
+        raise ValueError(f"{girdi} sipariş numarası taşımıyor; --segment için market_basket.csv "
+                         f"ya da orders.arrow/parquet kullanın.")
+    nitelik_yolu = nitelik or (girdi if girdi.endswith((".arrow", ".parquet"))
+                               else os.path.join(os.path.dirname(girdi), "orders_summary.csv"))
+    print(f"   {X.shape[0]} sipariş, {X.shape[1]} farklı ürün; nitelikler: {nitelik_yolu}")
+    olcer.baslat("nitelik")
+    maskeler = segment_maskeleri(siparis_nitelikleri(nitelik_yolu, siparisler))
+    olcer.baslat("segment_madencilik")
+    print(f"\n⚙️  Segmentli Eclat: {len(maskeler)} segment tek geçişte "
+          f"(min_support={min_support}, conf≥{min_confidence}, lift≥{min_lift})…")
+    tablo, ozet = segment_kurallari(X, urun_adlari, maskeler,
+                                    min_support, min_confidence, min_lift)
+    print("─" * 80)
+    print(f"{'Segment':<28} {'Sipariş':>8} {'Itemset':>8} {'Kural':>7}  En iyi kural")
+    print("─" * 80)
+    for (aile, segment), (adet, kume_sayisi) in ozet.items():
+        kurallar = tablo[(tablo["segment_ailesi"] == aile) & (tablo["segment"] == segment)]
+        en_iyi = (f"{{{kurallar.iloc[0]['antecedent']}}} → {{{kurallar.iloc[0]['consequent']}}}"
+                  if len(kurallar) else "-")
+        print(f"{aile + '=' + segment:<28} {adet:>8} {kume_sayisi:>8} {len(kurallar):>7}  {en_iyi}")
+    print("─" * 80)
+    olcer.baslat("disa_aktar_csv")
+    yol = _yol(cikti_klasor, CIKTI_SEGMENT)
+    if cikti_klasor:
+        os.makedirs(cikti_klasor, exist_ok=True)
+    tablo.round(4).to_csv(yol, index=False, encoding="utf-8")
+    print(f"✓ {yol} kaydedildi ({len(tablo)} kural)")
+    _rapor_yaz(olcer, cikti_klasor, parametreler=parametreler or {"girdi": girdi},
+               madenci="segmentli",
+               segmentler={f"{a}={s}": {"siparis": adet, "sik_kume": k}
+                           for (a, s), (adet, k) in ozet.items()},
+               kural_sayisi=len(tablo))
+    return tablo
+
+
+# ─────────────────────────────────────────────
+# 9. KOMUT SATIRI
+# ─────────────────────────────────────────────
+def arguman_ayristirici() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CafeML Apriori birliktelik kuralları eğitimi")
+    parser.add_argument("--girdi", default="market_basket.csv",
+                        help="sepet dosyası: market_basket.csv, apriori_transactions.csv ya da "
+                             "generate_dataset.py --bicim arrow/parquet çıktısı")
+    parser.add_argument("--madenci", choices=MADENCILER, default="mlxtend",
+                        help="sık küme madencisi: mlxtend (yoğun DataFrame), seyrek "
+                             "(CSR üzerinde Apriori), eclat (bit tid-listeli Eclat) ya da "
+                             "paralel (çok süreçli destek sayımı)")
+    parser.add_argument("--seyrek", action="store_true", help="--madenci seyrek kısayolu")
+    parser.add_argument("--isci", type=int, default=None,
+                        help="--madenci paralel için süreç sayısı (varsayılan: tüm çekirdekler)")
+    parser.add_argument("--artimsal", metavar="KLASOR", default=None,
+                        help="artımsal mod: KLASOR'deki sayım durumunu --girdi partisiyle "
+                             "güncelle (durum yoksa --girdi ile oluşturulur)")
+    parser.add_argument("--destek", type=float, nargs="+", default=[MIN_SUPPORT],
+                        help="min_support (--tarama ile birden çok değer)")
+    parser.add_argument("--guven", type=float, nargs="+", default=[MIN_CONFIDENCE],
+                        help="min_confidence (--tarama ile birden çok değer)")
+    parser.add_argument("--lift", type=float, nargs="+", default=[MIN_LIFT],
+                        help="min_lift (--tarama ile birden çok değer)")
+    parser.add_argument("--tarama", action="store_true",
+                        help=f"en düşük destekte bir kez madenle, destek × güven × lift ızgarasını "
+                             f"{CIKTI_TARAMA} olarak karşılaştır (kural dosyaları yazılmaz)")
+    parser.add_argument("--segment", action="store_true",
+                        help=f"gün dilimi, hafta içi/sonu ve hava segmentleri için ayrı kurallar "
+                             f"({CIKTI_SEGMENT}); tüm segmentler tek geçişte sayılır")
+    parser.add_argument("--nitelik", default=None,
+                        help="--segment için sipariş nitelikleri: orders_summary.csv (varsayılan) "
+                             "ya da kolonsal girdide girdinin kendisi")
+    parser.add_argument("--orneklem", type=float, default=None, metavar="BOYUT",
+                        help="yaklaşık mod: örneklem üzerinde madenle (BOYUT < 1 oran, aksi halde "
+                             "sipariş adedi); kurallar güven aralıklarıyla yazılır")
+    parser.add_argument("--dogrula", action="store_true",
+                        help="--orneklem adaylarını tam veri üzerinde yeniden sayıp kesinleştir")
+    parser.add_argument("--buda", action="store_true",
+                        help="daha genel öncüllü, güveni eşit/yüksek bir kuralın baskın olduğu kuralları at")
+    parser.add_argument("--kume", choices=("tum", "kapali", "maksimal"), default="tum",
+                        help="kuralları kapalı ya da maksimal sık kümelerden türeyenlerle sınırla")
+    parser.add_argument("--kategori", type=float, default=None, metavar="DESTEK",
+                        help="çok seviyeli madencilik: önce MENU kategorileri DESTEK ile madenlenir "
+                             f"({CIKTI_KATEGORI}), ürün kümeleri yalnız sık kategori örüntüleri "
+                             "içinde --destek ile aranır (--madenci yok sayılır)")
+    parser.add_argument("--onbellek", metavar="KLASOR", nargs="?", const=ONBELLEK, default=None,
+                        help="sık küme önbelleğini aç (anahtar: girdi içeriği + parametreler); "
+                             f"KLASOR verilmezse {ONBELLEK}")
+    parser.add_argument("--onbellek-mb", type=float, default=512,
+                        help="önbellek boyut sınırı, MB (aşılınca en eski girdiler silinir)")
+    parser.add_argument("--profil", action="store_true",
+                        help="cProfile ile profille; en pahalı fonksiyonlar rapora, tamamı "
+                             "egitim_raporu.prof dosyasına")
+    parser.add_argument("--bellek-izi", action="store_true",
+                        help="tracemalloc ile aşama başına tahsis tepesi ve en çok ayıran satırlar "
+                             "(yavaşlatır)")
+    parser.add_argument("--cikti-klasor", default=".",
+                        help="çıktı dosyalarının (kurallar, öneriler, rapor) yazılacağı klasör")
+    return parser
+
+
+def main(argv=None):
+    parser = arguman_ayristirici()
+    args = parser.parse_args(argv)
+    if not args.tarama and max(map(len, (args.destek, args.guven, args.lift))) > 1:
+        parser.error("birden çok eşik değeri yalnızca --tarama ile kullanılabilir")
+    if sum(map(bool, (args.tarama, args.artimsal, args.segment, args.orneklem, args.kategori))) > 1:
+        parser.error("--tarama, --artimsal, --segment, --orneklem ve --kategori birlikte kullanılamaz")
+    if args.dogrula and not args.orneklem:
+        parser.error("--dogrula yalnızca --orneklem ile kullanılabilir")
+
+    madenci = "seyrek" if args.seyrek else args.madenci
+    olcer = Olcer(profil=args.profil, bellek_izi=args.bellek_izi)
+    ortak = {"cikti_klasor": args.cikti_klasor, "olcer": olcer, "parametreler": vars(args)}
+    try:
+        if args.segment:
+            try:
+                segment_egit(args.girdi, min(args.destek), args.guven[0], args.lift[0],
+                             nitelik=args.nitelik, **ortak)
+            except ValueError as hata:
+                print(f"❌ {hata}")
+                raise SystemExit(1)
+            return
+        if args.tarama:
+            tarama_egit(args.girdi, args.destek, args.guven, args.lift, madenci, args.isci,
+                        args.onbellek, args.onbellek_mb, **ortak)
+            return
+        egit(args.girdi, min(args.destek), args.guven[0], args.lift[0], madenci, args.isci,
+             artimsal_klasor=args.artimsal, orneklem=args.orneklem, dogrula=args.dogrula,
+             buda=args.buda, kume=args.kume, onbellek_klasor=args.onbellek,
+             onbellek_mb=args.onbellek_mb, kategori_destek=args.kategori, **ortak)
+    except FileNotFoundError as hata:
+        print(f"❌ {hata.filename or hata.args[0]} bulunamadı! Önce generate_dataset.py çalıştırın.")
+        raise SystemExit(1)
+    print("\n✅ Apriori eğitimi tamamlandı!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+CafeML – Artımsal Kural Güncelleme
+==================================
+Yeni siparişler geldiğinde birliktelik kurallarını tüm geçmişi yeniden
+madenlemeden tazeler (FUP / negatif sınır yaklaşımı).
+
+Durum klasörü:
+    durum.json        : min_support, toplam sipariş sayısı, ürün adları ve
+                        izlenen ürün kümelerinin destek adetleri
+    parca_NNNNN.npz   : her partinin CSR sepet matrisi (yeniden tarama için)
+
+durum.json her parçanın içerik özetini de tutar; zaten eklenmiş bir parti
+(ör. aynı günlük komutun yanlışlıkla ikinci kez çalışması) yeniden
+sayılmaz, atlanır.
+
+İzlenen kümeler = sık kümeler + negatif sınır (tüm alt kümeleri sık olup
+kendisi sık olmayan kümeler; tüm tekil ürünler dahil). Yeni parti yalnızca
+bu kümeler için sayılır. Sınırdaki bir küme eşiği geçerse, ondan türeyen
+yeni adaylar – ve yalnızca onlar – geçmiş parçalar üzerinde sayılır
+(sınırlı yeniden tarama). Sonuç, tüm veri üzerinde baştan madencilikle
+birebir aynı sık kümeleri ve destekleri verir.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from madencilik import _aday_uret, _sonuc_tablosu, destek_say, eclat
+
+DURUM_DOSYASI = "durum.json"
+
+
+def _durum_yolu(klasor: str) -> str:
+    return os.path.join(klasor, DURUM_DOSYASI)
+
+
+def durum_var_mi(klasor: str) -> bool:
+    return os.path.exists(_durum_yolu(klasor))
+
+
+def durum_yukle(klasor: str) -> dict:
+    with open(_durum_yolu(klasor), encoding="utf-8") as f:
+        ham = json.load(f)
+    ham["sayimlar"] = {tuple(kume): adet for kume, adet in ham["sayimlar"]}
+    return ham
+
+
+def durum_kaydet(klasor: str, durum: dict):
+    ham = dict(durum)
+    ham["sayimlar"] = [[list(kume), adet] for kume, adet in sorted(durum["sayimlar"].items())]
+    gecici = _durum_yolu(klasor) + ".tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        json.dump(ham, f, ensure_ascii=False)
+    os.replace(gecici, _durum_yolu(klasor))  # yarım yazılmış durum bırakma
+
+
+def parca_ozeti(X) -> str:
+    """Durumdaki ürün sırasına taşınmış partinin içerik özeti (satırlar + CSR yapısı)."""
+    X = X.tocsr()
+    X.sort_indices()
+    ozet = hashlib.blake2b(digest_size=20)
+    ozet.update(np.int64(X.shape[0]).tobytes())
+    ozet.update(X.indptr.astype(np.int64).tobytes())
+    ozet.update(X.indices.astype(np.int32).tobytes())
+    return ozet.hexdigest()
+
+
+def _parca_ekle(klasor: str, durum: dict, X, ozet: str):
+    from scipy.sparse import save_npz
+    if X.shape[0] == 0:
+        return
+    ad = f"parca_{len(durum['parcalar']):05d}.npz"
+    save_npz(os.path.join(klasor, ad), X.tocsr(), compressed=False)
+    durum["parcalar"].append(ad)
+    durum["ozetler"].append(ozet)
+
+
+def _gecmis_say(klasor: str, durum: dict, kumeler: list) -> np.ndarray:
+    """Kümeleri kayıtlı tüm parçalar üzerinde, her seferinde tek parça bellekteyken say."""
+    from scipy.sparse import load_npz
+    genislik = len(durum["urunler"])
+    toplam = np.zeros(len(kumeler), dtype=np.int64)
+    for ad in durum["parcalar"]:
+        X = load_npz(os.path.join(klasor, ad)).tocsr()
+        X.resize((X.shape[0], genislik))  # sonradan eklenen ürünler bu partide yok
+        toplam += destek_say(X, kumeler)
+    return toplam
+
+
+def _sik_kumeler(durum: dict) -> set:
+    n, esik = durum["n"], durum["min_support"]
+    return {kume for kume, adet in durum["sayimlar"].items() if n and adet / n >= esik}
+
+
+def _sinir_tamamla(klasor: str, durum: dict) -> int:
+    """Sık kümelerin sayılmamış Apriori adaylarını geçmiş üzerinde say.
+
+    Yeni sayılan adaylardan sık çıkanlar bir sonraki seviyenin adaylarını
+    doğurur; sayılacak aday kalmayana kadar sürer. Sayılan aday sayısını döndürür.
+    """
+    taranan = 0
+    while True:
+        sik = _sik_kumeler(durum)
+        seviyeler: dict = {}
+        for kume in sik:
+            seviyeler.setdefault(len(kume), []).append(kume)
+        eksik = [aday for k in sorted(seviyeler)
+                 for aday, _, _ in _aday_uret(sorted(seviyeler[k]))
+                 if aday not in durum["sayimlar"]]
+        if not eksik:
+            return taranan
+        for kume, adet in zip(eksik, _gecmis_say(klasor, durum, eksik)):
+            durum["sayimlar"][kume] = int(adet)
+        taranan += len(eksik)
+
+
+def _buda(durum: dict):
+    """Bir alt kümesi artık sık olmayan, kendisi de sık olmayan kümeleri izlemeden çıkar."""
+    sik = _sik_kumeler(durum)
+    durum["sayimlar"] = {
+        kume: adet for kume, adet in durum["sayimlar"].items()
+        if kume in sik or len(kume) == 1
+        or all(kume[:j] + kume[j + 1:] in sik for j in range(len(kume)))
+    }
+
+
+def durum_olustur(klasor: str, X, urun_adlari: list, min_support: float) -> dict:
+    """İlk partiyi Eclat ile madenle, negatif sınırı say ve durumu kaydet."""
+    os.makedirs(klasor, exist_ok=True)
+    X = X.tocsr()
+    durum = {"min_support": min_support, "n": int(X.shape[0]),
+             "urunler": list(urun_adlari), "parcalar": [], "ozetler": [], "sayimlar": {}}
+    sutun_no = {ad: j for j, ad in enumerate(urun_adlari)}
+    sik = eclat(X, urun_adlari, min_support)
+    for destek, kume in zip(sik["support"], sik["itemsets"]):
+        durum["sayimlar"][tuple(sorted(sutun_no[ad] for ad in kume))] = int(round(destek * X.shape[0]))
+    tekiller = np.asarray(X.sum(axis=0)).ravel()
+    for j, adet in enumerate(tekiller):
+        durum["sayimlar"].setdefault((j,), int(adet))
+    _parca_ekle(klasor, durum, X, parca_ozeti(X))
+    _sinir_tamamla(klasor, durum)
+    durum_kaydet(klasor, durum)
+    return durum
+
+
+def durum_guncelle(klasor: str, X, urun_adlari: list, min_support: float = None) -> dict:
+    """Yeni partiyi duruma ekle; yalnızca izlenen kümeleri ve gerekirse yeni adayları say.
+
+    min_support verilir ve durumdakinden farklıysa eşik değiştirilir; düşen
+    eşiğin gerektirdiği yeni adaylar da aynı sınırlı taramayla sayılır.
+    İçerik özeti kayıtlı bir parçayla aynı olan parti yeniden sayılmaz
+    (yalnızca eşik değişikliği uygulanır) ve özetteki "tekrar" True olur.
+
+    Dönüş: (durum, {"yeni_siparis", "yeni_urun", "terfi", "taranan", "tekrar"} özet sayıları)
+    """
+    durum = durum_yukle(klasor)
+    durum.setdefault("ozetler", [])  # özetlerden önce yazılmış durumlar
+    sutun_no = {ad: j for j, ad in enumerate(durum["urunler"])}
+    yeni_urun = [ad for ad in urun_adlari if ad not in sutun_no]
+    for ad in yeni_urun:
+        sutun_no[ad] = len(sutun_no)
+
+    # partinin sütunlarını durumdaki ürün sırasına taşı
+    X = X.tocoo()
+    from scipy.sparse import csr_matrix
+    eslem = np.array([sutun_no[ad] for ad in urun_adlari], dtype=np.int32)
+    X = csr_matrix((X.data, (X.row, eslem[X.col])), shape=(X.shape[0], len(sutun_no)))
+    ozet = parca_ozeti(X)
+    tekrar = ozet in durum["ozetler"]
+
+    onceki_sik = _sik_kumeler(durum)
+    if not tekrar:
+        for ad in yeni_urun:
+            durum["urunler"].append(ad)
+            durum["sayimlar"][(sutun_no[ad],)] = 0
+        kumeler = list(durum["sayimlar"])
+        for kume, adet in zip(kumeler, destek_say(X, kumeler)):
+            durum["sayimlar"][kume] += int(adet)
+        durum["n"] += int(X.shape[0])
+        _parca_ekle(klasor, durum, X, ozet)
+    if min_support is not None:
+        durum["min_support"] = min_support
+
+    terfi = len(_sik_kumeler(durum) - onceki_sik)
+    taranan = _sinir_tamamla(klasor, durum) if terfi else 0
+    _buda(durum)
+    durum_kaydet(klasor, durum)
+    if tekrar:
+        return durum, {"yeni_siparis": 0, "yeni_urun": 0, "terfi": terfi, "taranan": taranan,
+                       "tekrar": True}
+    return durum, {"yeni_siparis": int(X.shape[0]), "yeni_urun": len(yeni_urun),
+                   "terfi": terfi, "taranan": taranan, "tekrar": False}
+
+
+def sik_kume_tablosu(durum: dict):
+    """Durumdaki sık kümeler → mlxtend biçimli DataFrame[support, itemsets]."""
+    sik = sorted(_sik_kumeler(durum), key=lambda kume: (len(kume), kume))
+    return _sonuc_tablosu([(kume, durum["sayimlar"][kume]) for kume in sik],
+                          durum["urunler"], durum["n"])
@@ -0,0 +1,227 @@
+"""
+CafeML – Üret → Eğit Hattı Karşılaştırması (Benchmark)
+======================================================
+generate_dataset.py ile birkaç ölçekte sentetik veri üretir ve apriori_train.py
+adımlarını aynı veri üzerinde çalıştırır; her aşama ayrı ölçülür:
+
+    uret         : uret_akis() tüketimi (yazmadan)
+    uret_kaydet  : kaydet(uret_akis()) – kaydet süresi = uret_kaydet − uret
+    oku          : seyrek_sepet_oku()
+    genislet     : menü çarpanı > 1 ise sepetin K kat büyük menüye eşlenmesi
+    madencilik   : sık kümeler (--madenci)
+    kurallar     : apriori_train.kurallari_turet
+    disa_aktar_* : apriori_train.disa_aktar (csv / ikili / json)
+
+Büyük menü: 50 ürünlük MENU K kopyaya çoğaltılır (ör. K şube menüsü); her
+sipariş rastgele bir kopyaya düşer, "Çay" → "Çay·3" gibi. Ürün sayısı 50·K
+olur, kopya içi birliktelikler korunur, tek ürün destekleri ~K kat düşer.
+
+Her ölçek / menü / destek üçlüsü ayrı bir süreçte (spawn) çalışır; önceki
+koşuların belleği ölçüme karışmaz. Süre ve tepe bellek olcum.Olcer ile
+aşama başına ölçülür.
+
+Sonuçlar JSON'a (ortam bilgisi + satır başına bir aşama) yazılır;
+--karsilastir ile önceki bir sürümün sonuçlarına göre oranlar basılır ve
+toleransı aşan yavaşlama varsa çıkış kodu 1 olur.
+
+Kullanım:
+    python bench_hatti.py                                   # 10k … 10M, menü ×1 ×10
+    python bench_hatti.py --olcek 10000 100000 --menu-carpani 1 4 20
+    python bench_hatti.py --destek 0.01 0.005 --madenci eclat seyrek
+    python bench_hatti.py --bicim csv --cikti bench_csv.json
+    python bench_hatti.py --olcek 100000 --karsilastir bench_onceki.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+
+from olcum import Olcer, ortam_bilgisi
+
+OLCEKLER = (10_000, 100_000, 1_000_000, 10_000_000)
+GIRDILER = {"csv": "market_basket.csv", "arrow": "orders.arrow", "parquet": "orders.parquet"}
+MADENCILER = ("eclat", "seyrek", "paralel", "mlxtend")
+CIKTI = "bench_sonuclari.json"
+
+
+# ─────────────────────────────────────────────
+# 1. AŞAMALAR (alt süreçte çalışır)
+# ─────────────────────────────────────────────
+def _klasor_mb(klasor: str) -> float:
+    return sum(os.path.getsize(os.path.join(klasor, ad)) for ad in os.listdir(klasor)) / 1e6
+
+
+def uret_kaydet_kos(n: int, klasor: str, bicim: str, motor: str) -> list:
+    import generate_dataset as gd
+    olcer = Olcer(olcek=n, bicim=bicim)
+    with olcer.asama("uret") as ek:
+        ek["siparis"] = sum(1 for _ in gd.uret_akis(n, motor=motor))
+    with olcer.asama("uret_kaydet") as ek:
+        with open(os.devnull, "w") as sessiz, redirect_stdout(sessiz):
+            gd.kaydet(gd.uret_akis(n, motor=motor), klasor, bicim=bicim)
+        ek["dosya_mb"] = round(_klasor_mb(klasor), 1)
+    uret, toplam = olcer.satirlar
+    olcer.satirlar.append({**toplam, "asama": "kaydet",
+                           "sure_sn": round(toplam["sure_sn"] - uret["sure_sn"], 4),
+                           "cpu_sn": round(toplam["cpu_sn"] - uret["cpu_sn"], 4),
+                           "turetilmis": True})
+    return olcer.satirlar
+
+
+def menu_genislet(X, urun_adlari: list, carpan: int, tohum: int = 42):
+    """Her siparişi 50·K ürünlük menünün rastgele bir kopyasına eşle."""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    X = X.tocsr()
+    m = X.shape[1]
+    kopya = np.random.default_rng(tohum).integers(carpan, size=X.shape[0])
+    indices = X.indices + m * np.repeat(kopya, np.diff(X.indptr))
+    Y = csr_matrix((X.data, indices, X.indptr), shape=(X.shape[0], m * carpan))
+    adlar = [ad if k == 0 else f"{ad}·{k + 1}" for k in range(carpan) for ad in urun_adlari]
+    return Y, adlar
+
+
+def egit_kos(girdi: str, klasor: str, carpan: int, madenci: str, min_support: float,
+             min_confidence: float, min_lift: float, ortak: dict) -> list:
+    import apriori_train as at
+    import mlxtend.frequent_patterns  # noqa: F401 – içe aktarma süresi aşamalara karışmasın
+    from sepet_okuyucu import seyrek_sepet_oku
+
+    olcer = Olcer(**ortak)
+    with open(os.devnull, "w") as sessiz, redirect_stdout(sessiz):
+        with olcer.asama("oku") as ek:
+            X, urun_adlari = seyrek_sepet_oku(girdi)
+            ek["kalem"] = int(X.nnz)
+        if carpan > 1:
+            with olcer.asama("genislet"):
+                X, urun_adlari = menu_genislet(X, urun_adlari, carpan)
+        with olcer.asama("madencilik") as ek:
+            sepet = at.Sepet(X, urun_adlari, None, X.shape[0])
+            if madenci == "mlxtend":  # yoğun DataFrame kurulumu da madencilik süresine dahil
+                import pandas as pd
+                sepet = sepet._replace(df=pd.DataFrame(X.toarray(), columns=urun_adlari))
+            fi = at.sik_kumeleri_bul(sepet, min_support, madenci)
+            sayimlar = at.kume_sayilari(fi)
+            ek["kume_sayisi"] = sayimlar["toplam"]
+            ek["uzunluga_gore"] = sayimlar["uzunluga_gore"]
+        with olcer.asama("kurallar") as ek:
+            rules = at.kurallari_turet(fi, min_confidence, min_lift)
+            ek["kural_sayisi"] = len(rules)
+        at.disa_aktar(rules, klasor, olcer=olcer)  # disa_aktar_csv / _ikili / _json aşamaları
+    return olcer.satirlar
+
+
+def _alt_surecte(fonk, *argumanlar):
+    """fonk'u taze bir süreçte çalıştır (bellek ölçümü önceki koşulardan bağımsız)."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as havuz:
+        return havuz.submit(fonk, *argumanlar).result()
+
+
+# ─────────────────────────────────────────────
+# 2. RAPOR
+# ─────────────────────────────────────────────
+def _anahtar(satir: dict) -> tuple:
+    return tuple(satir.get(k) for k in ("olcek", "bicim", "menu_urun", "madenci", "destek", "asama"))
+
+
+def satir_yazdir(satir: dict, onceki: dict | None = None):
+    ayar = (f"{satir.get('menu_urun', '')!s:>5} {satir.get('madenci', '')!s:>8} "
+            f"{satir.get('destek', '')!s:>6}")
+    fark = ""
+    if onceki and onceki.get("sure_sn"):
+        fark = f"  ×{satir['sure_sn'] / onceki['sure_sn']:.2f}"
+    sayim = satir.get("kume_sayisi", satir.get("kural_sayisi", satir.get("siparis", "")))
+    print(f"{satir['olcek']:>9} {ayar} {satir['asama']:<16} {satir['sure_sn']:>9.3f} "
+          f"{satir['cpu_sn']:>9.3f} {satir['tepe_rss_mb']:>8.1f} {sayim!s:>8}{fark}")
+
+
+def karsilastir(sonuclar: list, onceki: list, tolerans: float) -> list:
+    """Süresi önceki sonuca göre (1 + tolerans) katından fazla artan satırlar."""
+    eski = {_anahtar(s): s for s in onceki}
+    gerileme = []
+    for s in sonuclar:
+        o = eski.get(_anahtar(s))
+        if o and o["sure_sn"] > 0 and s["sure_sn"] > o["sure_sn"] * (1 + tolerans):
+            gerileme.append((s, o))
+    return gerileme
+
+
+# ─────────────────────────────────────────────
+# 3. ANA AKIŞ
+# ─────────────────────────────────────────────
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Üret → eğit hattı ölçek karşılaştırması")
+    parser.add_argument("--olcek", type=int, nargs="+", default=list(OLCEKLER),
+                        help="sipariş sayıları")
+    parser.add_argument("--menu-carpani", type=int, nargs="+", default=[1, 10],
+                        help="menü kopya sayısı K (ürün sayısı 50·K)")
+    parser.add_argument("--destek", type=float, nargs="+", default=[0.01])
+    parser.add_argument("--guven", type=float, default=0.40)
+    parser.add_argument("--lift", type=float, default=1.2)
+    parser.add_argument("--madenci", nargs="+", default=["eclat"], choices=MADENCILER)
+    parser.add_argument("--motor", default="vektorel", help="generate_dataset üretim motoru")
+    parser.add_argument("--bicim", default="arrow", choices=tuple(GIRDILER))
+    parser.add_argument("--klasor", default=None,
+                        help="üretilen verinin klasörü (varsayılan: geçici, sonunda silinir)")
+    parser.add_argument("--cikti", default=CIKTI)
+    parser.add_argument("--karsilastir", default=None, metavar="JSON",
+                        help="önceki sonuç dosyası; süre oranları basılır")
+    parser.add_argument("--tolerans", type=float, default=0.10,
+                        help="gerileme sayılacak yavaşlama oranı (--karsilastir ile)")
+    args = parser.parse_args()
+
+    kok = args.klasor or tempfile.mkdtemp(prefix="cafeml_bench_")
+    onceki = {}
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            onceki_sonuclar = json.load(f)["sonuclar"]
+        onceki = {_anahtar(s): s for s in onceki_sonuclar}
+
+    print(f"{'Sipariş':>9} {'Menü':>5} {'Madenci':>8} {'Destek':>6} {'Aşama':<16} "
+          f"{'Süre (s)':>9} {'CPU (s)':>9} {'Tepe MB':>8} {'Sayı':>8}")
+    print("─" * 88)
+    sonuclar = []
+    try:
+        for n in args.olcek:
+            klasor = os.path.join(kok, str(n))
+            for satir in _alt_surecte(uret_kaydet_kos, n, klasor, args.bicim, args.motor):
+                satir_yazdir(satir, onceki.get(_anahtar(satir)))
+                sonuclar.append(satir)
+            girdi = os.path.join(klasor, GIRDILER[args.bicim])
+            for carpan in args.menu_carpani:
+                for madenci in args.madenci:
+                    for ms in args.destek:
+                        ortak = {"olcek": n, "bicim": args.bicim, "menu_urun": 50 * carpan,
+                                 "madenci": madenci, "destek": ms}
+                        cikti = os.path.join(klasor, f"m{carpan}_{madenci}_{ms}")
+                        os.makedirs(cikti, exist_ok=True)
+                        for satir in _alt_surecte(egit_kos, girdi, cikti, carpan, madenci, ms,
+                                                  args.guven, args.lift, ortak):
+                            satir_yazdir(satir, onceki.get(_anahtar(satir)))
+                            sonuclar.append(satir)
+            print("─" * 88)
+            if not args.klasor:
+                shutil.rmtree(klasor, ignore_errors=True)
+    finally:
+        if not args.klasor:
+            shutil.rmtree(kok, ignore_errors=True)
+
+    with open(args.cikti, "w", encoding="utf-8") as f:
+        json.dump({"ortam": ortam_bilgisi(), "bicim": args.bicim, "motor": args.motor,
+                   "sonuclar": sonuclar}, f, ensure_ascii=False, indent=2)
+    print(f"✓ {args.cikti} kaydedildi ({len(sonuclar)} ölçüm)")
+
+    if args.karsilastir:
+        gerileme = karsilastir(sonuclar, onceki_sonuclar, args.tolerans)
+        if gerileme:
+            print(f"\n⚠️  {len(gerileme)} aşama %{args.tolerans * 100:.0f}'den fazla yavaşladı:")
+            for s, o in gerileme:
+                print(f"   {s['olcek']} / {s.get('menu_urun', '-')} / {s['asama']}: "
+                      f"{o['sure_sn']:.3f} → {s['sure_sn']:.3f} sn")
+            exit(1)
+        print("✓ gerileme yok")
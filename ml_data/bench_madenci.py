@@ -0,0 +1,76 @@
+"""
+CafeML – Madenci Karşılaştırma (Benchmark)
+==========================================
+Aynı sepet dosyası üzerinde mlxtend apriori / fpgrowth ile yerleşik
+seyrek_apriori, eclat ve paralel_apriori madencilerini karşılaştırır. Her destek eşiği
+için süre, tepe bellek (tracemalloc) ve sık küme sayısı raporlanır;
+yerleşik madencilerin sonucu mlxtend apriori ile birebir karşılaştırılır.
+
+Kullanım:
+    python bench_madenci.py
+    python bench_madenci.py --girdi orders.arrow --destek 0.05 0.01 0.005
+    python bench_madenci.py --atla mlxtend-apriori    # yavaş motoru atla
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mlxtend.frequent_patterns import apriori, fpgrowth
+
+from sepet_okuyucu import sepet_oku, seyrek_sepet_oku
+from madencilik import seyrek_apriori, eclat, paralel_apriori
+
+
+def _olc(fonk):
+    tracemalloc.start()
+    bas = time.perf_counter()
+    sonuc = fonk()
+    sure = time.perf_counter() - bas
+    tepe = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return sonuc, sure, tepe
+
+
+def _anahtar(fi):
+    return {(k, round(s, 10)) for k, s in zip(fi["itemsets"], fi["support"])}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sık küme madencisi karşılaştırması")
+    parser.add_argument("--girdi", default="market_basket.csv")
+    parser.add_argument("--destek", type=float, nargs="+", default=[0.05, 0.02, 0.01, 0.005])
+    parser.add_argument("--atla", nargs="*", default=[],
+                        help="çalıştırılmayacak motorlar (ör. mlxtend-apriori)")
+    parser.add_argument("--isci", type=int, default=None, help="paralel_apriori süreç sayısı")
+    args = parser.parse_args()
+
+    print(f"📥 {args.girdi} okunuyor…")
+    df = sepet_oku(args.girdi)
+    X, urun_adlari = seyrek_sepet_oku(args.girdi)
+    print(f"   {X.shape[0]} sipariş, {X.shape[1]} ürün, {X.nnz} kalem\n")
+
+    motorlar = {
+        "mlxtend-apriori": lambda ms: apriori(df, min_support=ms, use_colnames=True),
+        "mlxtend-fpgrowth": lambda ms: fpgrowth(df, min_support=ms, use_colnames=True),
+        "seyrek_apriori":  lambda ms: seyrek_apriori(X, urun_adlari, ms),
+        "eclat":           lambda ms: eclat(X, urun_adlari, ms),
+        "paralel_apriori": lambda ms: paralel_apriori(X, urun_adlari, ms, isci_sayisi=args.isci),
+    }
+
+    print(f"{'Motor':<18} {'Destek':>7} {'Küme':>8} {'Süre (s)':>10} {'Tepe MB':>9}  Eşleşme")
+    print("─" * 66)
+    for ms in args.destek:
+        referans = None
+        for ad, fonk in motorlar.items():
+            if ad in args.atla:
+                continue
+            fi, sure, tepe = _olc(lambda: fonk(ms))
+            anahtar = _anahtar(fi)
+            if referans is None:
+                referans = anahtar
+                eslesme = "referans"
+            else:
+                eslesme = "✓" if anahtar == referans else "✗ FARKLI"
+            print(f"{ad:<18} {ms:>7.3f} {len(fi):>8} {sure:>10.3f} {tepe / 1e6:>9.1f}  {eslesme}")
+        print("─" * 66)
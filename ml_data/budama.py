@@ -0,0 +1,88 @@
+"""
+CafeML – Kural Budama
+=====================
+association_rules(...) sonrasında yayımlanan kural kümesini küçültür.
+
+baskin_kurallari_buda : X → Y kuralı, aynı sonuçlu daha genel bir X' → Y
+                        (X' ⊂ X) kuralının güveni ≥ ise atılır; daha özel
+                        öncül bilgi eklemiyordur. Genel kural her zaman
+                        tabloda vardır: güveni ≥ ise lift'i ve desteği de ≥.
+kapali_kumeler        : Aynı destekli üst kümesi olmayan sık kümeler.
+maksimal_kumeler      : Sık üst kümesi olmayan sık kümeler.
+kume_filtresi         : Yalnız öncül ∪ sonucu verilen kümelerde olan kurallar.
+
+Çiftler karşılaştırılmaz: ürünler bitlere eşlenir, kurallar
+(sonuç maskesi, öncül maskesi) anahtarıyla indekslenir ve her kural için
+öncülünün alt maskeleri (en fazla 2^|X| − 2 arama) yoklanır. Kapalı/maksimal
+kontrolü de her kümenin yalnız bir eksik alt kümelerine bakar.
+"""
+
+import numpy as np
+
+
+def _bit_eslemesi(kumeler) -> dict:
+    adlar = sorted({ad for kume in kumeler for ad in kume})
+    return {ad: 1 << i for i, ad in enumerate(adlar)}
+
+
+def _maske(kume, bit: dict) -> int:
+    m = 0
+    for ad in kume:
+        m |= bit[ad]
+    return m
+
+
+def baskin_kurallari_buda(rules):
+    """Daha genel öncüllü, güveni eşit/yüksek bir kuralın baskın olduğu kuralları at."""
+    bit = _bit_eslemesi(list(rules["antecedents"]) + list(rules["consequents"]))
+    oncul = [_maske(k, bit) for k in rules["antecedents"]]
+    sonuc = [_maske(k, bit) for k in rules["consequents"]]
+    guven = rules["confidence"].to_numpy()
+    indeks = {(s, o): g for s, o, g in zip(sonuc, oncul, guven)}
+
+    tut = np.ones(len(rules), dtype=bool)
+    for i, (s, o, g) in enumerate(zip(sonuc, oncul, guven)):
+        alt = (o - 1) & o  # o'nun öz alt maskeleri, büyükten küçüğe
+        while alt:
+            genel = indeks.get((s, alt))
+            if genel is not None and genel >= g:
+                tut[i] = False
+                break
+            alt = (alt - 1) & o
+    return rules[tut]
+
+
+def _alt_kume_isaretle(frequent_itemsets, kapali: bool) -> np.ndarray:
+    kumeler = list(frequent_itemsets["itemsets"])
+    bit = _bit_eslemesi(kumeler)
+    maskeler = [_maske(k, bit) for k in kumeler]
+    destekler = frequent_itemsets["support"].tolist()
+    destek = dict(zip(maskeler, destekler))
+    elenen = set()
+    for m, s in zip(maskeler, destekler):
+        kalan = m
+        while kalan:  # her bir ürünü çıkararak bir eksik alt kümeler
+            b = kalan & -kalan
+            kalan ^= b
+            alt = m ^ b
+            # destek = adet / n; aynı adet aynı float'u verir, küçük pay yuvarlamaya karşı
+            if alt in destek and (not kapali or abs(destek[alt] - s) <= 1e-12 * s):
+                elenen.add(alt)
+    return np.array([m not in elenen for m in maskeler], dtype=bool)
+
+
+def kapali_kumeler(frequent_itemsets):
+    """Aynı destekli (bir fazla elemanlı) üst kümesi olmayan sık kümeler."""
+    return frequent_itemsets[_alt_kume_isaretle(frequent_itemsets, kapali=True)]
+
+
+def maksimal_kumeler(frequent_itemsets):
+    """Sık (bir fazla elemanlı) üst kümesi olmayan sık kümeler."""
+    return frequent_itemsets[_alt_kume_isaretle(frequent_itemsets, kapali=False)]
+
+
+def kume_filtresi(rules, kumeler):
+    """Öncül ∪ sonucu verilen kümelerden biri olan kurallar."""
+    izinli = set(kumeler["itemsets"])
+    secim = [a | c in izinli for a, c in zip(rules["antecedents"], rules["consequents"])]
+    return rules[np.array(secim, dtype=bool)]
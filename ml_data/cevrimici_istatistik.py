@@ -0,0 +1,513 @@
+"""
+CafeML – Tek Geçişli (Çevrimiçi) İstatistik ve Dağılım Sapması Raporu
+=====================================================================
+Sipariş verisini bellekte tutmadan, tek geçişte özetler ve iki veri
+setini (ör. 10M siparişlik sentetik set ↔ üretim dışa aktarımı) dağılım
+sapması açısından karşılaştırır.
+
+Tek geçişte toplananlar:
+    ciro           : toplam, ortalama / std (Welford), min / max, tutar histogramı
+    saat           : saatlik histogram + SAAT_DAGITIM'e göre sapma
+    sepet          : farklı ürün (kalem) sayısı ve toplam ürün adedi dağılımları
+    yas / hava / gün dağılımları
+    ürünler        : Space-Saving ağır vurucular (heavy hitters) taslağı;
+                     farklı ürün sayısı kapasiteyi aşmadıkça sayımlar kesindir,
+                     aşınca her ürünün hata payı (üst sınır) raporlanır
+
+Girdiler (biçim uzantıdan):
+    .arrow / .parquet : generate_dataset.py --bicim arrow/parquet (parti parti, vektörel)
+    .csv              : orders_summary.csv (satır satır)
+    .ndjson / .jsonl  : akis_simulator.py çıktısı (satır satır)
+    .json             : daha önce yazılmış istatistik raporu (yeniden sayılmaz)
+    --uret N          : dosya yazmadan doğrudan üreticiden (uret_akis)
+
+Sapma ölçüleri (boyut başına): PSI (population stability index),
+Jensen-Shannon ıraksaması (log2, [0, 1]) ve toplam değişim uzaklığı.
+PSI < 0.1 kararlı, < 0.25 orta, üstü belirgin sapma sayılır.
+
+Kullanım:
+    python cevrimici_istatistik.py orders.arrow                 # → istatistik_raporu.json
+    python cevrimici_istatistik.py orders_summary.csv --cikti gercek.json
+    python cevrimici_istatistik.py --uret 10000000 --motor vektorel
+    python cevrimici_istatistik.py sentetik.arrow --karsilastir uretim.parquet --esik 0.25
+    python cevrimici_istatistik.py a.json --karsilastir b.json  # kayıtlı raporlar
+"""
+
+import csv
+import heapq
+import itertools
+import json
+import math
+import os
+from collections import defaultdict
+
+import generate_dataset as gd
+
+SURUM = 1
+KAPASITE = 256           # ağır vurucu taslağında izlenen en fazla ürün
+ILK_K = 20               # rapordaki en sık ürün sayısı
+TUTAR_ARALIGI = 100      # tutar histogramı kutu genişliği (TL)
+PARTI = 65_536           # kolonsal girdide parti başına satır
+PSI_ESIKLERI = (0.1, 0.25)
+PSI_EPS = 1e-4           # boş kutular için PSI/JS tabanı
+CIKTI_RAPOR = "istatistik_raporu.json"
+CIKTI_SAPMA = "sapma_raporu.json"
+DAGILIMLAR = ("saat", "sepet_boyutu", "urun_sayisi", "yas_grubu", "hava_durumu", "gun",
+              "tutar_histogrami", "urunler")
+
+
+# ─── 1. AĞIR VURUCULAR ───
+class AgirVurucular:
+    """Space-Saving taslağı (Metwally vd.): en fazla kapasite sayaç, ağırlıklı ekleme.
+
+    Taslak dolunca yeni anahtar en küçük sayacın yerini alır ve o sayacı
+    hata payı olarak devralır: gerçek sayım ∈ [sayım − hata, sayım].
+    En küçük sayaç tembel güncellenen bir min-yığından bulunur: sayımlar
+    yalnız artar, eskimiş tepe güncel sayımıyla geri itilir; çıkarma
+    amortize O(log kapasite).
+    """
+
+    def __init__(self, kapasite: int = KAPASITE):
+        self.kapasite = kapasite
+        self.sayac: dict = {}
+        self.hata: dict = {}
+        self.kesin = True
+        self._yigin: list = []           # (yığına girdiği andaki sayım, sıra, anahtar)
+        self._sira = itertools.count()
+
+    def _en_az(self):
+        """En küçük sayaçlı anahtarı yığından çıkar: (anahtar, sayım)."""
+        yigin = self._yigin
+        while True:
+            eski, _, anahtar = yigin[0]
+            guncel = self.sayac[anahtar]
+            if eski == guncel:
+                heapq.heappop(yigin)
+                return anahtar, guncel
+            heapq.heapreplace(yigin, (guncel, next(self._sira), anahtar))
+
+    def ekle(self, anahtar, agirlik: int = 1):
+        sayac = self.sayac
+        if anahtar in sayac:
+            sayac[anahtar] += agirlik
+            return
+        taban = 0
+        if len(sayac) >= self.kapasite:
+            en_az, taban = self._en_az()
+            del sayac[en_az]
+            self.hata.pop(en_az, None)
+            self.hata[anahtar] = taban
+            self.kesin = False
+        sayac[anahtar] = taban + agirlik
+        heapq.heappush(self._yigin, (taban + agirlik, next(self._sira), anahtar))
+
+    def ilk(self, k: int = None) -> list:
+        """[(anahtar, sayım, hata payı), …] sayıma göre azalan (eşitlikte ilk görülen önce)."""
+        sirali = sorted(self.sayac.items(), key=lambda x: -x[1])
+        return [(a, c, self.hata.get(a, 0)) for a, c in sirali[:k]]
+
+
+# ─── 2. TEK GEÇİŞLİ TOPLAYICI ───
+class CevrimiciIstatistik:
+    """Siparişleri (sözlük, Kayit ya da kolonsal parti) tek geçişte özetler."""
+
+    def __init__(self, kapasite: int = KAPASITE):
+        self.adet = 0
+        self.ciro = 0.0
+        self._ortalama = 0.0
+        self._m2 = 0.0
+        self.tutar_min = math.inf
+        self.tutar_max = -math.inf
+        self.tutar_histogrami: dict = defaultdict(int)
+        self.saat = [0] * 24
+        self.sepet_boyutu: dict = defaultdict(int)
+        self.urun_sayisi: dict = defaultdict(int)
+        self.yas_freq: dict = defaultdict(int)
+        self.hava_freq: dict = defaultdict(int)
+        self.gun_freq: dict = defaultdict(int)
+        self.urunler = AgirVurucular(kapasite)
+
+    def _tutar_ekle(self, tutar: float):
+        self.ciro += tutar
+        delta = tutar - self._ortalama
+        self._ortalama += delta / self.adet
+        self._m2 += delta * (tutar - self._ortalama)
+        self.tutar_min = min(self.tutar_min, tutar)
+        self.tutar_max = max(self.tutar_max, tutar)
+        self.tutar_histogrami[int(tutar // TUTAR_ARALIGI)] += 1
+
+    def _ortak_ekle(self, tutar, saat, urun_sayisi, yas, hava, gun, urun_adlari):
+        self.adet += 1
+        self._tutar_ekle(tutar)
+        self.saat[saat] += 1
+        self.sepet_boyutu[len(urun_adlari)] += 1
+        self.urun_sayisi[urun_sayisi] += 1
+        self.yas_freq[yas] += 1
+        self.hava_freq[hava] += 1
+        self.gun_freq[gun] += 1
+        for ad in urun_adlari:
+            self.urunler.ekle(ad)
+
+    def ekle(self, s):
+        """Tek sipariş: siparis_uret() sözlüğü ya da generate_dataset.Kayit."""
+        if isinstance(s, gd.Kayit):
+            gun, dakika = divmod(s.dakika, 1440)
+            self._ortak_ekle(s.tutar, dakika // 60, s.urun_sayisi, gd.YAS_ADLARI[s.yas],
+                             gd.HAVA_ADLARI[s.hava], gd._gun_bilgisi(gun)[1],
+                             [gd.urun_adi(i) for i in s.sepet[0::2]])
+            return
+        if "sepet_ids" in s:
+            urun_adlari = [gd.urun_adi(i) for i in s["sepet_ids"]]
+        else:  # orders_summary.csv: "2 Lahmacun, 1 Ayran"
+            urun_adlari = [parca.partition(" ")[2]
+                           for parca in s["siparis_icerigi"].split(", ") if parca]
+        self._ortak_ekle(s["toplam_tutar"], s["saat"], s["urun_sayisi"], s["yas_grubu"],
+                         s["hava_durumu"], s["gun"], urun_adlari)
+
+    def parti_ekle(self, tutar, saat, urun_sayisi, sepet_boyutu, kategoriler: dict,
+                   urun_sayimlari: dict):
+        """Vektörel parti: NumPy dizileri + {alan: {değer: adet}} + {ürün: adet}."""
+        import numpy as np
+        n = len(tutar)
+        if n == 0:
+            return
+        # Welford partilerinin birleştirilmesi (Chan vd.)
+        parti_ort = float(tutar.mean())
+        parti_m2 = float(((tutar - parti_ort) ** 2).sum())
+        delta = parti_ort - self._ortalama
+        toplam = self.adet + n
+        self._ortalama += delta * n / toplam
+        self._m2 += parti_m2 + delta * delta * self.adet * n / toplam
+        self.adet = toplam
+        self.ciro += float(tutar.sum())
+        self.tutar_min = min(self.tutar_min, float(tutar.min()))
+        self.tutar_max = max(self.tutar_max, float(tutar.max()))
+        for hedef, degerler in ((self.tutar_histogrami, (tutar // TUTAR_ARALIGI).astype(np.int64)),
+                                (self.sepet_boyutu, sepet_boyutu), (self.urun_sayisi, urun_sayisi)):
+            for d, c in enumerate(np.bincount(degerler).tolist()):
+                if c:
+                    hedef[d] += c
+        for h, c in enumerate(np.bincount(saat, minlength=24).tolist()):
+            self.saat[h] += c
+        for alan, hedef in (("yas_grubu", self.yas_freq), ("hava_durumu", self.hava_freq),
+                            ("gun", self.gun_freq)):
+            for d, c in kategoriler[alan].items():
+                hedef[d] += c
+        for ad, c in urun_sayimlari.items():
+            self.urunler.ekle(ad, c)
+
+    def yazdir(self):
+        print("\n── İstatistikler ──────────────────────────")
+        print(f"Toplam sipariş  : {self.adet}")
+        print(f"Toplam ciro     : {self.ciro:,.0f} TL")
+        print(f"Ortalama sepet  : {self.ciro/self.adet:,.1f} TL")
+
+        # Ürün frekansı
+        print("\nEn çok satılan 5 ürün:")
+        for ad, cnt, _ in self.urunler.ilk(5):
+            print(f"  {ad:30s} {cnt:5d} adet")
+
+        print("\nYaş grubu dağılımı:")
+        for yg, cnt in sorted(self.yas_freq.items()):
+            print(f"  {yg:8s}: {cnt:4d} ({100*cnt/self.adet:.1f}%)")
+
+        print("\nHava durumu dağılımı:")
+        for hd, cnt in sorted(self.hava_freq.items()):
+            print(f"  {hd:15s}: {cnt:4d}")
+
+    def rapor(self, kaynak: str = None) -> dict:
+        """JSON'a yazılabilir rapor; dağılımlar {değer: adet} sözlükleridir."""
+        n = self.adet
+        saat = {str(h): c for h, c in enumerate(self.saat) if c}
+        rapor = {
+            "surum":   SURUM,
+            "kaynak":  kaynak,
+            "siparis": n,
+            "ciro": {
+                "toplam":   round(self.ciro, 2),
+                "ortalama": round(self._ortalama, 4) if n else None,
+                "std":      round(math.sqrt(self._m2 / (n - 1)), 4) if n > 1 else None,
+                "min":      self.tutar_min if n else None,
+                "max":      self.tutar_max if n else None,
+                "yuzdelikler": _histogram_yuzdelikleri(self.tutar_histogrami, n),
+            },
+            "saat":         saat,
+            "saat_uyumu":   dagilim_farki(saat, beklenen_saat_dagilimi()) if n else None,
+            "sepet_boyutu": _sirali(self.sepet_boyutu),
+            "urun_sayisi":  _sirali(self.urun_sayisi),
+            "yas_grubu":    _sirali(self.yas_freq),
+            "hava_durumu":  _sirali(self.hava_freq),
+            "gun":          _sirali(self.gun_freq),
+            "tutar_histogrami": {"aralik": TUTAR_ARALIGI, **_sirali(self.tutar_histogrami)},
+            "urunler": {
+                "kapasite": self.urunler.kapasite,
+                "kesin":    self.urunler.kesin,
+                "sayimlar": {a: c for a, c, _ in self.urunler.ilk()},
+                "hata_payi": {a: h for a, _, h in self.urunler.ilk() if h},
+                "ilk":      [{"urun": a, "siparis": c, "pay": round(c / n, 4)}
+                             for a, c, _ in self.urunler.ilk(ILK_K)],
+            },
+        }
+        return rapor
+
+
+def _sirali(sayim: dict) -> dict:
+    return {str(k): v for k, v in sorted(sayim.items())}
+
+
+def _histogram_yuzdelikleri(histogram: dict, n: int) -> dict:
+    """Kutu üst sınırlarından yaklaşık P50 / P90 / P99 (TL)."""
+    if not n:
+        return {}
+    yuzdelikler, birikimli = {}, 0
+    hedefler = iter((("p50", 0.5), ("p90", 0.9), ("p99", 0.99)))
+    ad, oran = next(hedefler)
+    for kutu, c in sorted(histogram.items()):
+        birikimli += c
+        while birikimli >= oran * n:
+            yuzdelikler[ad] = (kutu + 1) * TUTAR_ARALIGI
+            ad, oran = next(hedefler, (None, 2.0))
+        if ad is None:
+            break
+    return yuzdelikler
+
+
+# ─── 3. DAĞILIM SAPMASI ───
+def beklenen_saat_dagilimi() -> dict:
+    toplam = sum(gd.SAAT_DAGITIM.values())
+    return {str(h): p / toplam for h, p in gd.SAAT_DAGITIM.items()}
+
+
+def dagilim_farki(p: dict, q: dict) -> dict:
+    """İki {değer: adet/oran} dağılımı arasında PSI, JS (log2) ve toplam değişim uzaklığı."""
+    anahtarlar = sorted(set(p) | set(q))
+    p_top = sum(p.values()) or 1
+    q_top = sum(q.values()) or 1
+    psi = js = tvd = 0.0
+    en_buyuk = (None, 0.0)
+    for a in anahtarlar:
+        pa, qa = p.get(a, 0) / p_top, q.get(a, 0) / q_top
+        tvd += abs(pa - qa) / 2
+        if abs(pa - qa) > abs(en_buyuk[1]):
+            en_buyuk = (a, pa - qa)
+        pe, qe = max(pa, PSI_EPS), max(qa, PSI_EPS)
+        psi += (pe - qe) * math.log(pe / qe)
+        m = (pa + qa) / 2
+        if pa:
+            js += pa * math.log2(pa / m) / 2
+        if qa:
+            js += qa * math.log2(qa / m) / 2
+    return {"psi": round(psi, 6), "js": round(js, 6), "tvd": round(tvd, 6),
+            "en_buyuk_fark": {"deger": en_buyuk[0], "fark": round(en_buyuk[1], 6)},
+            "durum": sapma_durumu(psi)}
+
+
+def sapma_durumu(psi: float) -> str:
+    return "kararlı" if psi < PSI_ESIKLERI[0] else "orta" if psi < PSI_ESIKLERI[1] else "belirgin"
+
+
+def _dagilim(rapor: dict, boyut: str) -> dict:
+    if boyut == "urunler":
+        return rapor["urunler"]["sayimlar"]
+    if boyut == "tutar_histogrami":
+        return {k: v for k, v in rapor[boyut].items() if k != "aralik"}
+    return rapor[boyut]
+
+
+def sapma_raporu(a: dict, b: dict) -> dict:
+    """a (referans) ile b arasında boyut başına dağılım sapması."""
+    boyutlar = {d: dagilim_farki(_dagilim(a, d), _dagilim(b, d)) for d in DAGILIMLAR}
+    ort_a, ort_b = a["ciro"]["ortalama"], b["ciro"]["ortalama"]
+    return {
+        "a": a["kaynak"],
+        "b": b["kaynak"],
+        "siparis": {"a": a["siparis"], "b": b["siparis"]},
+        "ortalama_tutar": {"a": ort_a, "b": ort_b,
+                           "degisim": round(ort_b / ort_a - 1, 6) if ort_a else None},
+        "boyutlar": boyutlar,
+        "en_kotu": max(boyutlar, key=lambda d: boyutlar[d]["psi"]),
+    }
+
+
+# ─── 4. KAYNAKLAR ───
+def _kolonsal_partiler(yol: str):
+    """Arrow IPC (memory-map) / Parquet dosyasını PARTI satırlık RecordBatch'ler olarak oku."""
+    import pyarrow as pa
+    sutunlar = ["saat", "gun", "yas_grubu", "hava_durumu", "toplam_tutar", "urun_sayisi", "sepet"]
+    if yol.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        dosya = pq.ParquetFile(yol, memory_map=True)
+        yield dosya.schema_arrow
+        yield from dosya.iter_batches(batch_size=PARTI, columns=sutunlar)
+        return
+    okuyucu = pa.ipc.open_file(pa.memory_map(yol))
+    yield okuyucu.schema
+    for i in range(okuyucu.num_record_batches):
+        parti = okuyucu.get_batch(i)
+        for bas in range(0, parti.num_rows, PARTI):
+            yield parti.slice(bas, PARTI).select(sutunlar)
+
+
+def _sozluk_sayimi(sutun) -> dict:
+    import numpy as np
+    import pyarrow as pa
+    if pa.types.is_dictionary(sutun.type):
+        sayim = np.bincount(sutun.indices.to_numpy(zero_copy_only=False),
+                            minlength=len(sutun.dictionary))
+        return {d: int(c) for d, c in zip(sutun.dictionary.to_pylist(), sayim) if c}
+    return {d["values"]: d["counts"] for d in sutun.value_counts().to_pylist()}
+
+
+def kolonsal_istatistik(yol: str, kapasite: int = KAPASITE) -> CevrimiciIstatistik:
+    import numpy as np
+    partiler = _kolonsal_partiler(yol)
+    sema = next(partiler)
+    urunler = {int(i): ad for i, ad in json.loads(sema.metadata[b"urunler"]).items()}
+    ist = CevrimiciIstatistik(kapasite)
+    for parti in partiler:
+        sepet = parti.column("sepet")
+        ofset = sepet.offsets.to_numpy()
+        degerler = sepet.values.to_numpy(zero_copy_only=False)[ofset[0]:ofset[-1]]
+        urun_sayimi = np.bincount(degerler)
+        ist.parti_ekle(
+            parti.column("toplam_tutar").to_numpy(),
+            parti.column("saat").to_numpy().astype(np.int64),
+            parti.column("urun_sayisi").to_numpy().astype(np.int64),
+            np.diff(ofset),
+            {a: _sozluk_sayimi(parti.column(a)) for a in ("yas_grubu", "hava_durumu", "gun")},
+            {urunler[i]: int(c) for i, c in enumerate(urun_sayimi.tolist()) if c},
+        )
+    return ist
+
+
+def _csv_siparisleri(yol: str):
+    """orders_summary.csv satırlarını tipli sözlüklere çevir."""
+    with open(yol, newline="", encoding="utf-8") as f:
+        okuyucu = csv.DictReader(f)
+        eksik = {"saat", "toplam_tutar", "urun_sayisi", "siparis_icerigi"} - set(okuyucu.fieldnames or ())
+        if eksik:
+            raise ValueError(f"{yol} orders_summary.csv biçiminde değil (eksik: {', '.join(sorted(eksik))})")
+        for s in okuyucu:
+            s["saat"] = int(s["saat"])
+            s["toplam_tutar"] = float(s["toplam_tutar"])
+            s["urun_sayisi"] = int(s["urun_sayisi"])
+            yield s
+
+
+def _ndjson_siparisleri(yol: str):
+    with open(yol, encoding="utf-8") as f:
+        for satir in f:
+            if satir.strip():
+                yield json.loads(satir)
+
+
+def akis_istatistigi(siparisler, kapasite: int = KAPASITE) -> CevrimiciIstatistik:
+    """Sözlük / Kayit akışını tek geçişte topla."""
+    ist = CevrimiciIstatistik(kapasite)
+    for s in siparisler:
+        ist.ekle(s)
+    return ist
+
+
+def rapor_olustur(yol: str, kapasite: int = KAPASITE) -> dict:
+    """Girdi dosyasının raporu (.json ise kayıtlı rapor olarak yüklenir)."""
+    if not os.path.exists(yol):
+        raise FileNotFoundError(f"{yol} bulunamadı")
+    if yol.endswith(".json"):
+        with open(yol, encoding="utf-8") as f:
+            rapor = json.load(f)
+        if not isinstance(rapor, dict) or "surum" not in rapor:
+            raise ValueError(f"{yol} bir istatistik raporu değil")
+        return rapor
+    if yol.endswith((".arrow", ".parquet")):
+        ist = kolonsal_istatistik(yol, kapasite)
+    elif yol.endswith((".ndjson", ".jsonl")):
+        ist = akis_istatistigi(_ndjson_siparisleri(yol), kapasite)
+    elif yol.endswith(".csv"):
+        ist = akis_istatistigi(_csv_siparisleri(yol), kapasite)
+    else:
+        raise ValueError(f"Bilinmeyen girdi biçimi: {yol}")
+    return ist.rapor(kaynak=yol)
+
+
+def rapor_yaz(rapor: dict, yol: str):
+    with open(yol, "w", encoding="utf-8") as f:
+        json.dump(rapor, f, ensure_ascii=False, indent=2)
+
+
+def rapor_ozeti(rapor: dict):
+    c = rapor["ciro"]
+    print(f"\n── {rapor['kaynak']} ──")
+    print(f"Sipariş         : {rapor['siparis']:,}")
+    if not rapor["siparis"]:
+        return
+    print(f"Ciro            : {c['toplam']:,.0f} TL  (ortalama {c['ortalama']:,.1f}, "
+          f"std {c['std'] or 0:,.1f}, P90 ≤ {c['yuzdelikler'].get('p90', '-')})")
+    u = rapor["saat_uyumu"]
+    print(f"Saat ↔ SAAT_DAGITIM: PSI {u['psi']:.4f}, JS {u['js']:.4f} ({u['durum']}; "
+          f"en büyük fark saat {u['en_buyuk_fark']['deger']}: {u['en_buyuk_fark']['fark']:+.3f})")
+    ilk = ", ".join(f"{x['urun']} {x['pay']:.1%}" for x in rapor["urunler"]["ilk"][:5])
+    print(f"En sık ürünler  : {ilk}" + ("" if rapor["urunler"]["kesin"] else " (yaklaşık)"))
+
+
+def sapma_ozeti(sapma: dict):
+    print(f"\n── Dağılım sapması: {sapma['a']} → {sapma['b']} ──")
+    print(f"{'Boyut':<18} {'PSI':>8} {'JS':>8} {'TVD':>8}  Durum      En büyük fark")
+    for boyut, d in sapma["boyutlar"].items():
+        fark = d["en_buyuk_fark"]
+        fark = "-" if fark["deger"] is None else f"{fark['deger']} ({fark['fark']:+.3f})"
+        print(f"{boyut:<18} {d['psi']:>8.4f} {d['js']:>8.4f} {d['tvd']:>8.4f}  {d['durum']:<10} {fark}")
+    o = sapma["ortalama_tutar"]
+    if o["degisim"] is not None:
+        print(f"Ortalama tutar: {o['a']:,.1f} → {o['b']:,.1f} TL ({o['degisim']:+.1%})")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    parser = argparse.ArgumentParser(description="CafeML tek geçişli istatistik ve sapma raporu")
+    parser.add_argument("girdi", nargs="?", default=None,
+                        help=".arrow/.parquet, orders_summary.csv, .ndjson ya da kayıtlı rapor (.json)")
+    parser.add_argument("--uret", type=int, default=None, metavar="N",
+                        help="girdi yerine N siparişi doğrudan üreticiden say (dosya yazılmaz)")
+    parser.add_argument("--motor", choices=gd.MOTORLAR, default="vektorel", help="--uret motoru")
+    parser.add_argument("--tohum", type=int, default=gd.TOHUM, help="--uret tohumu")
+    parser.add_argument("--karsilastir", default=None, metavar="GIRDI",
+                        help="ikinci veri seti ya da rapor; dağılım sapması raporlanır")
+    parser.add_argument("--kapasite", type=int, default=KAPASITE,
+                        help="ağır vurucu taslağının izlediği en fazla ürün")
+    parser.add_argument("--esik", type=float, default=None, metavar="PSI",
+                        help="herhangi bir boyutun PSI'si bunu aşarsa çıkış kodu 1")
+    parser.add_argument("--cikti", default=None,
+                        help=f"rapor dosyası (varsayılan: {CIKTI_RAPOR}, --karsilastir ile {CIKTI_SAPMA})")
+    args = parser.parse_args()
+    if (args.girdi is None) == (args.uret is None):
+        parser.error("girdi ya da --uret (yalnız biri) gerekli")
+    if args.kapasite < 1:
+        parser.error("--kapasite en az 1 olmalı")
+
+    try:
+        if args.uret is not None:
+            akis = gd.uret_akis(args.uret, motor=args.motor, tohum=args.tohum, kompakt=True)
+            rapor = akis_istatistigi(akis, args.kapasite).rapor(
+                kaynak=f"uret_akis(n={args.uret}, motor={args.motor}, tohum={args.tohum})")
+        else:
+            rapor = rapor_olustur(args.girdi, args.kapasite)
+        rapor_ozeti(rapor)
+        if args.karsilastir is None:
+            yol = args.cikti or CIKTI_RAPOR
+            rapor_yaz(rapor, yol)
+            print(f"✓ {yol} kaydedildi")
+            raise SystemExit(0)
+        diger = rapor_olustur(args.karsilastir, args.kapasite)
+    except (FileNotFoundError, ValueError) as hata:
+        sys.exit(f"❌ {hata}")
+    rapor_ozeti(diger)
+    sapma = sapma_raporu(rapor, diger)
+    sapma_ozeti(sapma)
+    yol = args.cikti or CIKTI_SAPMA
+    rapor_yaz({"sapma": sapma, "a": rapor, "b": diger}, yol)
+    print(f"✓ {yol} kaydedildi")
+    if args.esik is not None and any(d["psi"] > args.esik for d in sapma["boyutlar"].values()):
+        print(f"❌ PSI > {args.esik} olan boyut var (en kötü: {sapma['en_kotu']})")
+        raise SystemExit(1)
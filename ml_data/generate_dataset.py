@@ -7,16 +7,34 @@ Toplantı notlarına göre üretilen gerçekçi sipariş verisi:
 - Birliktelik kurallarına uygun ağırlıklı ürün seçimi (Apriori)
 - Yaş demografisi, saat, gün, hava durumu, özel gün korelasyonu
 - Market sepet analizi için one-hot (transactional) format
+
+Kullanım:
+    python generate_dataset.py                      # klasik motor, 2000 sipariş
+    python generate_dataset.py -n 10000000 --motor vektorel
+    python generate_dataset.py -n 10000000 --motor vektorel --isci 32
+    python generate_dataset.py -n 10000000 --motor vektorel --akis   # sabit bellek
+    python generate_dataset.py -n 10000000 --motor vektorel --akis --bicim arrow
+
+Motorlar:
+    klasik   : siparis_uret() ile sipariş sipariş üretim (yalnızca stdlib)
+    vektorel : NumPy ile blok blok üretim (aynı dağılımlar, numpy gerekir)
 """
 
 import random
 import json
 import csv
 import math
+import hashlib
+import heapq
+import bisect
+import itertools
+from array import array
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import namedtuple
+from functools import lru_cache
 
-random.seed(42)
+TOHUM = 42
+random.seed(TOHUM)
 
 # ─────────────────────────────────────────────
 # 1. MENÜ TANIMI
@@ -255,14 +273,80 @@ def urun_adi(item_id):
 def urun_fiyat(item_id):
     return MENU[item_id][2]
 
-def siparis_uret(siparis_id: int, tarih: datetime, masa_id: int):
+# ── Kompakt sipariş kaydı ──
+# Üreticiler ve yazıcılar arasında siparişler sözlük yerine Kayit olarak
+# taşınır: kategorik alanlar küçük tamsayı kodları, zaman epoch dakikası,
+# sepet (ürün no, adet) çiftlerinden oluşan array("H") (ekleme sırasıyla;
+# ürün no ve adet < 65536, Arrow sepet sütunuyla aynı sınır). Metinler
+# (tarih, gün adı, ürün adları, one_hot) yalnız kaydi_coz() ile çıktı
+# anında üretilir.
+Kayit = namedtuple("Kayit", ["no", "masa", "dakika", "yas", "hava", "sicaklik", "kisi",
+                             "ozel", "ikram", "iptal", "sepet", "tutar", "urun_sayisi"])
+
+EPOCH = datetime(1970, 1, 1)
+YAS_ADLARI = [g[0] for g in YAS_GRUPLARI]
+HAVA_ADLARI = [h[0] for h in HAVA_DURUM_LISTESI]
+OZEL_ADLARI = [""] + sorted(set(OZEL_GUNLER.values()))
+_YAS_KODU = {ad: i for i, ad in enumerate(YAS_ADLARI)}
+_HAVA_KODU = {ad: i for i, ad in enumerate(HAVA_ADLARI)}
+_OZEL_KODU = {ad: i for i, ad in enumerate(OZEL_ADLARI)}
+_URUN_ADLARI = [MENU[i][0] if i in MENU else "" for i in range(max(MENU) + 1)]
+_ONE_HOT_SABLON = {MENU[i][0]: 0 for i in MENU}
+
+def epoch_dakika(tarih: datetime) -> int:
+    return (tarih - EPOCH) // timedelta(minutes=1)
+
+@lru_cache(maxsize=4096)
+def _gun_bilgisi(gun: int) -> tuple:
+    """Epoch günü → (tarih metni, gün adı, ay, hafta sonu)."""
+    tarih = EPOCH + timedelta(days=gun)
+    return tarih.strftime("%Y-%m-%d"), tarih.strftime("%A"), tarih.month, int(hafta_sonu_mu(tarih))
+
+def kaydi_coz(k: Kayit) -> dict:
+    """Kayit → siparis_uret() sözlüğü (aynı alanlar, aynı sıra)."""
+    gun, dakika = divmod(k.dakika, 1440)
+    tarih, gun_adi, ay, hs = _gun_bilgisi(gun)
+    saat, dakika = divmod(dakika, 60)
+    ids, miktarlar = k.sepet[0::2], k.sepet[1::2]
+    one_hot = _ONE_HOT_SABLON.copy()
+    for i in ids:
+        one_hot[_URUN_ADLARI[i]] = 1
+    return {
+        "siparis_id": f"ORD-{k.no:05d}",
+        "qr_masa_id": f"QR-M{k.masa:02d}",
+        "tarih_saat": f"{tarih} {saat:02d}:{dakika:02d}",
+        "gun":        gun_adi,
+        "saat":       saat,
+        "ay":         ay,
+        "hafta_sonu": hs,
+        "ozel_gun":   OZEL_ADLARI[k.ozel],
+        "yas_grubu":  YAS_ADLARI[k.yas],
+        "kisi_sayisi": k.kisi,
+        "hava_durumu": HAVA_ADLARI[k.hava],
+        "sicaklik_c":  k.sicaklik,
+        "siparis_icerigi": ", ".join(
+            f"{v} {_URUN_ADLARI[i]}" for i, v in sorted(zip(ids, miktarlar))),
+        "toplam_tutar":    k.tutar,
+        "ikram_var":  k.ikram,
+        "iptal_var":  k.iptal,
+        "urun_sayisi": k.urun_sayisi,
+        "one_hot":    one_hot,
+        "sepet_ids":  list(ids),
+    }
+
+def siparis_uret(siparis_id: int, tarih: datetime, masa_id: int, rng=random):
+    """Tek sipariş üret. rng: random modülü ya da random.Random örneği."""
+    return kaydi_coz(siparis_kaydi(siparis_id, tarih, masa_id, rng))
+
+def siparis_kaydi(siparis_id: int, tarih: datetime, masa_id: int, rng=random) -> Kayit:
+    """siparis_uret()'in kompakt hali; aynı rastgele çekimler, Kayit döner."""
     saat = tarih.hour
-    yas_grubu = random.choices(
+    yas_grubu = rng.choices(
         [g[0] for g in YAS_GRUPLARI],
         weights=[g[1] for g in YAS_GRUPLARI]
     )[0]
 
-    hava = random.choices(
+    hava = rng.choices(
         [h[0] for h in HAVA_DURUM_LISTESI],
         weights=[h[1] for h in HAVA_DURUM_LISTESI]
     )[0]
@@ -275,7 +359,7 @@ def siparis_uret(siparis_id: int, tarih: datetime, masa_id: int):
     elif ay in (6, 7, 8):
         sicaklik = min(38, sicaklik + 8)
 
-    kisi_sayisi = random.choices([1, 2, 3, 4, 5, 6],
+    kisi_sayisi = rng.choices([1, 2, 3, 4, 5, 6],
                                   weights=[10, 25, 20, 22, 15, 8])[0]
 
     ozel_gun = ozel_gun_kontrol(tarih)
@@ -290,133 +374,702 @@ def siparis_uret(siparis_id: int, tarih: datetime, masa_id: int):
     # Saat bazlı başlangıç ürünleri (kişi başı 1 tane)
     havuz = saat_bazli_urun_havuzu(saat, hava)
     for _ in range(kisi_sayisi):
-        secim = random.choice(havuz)
+        secim = rng.choice(havuz)
         ekle(secim)
 
     # Yaş bazlı ek ürünler
     yas_havuz = yas_bazli_ek_urunler(yas_grubu)
-    ek_sayisi = random.randint(0, max(1, kisi_sayisi - 1))
+    ek_sayisi = rng.randint(0, max(1, kisi_sayisi - 1))
     for _ in range(ek_sayisi):
-        ekle(random.choice(yas_havuz))
+        ekle(rng.choice(yas_havuz))
 
     # ─── Birliktelik kuralları uygula ───
     mevcut = list(sepet.keys())
     for tetik_id, eklenecek_id, olasilik in ASSOCIATION_RULES:
-        if tetik_id in mevcut and random.random() < olasilik:
+        if tetik_id in mevcut and rng.random() < olasilik:
             if eklenecek_id not in sepet:
-                ekle(eklenecek_id, random.randint(1, max(1, kisi_sayisi - 1)))
+                ekle(eklenecek_id, rng.randint(1, max(1, kisi_sayisi - 1)))
 
     # ─── Hava durumu modifikasyonu ───
-    if sicaklik < 10 and random.random() < 0.5:
+    if sicaklik < 10 and rng.random() < 0.5:
         # Çorba ekle
-        ekle(random.choice([16, 17, 18, 19]))
-    if sicaklik > 25 and random.random() < 0.6:
+        ekle(rng.choice([16, 17, 18, 19]))
+    if sicaklik > 25 and rng.random() < 0.6:
         # Soğuk içecek ekle / miktarı artır
-        ekle(random.choice([34, 40, 38, 39]))
+        ekle(rng.choice([34, 40, 38, 39]))
 
     # ─── Özel gün modifikasyonu ───
     if ozel_gun == "Sevgililer Günü" and kisi_sayisi == 2:
-        ekle(random.choice([29, 28, 31, 32]))  # tatlı
+        ekle(rng.choice([29, 28, 31, 32]))  # tatlı
         ekle(43)  # türk kahvesi
-    elif ozel_gun and random.random() < 0.3:
-        ekle(random.choice([28, 29, 30]))
+    elif ozel_gun and rng.random() < 0.3:
+        ekle(rng.choice([28, 29, 30]))
 
     # ─── Hafta sonu bonusu ───
-    if hs and random.random() < 0.3:
-        ekle(random.choice([25, 26, 28]))
+    if hs and rng.random() < 0.3:
+        ekle(rng.choice([25, 26, 28]))
 
     # ─── İkram/İptal simülasyonu (~%5) ───
     ikramlar = []
     iptal_sayisi = 0
     toplam_urun = sum(sepet.values())
-    if toplam_urun > 4 and random.random() < 0.05:
+    if toplam_urun > 4 and rng.random() < 0.05:
         # Rastgele 1 ürün ikram
-        ikram_urun = random.choice([42, 39, 34])  # çay/su/ayran
+        ikram_urun = rng.choice([42, 39, 34])  # çay/su/ayran
         ikramlar.append(ikram_urun)
-    if toplam_urun > 5 and random.random() < 0.03:
+    if toplam_urun > 5 and rng.random() < 0.03:
         iptal_sayisi = 1
 
     # ─── Toplam hesapla ───
     toplam_tutar = sum(urun_fiyat(k) * v for k, v in sepet.items())
     toplam_tutar = round(toplam_tutar, 2)
 
-    # ─── Sipariş içeriği metni ───
-    icerik_metni = ", ".join(
-        f"{v} {urun_adi(k)}" for k, v in sorted(sepet.items())
-    )
-
-    # ─── One-Hot (market basket) satırı ───
-    one_hot = {urun_adi(i): 0 for i in MENU}
-    for k in sepet:
-        one_hot[urun_adi(k)] = 1
-
-    return {
-        "siparis_id": f"ORD-{siparis_id:05d}",
-        "qr_masa_id": f"QR-M{masa_id:02d}",
-        "tarih_saat": tarih.strftime("%Y-%m-%d %H:%M"),
-        "gun":        tarih.strftime("%A"),
-        "saat":       saat,
-        "ay":         tarih.month,
-        "hafta_sonu": int(hs),
-        "ozel_gun":   ozel_gun if ozel_gun else "",
-        "yas_grubu":  yas_grubu,
-        "kisi_sayisi": kisi_sayisi,
-        "hava_durumu": hava,
-        "sicaklik_c":  sicaklik,
-        "siparis_icerigi": icerik_metni,
-        "toplam_tutar":    toplam_tutar,
-        "ikram_var":  int(len(ikramlar) > 0),
-        "iptal_var":  int(iptal_sayisi > 0),
-        "urun_sayisi": toplam_urun,
-        "one_hot":    one_hot,
-        "sepet_ids":  list(sepet.keys()),
-    }
+    return Kayit(siparis_id, masa_id, epoch_dakika(tarih), _YAS_KODU[yas_grubu],
+                 _HAVA_KODU[hava], sicaklik, kisi_sayisi, _OZEL_KODU[ozel_gun or ""],
+                 int(len(ikramlar) > 0), int(iptal_sayisi > 0),
+                 array("H", [x for k, v in sepet.items() for x in (k, v)]), toplam_tutar, toplam_urun)
 
 # ─────────────────────────────────────────────
 # 7. ANA ÜRETICI
 # ─────────────────────────────────────────────
-def uret(n: int = 2000, masa_sayisi: int = 20) -> list:
-    """n adet sipariş üret."""
+BASLANGIC_TARIHI = datetime(2026, 1, 1, 8, 0)
+BITIS_TARIHI     = datetime(2026, 3, 31, 22, 0)
+
+MOTORLAR = ("klasik", "vektorel")
+
+def uret(n: int = 2000, masa_sayisi: int = 20, motor: str = "klasik",
+         kompakt: bool = False) -> list:
+    """n adet sipariş üret. kompakt=True → sözlük yerine Kayit listesi."""
+    if motor == "vektorel":
+        return uret_vektorel(n, masa_sayisi, kompakt=kompakt)
+    if motor != "klasik":
+        raise ValueError(f"Bilinmeyen motor: {motor} (seçenekler: {', '.join(MOTORLAR)})")
+    kayitlar = _uret_klasik(n, masa_sayisi)
+    return kayitlar if kompakt else [kaydi_coz(k) for k in kayitlar]
+
+def _uret_klasik(n: int, masa_sayisi: int, rng=random, id_baslangic: int = 1) -> list:
+    """Zaman sıralı Kayit listesi."""
     siparisler = []
-    baslangic = datetime(2026, 1, 1, 8, 0)
-    bitis     = datetime(2026, 3, 31, 22, 0)
+    baslangic = BASLANGIC_TARIHI
+    bitis     = BITIS_TARIHI
     toplam_dk = int((bitis - baslangic).total_seconds() / 60)
 
     # Saatlik ağırlığa göre zaman noktaları seç
     saatler = list(SAAT_DAGITIM.keys())
     saat_agirlik = list(SAAT_DAGITIM.values())
 
-    for i in range(1, n + 1):
-        gun_offset = random.randint(0, (bitis - baslangic).days)
+    for i in range(id_baslangic, id_baslangic + n):
+        gun_offset = rng.randint(0, (bitis - baslangic).days)
         tarih = baslangic + timedelta(days=gun_offset)
 
         # Hafta sonu daha yoğun
-        if hafta_sonu_mu(tarih) and random.random() < 0.3:
+        if hafta_sonu_mu(tarih) and rng.random() < 0.3:
             gun_offset = min(gun_offset, (bitis - baslangic).days)
 
-        saat = random.choices(saatler, weights=saat_agirlik)[0]
-        dakika = random.randint(0, 59)
+        saat = rng.choices(saatler, weights=saat_agirlik)[0]
+        dakika = rng.randint(0, 59)
         tarih = tarih.replace(hour=saat, minute=dakika)
 
-        masa_id = random.randint(1, masa_sayisi)
-        siparisler.append(siparis_uret(i, tarih, masa_id))
+        masa_id = rng.randint(1, masa_sayisi)
+        siparisler.append(siparis_kaydi(i, tarih, masa_id, rng))
 
     # Tarihe göre sırala
-    siparisler.sort(key=lambda x: x["tarih_saat"])
+    siparisler.sort(key=lambda x: x.dakika)
     return siparisler
 
+# ─────────────────────────────────────────────
+# 7b. VEKTÖREL (NumPy) ÜRETİCİ
+# ─────────────────────────────────────────────
+# siparis_uret() ile aynı olasılık modelini bir sipariş bloğu için tek
+# seferde çizer. Sepet, (blok × ürün) boyutlu bir adet matrisi olarak
+# tutulur; birliktelik kuralları sipariş başına değil blok başına bir kez
+# (29 vektörel adım) uygulanır. Havuzlar ve ağırlıklar yukarıdaki
+# fonksiyon/tablolardan türetilir, böylece iki motor aynı modeli paylaşır.
+BLOK_BOYUTU = 100_000
+
+_vektorel_tablolar = None
+
+def takvim(gunler: list) -> dict:
+    """Gün tablosu: offset → tarih metni, gün adı, ay, hafta sonu, özel gün.
+
+    vektorel_blok_uret / blok_siparis_akisi'nin gun dizisi bu tabloya bakar;
+    varsayılan tablo BASLANGIC_TARIHI..BITIS_TARIHI günleridir.
+    """
+    import numpy as np
+    return {
+        "gun_sayisi":     len(gunler),
+        "gun_no":         np.array([(g - EPOCH).days for g in gunler]),  # epoch günü
+        "gun_tarih":      [g.strftime("%Y-%m-%d") for g in gunler],
+        "gun_adi":        [g.strftime("%A") for g in gunler],
+        "gun_ay":         np.array([g.month for g in gunler]),
+        "gun_hs":         np.array([hafta_sonu_mu(g) for g in gunler]),
+        "gun_ozel":       np.array([_OZEL_KODU[ozel_gun_kontrol(g) or ""] for g in gunler]),
+    }
+
+def _tablolari_hazirla():
+    """Vektörel motorun kullandığı sabit tabloları (bir kez) oluştur."""
+    global _vektorel_tablolar
+    if _vektorel_tablolar is not None:
+        return _vektorel_tablolar
+    import numpy as np
+
+    genislik = max(MENU) + 1  # sütun indeksi = ürün id
+    if genislik > 1 << 16:
+        raise ValueError(f"Ürün id'leri uint16 sınırını aşıyor (en büyük: {max(MENU)})")
+    fiyat = np.zeros(genislik)
+    for iid, (_, _, f, _, _) in MENU.items():
+        fiyat[iid] = f
+
+    def olasilik(agirliklar):
+        p = np.asarray(agirliklar, dtype=float)
+        return p / p.sum()
+
+    def havuz_matrisi(havuzlar):
+        uzunluk = np.array([len(h) for h in havuzlar])
+        matris = np.zeros((len(havuzlar), uzunluk.max()), dtype=np.int64)
+        for i, h in enumerate(havuzlar):
+            matris[i, :len(h)] = h
+        return matris, uzunluk
+
+    # Saat × hava → başlangıç havuzu indeksi
+    saatler = list(SAAT_DAGITIM.keys())
+    havuzlar: list = []
+    saat_hava_havuz = np.zeros((max(saatler) + 1, len(HAVA_ADLARI)), dtype=np.int64)
+    for saat in saatler:
+        for hi, hava in enumerate(HAVA_ADLARI):
+            havuz = saat_bazli_urun_havuzu(saat, hava)
+            if havuz not in havuzlar:
+                havuzlar.append(havuz)
+            saat_hava_havuz[saat, hi] = havuzlar.index(havuz)
+    saat_havuz, saat_havuz_uzunluk = havuz_matrisi(havuzlar)
+
+    yas_havuz, yas_havuz_uzunluk = havuz_matrisi(
+        [yas_bazli_ek_urunler(y) for y in YAS_ADLARI])
+
+    gun_sayisi = (BITIS_TARIHI - BASLANGIC_TARIHI).days + 1
+    gunler = [BASLANGIC_TARIHI + timedelta(days=d) for d in range(gun_sayisi)]
+
+    _vektorel_tablolar = {
+        "genislik":       genislik,
+        "fiyat":          fiyat,
+        "urun_adlari":    [MENU[i][0] if i in MENU else "" for i in range(genislik)],
+        "saatler":        np.array(saatler),
+        "saat_p":         olasilik(list(SAAT_DAGITIM.values())),
+        "yas_adlari":     YAS_ADLARI,
+        "yas_p":          olasilik([g[1] for g in YAS_GRUPLARI]),
+        "hava_adlari":    HAVA_ADLARI,
+        "hava_p":         olasilik([h[1] for h in HAVA_DURUM_LISTESI]),
+        "hava_sicaklik":  np.array([h[2] for h in HAVA_DURUM_LISTESI]),
+        "kisi_p":         olasilik([10, 25, 20, 22, 15, 8]),
+        "saat_hava_havuz": saat_hava_havuz,
+        "saat_havuz":     saat_havuz,
+        "saat_havuz_uzunluk": saat_havuz_uzunluk,
+        "yas_havuz":      yas_havuz,
+        "yas_havuz_uzunluk": yas_havuz_uzunluk,
+        "kurallar":       [(t, e, p) for t, e, p in ASSOCIATION_RULES],
+        "ozel_adlari":    OZEL_ADLARI,
+        **takvim(gunler),
+    }
+    return _vektorel_tablolar
+
+def vektorel_blok_uret(rng, n: int, masa_sayisi: int = 20, id_baslangic: int = 1,
+                       zaman: tuple = None, gun_tablosu: dict = None) -> dict:
+    """n siparişlik bir bloğu NumPy dizileri (sütunlar) olarak üret.
+
+    Dönen sözlükteki her dizi n uzunluğundadır; "adet" (n × ürün) sepet
+    matrisidir. Sıralama yapılmaz, siparis_id üretim sırasıdır.
+    zaman verilirse (gun, saat, dakika) dizileri çizilmez, aynen kullanılır.
+    gun_tablosu (takvim()) verilirse gun bu tablonun offset'idir.
+    """
+    import numpy as np
+    T = _tablolari_hazirla()
+    if gun_tablosu is not None:
+        T = {**T, **gun_tablosu}
+    satir = np.arange(n)
+
+    # ─── Zaman, masa ───
+    if zaman is None:
+        gun = rng.integers(0, T["gun_sayisi"], n)
+        saat = rng.choice(T["saatler"], size=n, p=T["saat_p"])
+        dakika = rng.integers(0, 60, n)
+    else:
+        gun, saat, dakika = zaman
+    masa = rng.integers(1, masa_sayisi + 1, n)
+
+    # ─── Demografi, hava ───
+    yas = rng.choice(len(T["yas_adlari"]), size=n, p=T["yas_p"])
+    hava = rng.choice(len(T["hava_adlari"]), size=n, p=T["hava_p"])
+    ay = T["gun_ay"][gun]
+    sicaklik = T["hava_sicaklik"][hava]
+    kis = np.isin(ay, (12, 1, 2))
+    yaz = np.isin(ay, (6, 7, 8))
+    sicaklik = np.where(kis, np.maximum(0, sicaklik - 5), sicaklik)
+    sicaklik = np.where(yaz, np.minimum(38, sicaklik + 8), sicaklik)
+
+    kisi = rng.choice(len(T["kisi_p"]), size=n, p=T["kisi_p"]) + 1
+    ozel = T["gun_ozel"][gun]
+    hs = T["gun_hs"][gun]
+    ust_sinir = np.maximum(1, kisi - 1)  # randint(…, max(1, kisi-1)) üst sınırı
+
+    adet = np.zeros((n, T["genislik"]), dtype=np.int32)
+
+    def topla(satirlar, urunler):
+        # np.add.at yerine bincount: tekrar eden (satır, ürün) çiftleri toplanır
+        duz = satirlar * T["genislik"] + urunler
+        adet.ravel()[:] += np.bincount(duz, minlength=adet.size).astype(adet.dtype)
+
+    def ekle(maske, urunler, miktar=1):
+        # Maskeli satırların her birine tek ürün → indeksler benzersiz
+        adet[satir[maske], np.broadcast_to(urunler, (n,))[maske]] += \
+            np.broadcast_to(miktar, (n,))[maske]
+
+    def havuzdan_cek(matris, uzunluk, havuz_idx, cekim_sayisi):
+        en_fazla = int(cekim_sayisi.max(initial=0))
+        if en_fazla == 0:
+            return
+        uz = uzunluk[havuz_idx]
+        j = (rng.random((n, en_fazla)) * uz[:, None]).astype(np.int64)
+        secim = matris[havuz_idx[:, None], j]
+        gecerli = np.arange(en_fazla)[None, :] < cekim_sayisi[:, None]
+        topla(np.broadcast_to(satir[:, None], secim.shape)[gecerli], secim[gecerli])
+
+    # Saat bazlı başlangıç ürünleri (kişi başı 1 tane)
+    havuz_idx = T["saat_hava_havuz"][saat, hava]
+    havuzdan_cek(T["saat_havuz"], T["saat_havuz_uzunluk"], havuz_idx, kisi)
+
+    # Yaş bazlı ek ürünler
+    ek_sayisi = rng.integers(0, ust_sinir + 1)
+    havuzdan_cek(T["yas_havuz"], T["yas_havuz_uzunluk"], yas, ek_sayisi)
+
+    # ─── Birliktelik kuralları (kural başına bir vektörel adım) ───
+    mevcut = adet > 0
+    for tetik_id, eklenecek_id, olasilik in T["kurallar"]:
+        ates = mevcut[:, tetik_id] & (rng.random(n) < olasilik) & (adet[:, eklenecek_id] == 0)
+        adet[ates, eklenecek_id] += rng.integers(1, ust_sinir[ates] + 1)
+
+    # ─── Hava durumu modifikasyonu ───
+    ekle((sicaklik < 10) & (rng.random(n) < 0.5),
+         rng.choice([16, 17, 18, 19], size=n))
+    ekle((sicaklik > 25) & (rng.random(n) < 0.6),
+         rng.choice([34, 40, 38, 39], size=n))
+
+    # ─── Özel gün modifikasyonu ───
+    sevgililer = (ozel == T["ozel_adlari"].index("Sevgililer Günü")) & (kisi == 2)
+    ekle(sevgililer, rng.choice([29, 28, 31, 32], size=n))
+    ekle(sevgililer, 43)
+    ekle(~sevgililer & (ozel > 0) & (rng.random(n) < 0.3),
+         rng.choice([28, 29, 30], size=n))
+
+    # ─── Hafta sonu bonusu ───
+    ekle(hs & (rng.random(n) < 0.3), rng.choice([25, 26, 28], size=n))
+
+    # ─── İkram/İptal simülasyonu ───
+    toplam_urun = adet.sum(axis=1)
+    ikram = (toplam_urun > 4) & (rng.random(n) < 0.05)
+    iptal = (toplam_urun > 5) & (rng.random(n) < 0.03)
+
+    return {
+        "siparis_no":  np.arange(id_baslangic, id_baslangic + n),
+        "masa":        masa,
+        "gun":         gun,
+        "saat":        saat,
+        "dakika":      dakika,
+        "dakika_ofset": gun * 1440 + saat * 60 + dakika,
+        "yas":         yas,
+        "hava":        hava,
+        "sicaklik":    sicaklik,
+        "kisi":        kisi,
+        "ozel":        ozel,
+        "ikram":       ikram,
+        "iptal":       iptal,
+        "adet":        adet,
+        "toplam_urun": toplam_urun,
+        "toplam_tutar": np.round(adet @ T["fiyat"], 2),
+    }
+
+def blok_siparisler(blok: dict) -> list:
+    """Vektörel bloğu siparis_uret() ile aynı biçimde sipariş sözlüklerine çevir."""
+    return list(blok_siparis_akisi(blok))
+
+def blok_siparis_akisi(blok: dict, gun_tablosu: dict = None):
+    """blok_siparisler()'in generator hali – sözlükler tek tek üretilir."""
+    T = _tablolari_hazirla()
+    if gun_tablosu is not None:
+        T = {**T, **gun_tablosu}
+    urun_adlari = T["urun_adlari"]
+    one_hot_sablon = {urun_adi(i): 0 for i in MENU}
+    adet = blok["adet"]
+    sutunlar = zip(
+        blok["siparis_no"].tolist(), blok["masa"].tolist(), blok["gun"].tolist(),
+        blok["saat"].tolist(), blok["dakika"].tolist(), blok["yas"].tolist(),
+        blok["hava"].tolist(), blok["sicaklik"].tolist(), blok["kisi"].tolist(),
+        blok["ozel"].tolist(), blok["ikram"].tolist(), blok["iptal"].tolist(),
+        blok["toplam_urun"].tolist(), blok["toplam_tutar"].tolist(),
+    )
+    for r, (no, masa, gun, saat, dakika, yas, hava, sicaklik, kisi,
+            ozel, ikram, iptal, toplam_urun, toplam_tutar) in enumerate(sutunlar):
+        satir = adet[r]
+        sepet_ids = satir.nonzero()[0].tolist()
+        miktarlar = satir[sepet_ids].tolist()
+        one_hot = one_hot_sablon.copy()
+        for k in sepet_ids:
+            one_hot[urun_adlari[k]] = 1
+        yield {
+            "siparis_id": f"ORD-{no:05d}",
+            "qr_masa_id": f"QR-M{masa:02d}",
+            "tarih_saat": f"{T['gun_tarih'][gun]} {saat:02d}:{dakika:02d}",
+            "gun":        T["gun_adi"][gun],
+            "saat":       saat,
+            "ay":         int(T["gun_ay"][gun]),
+            "hafta_sonu": int(T["gun_hs"][gun]),
+            "ozel_gun":   T["ozel_adlari"][ozel],
+            "yas_grubu":  T["yas_adlari"][yas],
+            "kisi_sayisi": kisi,
+            "hava_durumu": T["hava_adlari"][hava],
+            "sicaklik_c":  sicaklik,
+            "siparis_icerigi": ", ".join(
+                f"{v} {urun_adlari[k]}" for k, v in zip(sepet_ids, miktarlar)),
+            "toplam_tutar":    toplam_tutar,
+            "ikram_var":  int(ikram),
+            "iptal_var":  int(iptal),
+            "urun_sayisi": toplam_urun,
+            "one_hot":    one_hot,
+            "sepet_ids":  sepet_ids,
+        }
+
+def blok_kayitlari(blok: dict, gun_tablosu: dict = None):
+    """Bloğu Kayit'lara çevir (sözlük / metin kurulmaz); generator."""
+    import numpy as np
+    T = _tablolari_hazirla()
+    if gun_tablosu is not None:
+        T = {**T, **gun_tablosu}
+    adet = blok["adet"]
+    satir, sutun = np.nonzero(adet)
+    duz = np.empty(2 * len(sutun), dtype=np.uint16)
+    duz[0::2] = sutun
+    duz[1::2] = adet[satir, sutun]
+    ciftler = array("H")
+    ciftler.frombytes(duz.tobytes())
+    sinir = (2 * np.searchsorted(satir, np.arange(adet.shape[0] + 1))).tolist()
+    dakika = T["gun_no"][blok["gun"]] * 1440 + blok["saat"] * 60 + blok["dakika"]
+    sutunlar = zip(
+        blok["siparis_no"].tolist(), blok["masa"].tolist(), dakika.tolist(),
+        blok["yas"].tolist(), blok["hava"].tolist(), blok["sicaklik"].tolist(),
+        blok["kisi"].tolist(), blok["ozel"].tolist(), blok["ikram"].astype(int).tolist(),
+        blok["iptal"].astype(int).tolist(), blok["toplam_tutar"].tolist(),
+        blok["toplam_urun"].tolist(), sinir, sinir[1:],
+    )
+    for no, masa, dk, yas, hava, sic, kisi, ozel, ikram, iptal, tutar, urun, a, b in sutunlar:
+        yield Kayit(no, masa, dk, yas, hava, sic, kisi, ozel, ikram, iptal,
+                    ciftler[a:b], tutar, urun)
+
+def uret_vektorel(n: int = 2000, masa_sayisi: int = 20, tohum: int = TOHUM,
+                  kompakt: bool = False) -> list:
+    """uret() ile aynı çıktıyı NumPy blokları üzerinden üret."""
+    import numpy as np
+    rng = np.random.default_rng(tohum)
+    bloklar = []
+    for bas in range(0, n, BLOK_BOYUTU):
+        boyut = min(BLOK_BOYUTU, n - bas)
+        bloklar.append(vektorel_blok_uret(rng, boyut, masa_sayisi, id_baslangic=bas + 1))
+    if not bloklar:
+        return []
+    blok = {k: np.concatenate([b[k] for b in bloklar]) for k in bloklar[0]}
+
+    # Tarihe göre sırala (kararlı – aynı dakikada üretim sırası korunur)
+    sira = np.argsort(blok["dakika_ofset"], kind="stable")
+    blok = {k: v[sira] for k, v in blok.items()}
+    return list(blok_kayitlari(blok)) if kompakt else blok_siparisler(blok)
+
+# ─────────────────────────────────────────────
+# 7c. PARALEL (PARÇALI) ÜRETİCİ
+# ─────────────────────────────────────────────
+# 1..n aralığı sabit boyutlu parçalara bölünür; her parça temel tohumdan
+# türetilen kendi tohumuyla bağımsız üretilir. Parça sınırları işçi
+# sayısına bağlı olmadığından çıktı, kaç süreç kullanılırsa kullanılsın
+# aynıdır. Parçalar kendi içinde sıralı döner ve zaman sırasına göre
+# birleştirilir (eşit zamanlarda parça sırası korunur).
+PARCA_BOYUTU = 250_000
+
+def parca_tohumu(tohum: int, parca_no: int) -> int:
+    """Temel tohum + parça numarasından deterministik 64-bit tohum türet."""
+    ozet = hashlib.sha256(f"{tohum}:{parca_no}".encode()).digest()
+    return int.from_bytes(ozet[:8], "big")
+
+def parcalari_planla(n: int, parca_boyutu: int = PARCA_BOYUTU) -> list:
+    """[(parca_no, id_baslangic, boyut), …] listesi."""
+    return [(no, bas + 1, min(parca_boyutu, n - bas))
+            for no, bas in enumerate(range(0, n, parca_boyutu))]
+
+def _parca_uret(is_tanimi):
+    motor, parca_no, id_baslangic, boyut, masa_sayisi, tohum = is_tanimi
+    p_tohum = parca_tohumu(tohum, parca_no)
+    if motor == "vektorel":
+        import numpy as np
+        blok = vektorel_blok_uret(np.random.default_rng(p_tohum), boyut,
+                                  masa_sayisi, id_baslangic)
+        sira = np.argsort(blok["dakika_ofset"], kind="stable")
+        return {k: v[sira] for k, v in blok.items()}
+    return _uret_klasik(boyut, masa_sayisi, random.Random(p_tohum), id_baslangic)
+
+def uret_paralel(n: int = 2000, masa_sayisi: int = 20, motor: str = "klasik",
+                 isci_sayisi: int = None, tohum: int = TOHUM,
+                 parca_boyutu: int = PARCA_BOYUTU, kompakt: bool = False) -> list:
+    """uret()'in çok süreçli karşılığı. isci_sayisi=None → os.cpu_count().
+
+    Klasik parçalar süreçler arasında Kayit olarak taşınır.
+    """
+    if motor not in MOTORLAR:
+        raise ValueError(f"Bilinmeyen motor: {motor} (seçenekler: {', '.join(MOTORLAR)})")
+    isler = [(motor, no, bas, boyut, masa_sayisi, tohum)
+             for no, bas, boyut in parcalari_planla(n, parca_boyutu)]
+    if not isler:
+        return []
+
+    if isci_sayisi == 1 or len(isler) == 1:
+        parcalar = [_parca_uret(i) for i in isler]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+            parcalar = list(havuz.map(_parca_uret, isler))
+
+    if motor == "vektorel":
+        import numpy as np
+        blok = {k: np.concatenate([p[k] for p in parcalar]) for k in parcalar[0]}
+        sira = np.argsort(blok["dakika_ofset"], kind="stable")
+        blok = {k: v[sira] for k, v in blok.items()}
+        return list(blok_kayitlari(blok)) if kompakt else blok_siparisler(blok)
+    kayitlar = heapq.merge(*parcalar, key=lambda x: x.dakika)
+    return list(kayitlar) if kompakt else [kaydi_coz(k) for k in kayitlar]
+
+# ─────────────────────────────────────────────
+# 7d. AKIŞ (STREAMING) ÜRETİCİ
+# ─────────────────────────────────────────────
+# Siparişler zaman sırasıyla, bellekte biriktirilmeden üretilir. Zaman
+# noktası (gün, saat, dakika) uret() ile aynı dağılımdan gelir: sıralı
+# uniform sayılar ardışık olarak çekilir (Bentley & Saxe yöntemi) ve
+# dağılımın ters CDF'inden geçirilir. Ters CDF monoton olduğundan
+# zamanlar kendiliğinden sıralı çıkar; sonradan sıralamaya gerek kalmaz.
+AKIS_BLOK_BOYUTU = 20_000  # vektörel akışta bellekteki en fazla sipariş
+
+_SAAT_LISTESI = list(SAAT_DAGITIM.keys())
+_SAAT_KUMULATIF = [k / sum(SAAT_DAGITIM.values())
+                   for k in itertools.accumulate(SAAT_DAGITIM.values())]
+
+def zaman_konumu(u: float) -> tuple:
+    """[0, 1) aralığındaki u'yu (gun_offset, saat, dakika) üçlüsüne eşle."""
+    gun_sayisi = (BITIS_TARIHI - BASLANGIC_TARIHI).days + 1
+    x = u * gun_sayisi
+    gun = min(int(x), gun_sayisi - 1)
+    r = x - gun
+    h = min(bisect.bisect_right(_SAAT_KUMULATIF, r), len(_SAAT_LISTESI) - 1)
+    alt = _SAAT_KUMULATIF[h - 1] if h else 0.0
+    dakika = min(int((r - alt) / (_SAAT_KUMULATIF[h] - alt) * 60), 59)
+    return gun, _SAAT_LISTESI[h], max(dakika, 0)
+
+def _sirali_uniformlar(rng, n: int):
+    """n adet U(0,1) sayısını küçükten büyüğe, O(1) bellekle üret."""
+    cur = 0.0
+    for kalan in range(n, 0, -1):
+        cur += (1.0 - cur) * (1.0 - rng.random() ** (1.0 / kalan))
+        yield cur
+
+def _vektorel_zaman_blogu(rng, cur: float, boyut: int, kalan: int):
+    """kalan sıralı uniformdan sıradaki 'boyut' tanesini çek → (dizi, yeni_cur)."""
+    import numpy as np
+    if boyut == kalan:
+        ust = 1.0
+        ic = np.sort(rng.random(boyut))
+    else:
+        # boyut'uncu en küçük değer Beta(boyut, kalan-boyut+1) dağılır
+        ust = cur + (1.0 - cur) * rng.beta(boyut, kalan - boyut + 1)
+        ic = np.sort(rng.random(boyut - 1))
+    u = cur + (ust - cur) * ic
+    if boyut != kalan:
+        u = np.append(u, ust)
+    return u, ust
+
+def _vektorel_zaman_konumu(u):
+    import numpy as np
+    T = _tablolari_hazirla()
+    x = u * T["gun_sayisi"]
+    gun = np.minimum(x.astype(np.int64), T["gun_sayisi"] - 1)
+    r = x - gun
+    kum = np.array(_SAAT_KUMULATIF)
+    h = np.minimum(np.searchsorted(kum, r, side="right"), len(kum) - 1)
+    alt = np.where(h > 0, kum[h - 1], 0.0)
+    dakika = np.clip(((r - alt) / (kum[h] - alt) * 60).astype(np.int64), 0, 59)
+    return gun, T["saatler"][h], dakika
+
+def uret_akis(n: int = 2000, masa_sayisi: int = 20, motor: str = "klasik",
+              tohum: int = TOHUM, kompakt: bool = False):
+    """Siparişleri zaman sırasıyla tek tek üreten generator.
+
+    Bellek kullanımı n'den bağımsızdır (vektörel motorda bir blok kadar).
+    siparis_id'ler zaman sırasıyla verilir. kompakt=True → Kayit üretir.
+    """
+    if motor not in MOTORLAR:
+        raise ValueError(f"Bilinmeyen motor: {motor} (seçenekler: {', '.join(MOTORLAR)})")
+
+    if motor == "vektorel":
+        import numpy as np
+        rng = np.random.default_rng(tohum)
+        cur = 0.0
+        for bas in range(0, n, AKIS_BLOK_BOYUTU):
+            boyut = min(AKIS_BLOK_BOYUTU, n - bas)
+            u, cur = _vektorel_zaman_blogu(rng, cur, boyut, n - bas)
+            blok = vektorel_blok_uret(rng, boyut, masa_sayisi, id_baslangic=bas + 1,
+                                      zaman=_vektorel_zaman_konumu(u))
+            yield from blok_kayitlari(blok) if kompakt else blok_siparis_akisi(blok)
+        return
+
+    rng = random.Random(tohum)
+    for i, u in enumerate(_sirali_uniformlar(rng, n), start=1):
+        gun, saat, dakika = zaman_konumu(u)
+        tarih = (BASLANGIC_TARIHI + timedelta(days=gun)).replace(hour=saat, minute=dakika)
+        masa_id = rng.randint(1, masa_sayisi)
+        kayit = siparis_kaydi(i, tarih, masa_id, rng)
+        yield kayit if kompakt else kaydi_coz(kayit)
+
 # ─────────────────────────────────────────────
 # 8. KAYDET
 # ─────────────────────────────────────────────
-def kaydet(siparisler: list, cikti_klasor: str = "."):
+# ── Kolonsal (Arrow IPC / Parquet) çıktı ──
+# Tek dosya, tipli sütunlar. Kategorik alanlar sabit sözlüklerle
+# dictionary-encoded tutulur; sepet, ürün id'lerinden oluşan bir liste
+# sütunudur (ürün adları şema metadata'sında). Arrow IPC dosyası
+# sıkıştırmasız yazılır, böylece apriori_train.py onu memory-map ile
+# kopyasız açabilir. siparis_icerigi metni yazılmaz (sepetten türetilir).
+KOLONSAL_BICIMLER = {"arrow": "orders.arrow", "parquet": "orders.parquet"}
+BICIMLER = ("csv",) + tuple(KOLONSAL_BICIMLER)
+
+class KolonsalYazici:
+    """Siparişleri PARTI boyutlu kayıt grupları halinde kolonsal dosyaya yazar."""
+    PARTI = 65_536
+
+    def __init__(self, yol: str, bicim: str):
+        try:
+            import pyarrow as pa
+        except ImportError as hata:
+            raise RuntimeError("Kolonsal çıktı için pyarrow gerekli: pip install pyarrow") from hata
+        self.pa = pa
+        self.yol = yol
+        self.bicim = bicim
+        self.sozlukler = {
+            "gun":         [datetime(2024, 1, 1 + i).strftime("%A") for i in range(7)],
+            "ozel_gun":    OZEL_ADLARI,
+            "yas_grubu":   YAS_ADLARI,
+            "hava_durumu": HAVA_ADLARI,
+        }
+        self.kodlar = {k: {v: i for i, v in enumerate(d)} for k, d in self.sozlukler.items()}
+        self.tipler = {
+            "siparis_no":   pa.uint32(),
+            "masa_no":      pa.uint16(),
+            "tarih_saat":   pa.timestamp("s"),
+            "gun":          pa.dictionary(pa.int8(), pa.string()),
+            "saat":         pa.uint8(),
+            "ay":           pa.uint8(),
+            "hafta_sonu":   pa.bool_(),
+            "ozel_gun":     pa.dictionary(pa.int8(), pa.string()),
+            "yas_grubu":    pa.dictionary(pa.int8(), pa.string()),
+            "kisi_sayisi":  pa.uint8(),
+            "hava_durumu":  pa.dictionary(pa.int8(), pa.string()),
+            "sicaklik_c":   pa.int8(),
+            "toplam_tutar": pa.float64(),
+            "ikram_var":    pa.bool_(),
+            "iptal_var":    pa.bool_(),
+            "urun_sayisi":  pa.uint16(),
+            "sepet":        pa.list_(pa.uint16()),
+        }
+        urunler = {str(i): MENU[i][0] for i in sorted(MENU)}
+        self.sema = pa.schema(
+            [pa.field(ad, tip) for ad, tip in self.tipler.items()],
+            metadata={"urunler": json.dumps(urunler, ensure_ascii=False)},
+        )
+        self._sozluk_diziler = {k: pa.array(d, pa.string()) for k, d in self.sozlukler.items()}
+        self._tampon = {ad: [] for ad in self.tipler}
+        if bicim == "arrow":
+            self._yazici = pa.ipc.new_file(yol, self.sema)
+        else:
+            import pyarrow.parquet as pq
+            self._yazici = pq.ParquetWriter(yol, self.sema, compression="zstd")
+
+    def ekle(self, s: dict):
+        t = self._tampon
+        t["siparis_no"].append(int(s["siparis_id"][4:]))
+        t["masa_no"].append(int(s["qr_masa_id"][4:]))
+        t["tarih_saat"].append(s["tarih_saat"])
+        for alan in self.sozlukler:
+            t[alan].append(self.kodlar[alan][s[alan]])
+        for alan in ("saat", "ay", "kisi_sayisi", "sicaklik_c", "toplam_tutar", "urun_sayisi"):
+            t[alan].append(s[alan])
+        for alan in ("hafta_sonu", "ikram_var", "iptal_var"):
+            t[alan].append(bool(s[alan]))
+        t["sepet"].append(s["sepet_ids"])
+        if len(t["siparis_no"]) >= self.PARTI:
+            self._bosalt()
+
+    def _bosalt(self):
+        pa = self.pa
+        import pyarrow.compute as pc
+        t = self._tampon
+        if not t["siparis_no"]:
+            return
+        sutunlar = []
+        for ad, tip in self.tipler.items():
+            if ad in self.sozlukler:
+                dizi = pa.DictionaryArray.from_arrays(
+                    pa.array(t[ad], pa.int8()), self._sozluk_diziler[ad])
+            elif ad == "tarih_saat":
+                dizi = pc.strptime(pa.array(t[ad], pa.string()),
+                                   format="%Y-%m-%d %H:%M", unit="s")
+            else:
+                dizi = pa.array(t[ad], tip)
+            sutunlar.append(dizi)
+        self._yazici.write_batch(pa.RecordBatch.from_arrays(sutunlar, schema=self.sema))
+        self._tampon = {ad: [] for ad in self.tipler}
+
+    def kapat(self):
+        self._bosalt()
+        self._yazici.close()
+
+def kaydet(siparisler, cikti_klasor: str = ".", bicim: str = "csv",
+           istatistik_raporu: bool = False):
+    """Siparişleri tüm çıktı dosyalarına tek geçişte yaz.
+
+    siparisler liste ya da generator (ör. uret_akis()) olabilir; hiçbir
+    noktada tamamı bellekte tutulmaz. Öğeler sözlük ya da Kayit olabilir;
+    Kayit'lar yazılırken tek tek çözülür. bicim "arrow"/"parquet" ise
+    JSON/CSV dosyaları yerine tek bir kolonsal dosya yazılır.
+    İstatistikler aynı geçişte cevrimici_istatistik ile toplanır;
+    istatistik_raporu=True ise istatistik_raporu.json da yazılır.
+    """
     import os
+    from cevrimici_istatistik import CevrimiciIstatistik, CIKTI_RAPOR, rapor_yaz
     os.makedirs(cikti_klasor, exist_ok=True)
+    siparisler = (kaydi_coz(s) if isinstance(s, Kayit) else s for s in siparisler)
 
-    # ── 8a. orders_full.json (tüm detay) ──
-    json_path = f"{cikti_klasor}/orders_full.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(siparisler, f, ensure_ascii=False, indent=2)
-    print(f"✓ {json_path}  ({len(siparisler)} kayıt)")
+    if bicim in KOLONSAL_BICIMLER:
+        yol = f"{cikti_klasor}/{KOLONSAL_BICIMLER[bicim]}"
+        yazici = KolonsalYazici(yol, bicim)
+        istatistik = CevrimiciIstatistik()
+        for s in siparisler:
+            yazici.ekle(s)
+            istatistik.ekle(s)
+        yazici.kapat()
+        print(f"✓ {yol}  ({istatistik.adet} kayıt, {bicim})")
+        istatistik.yazdir()
+        if istatistik_raporu:
+            rapor_yaz(istatistik.rapor(kaynak=yol), f"{cikti_klasor}/{CIKTI_RAPOR}")
+            print(f"✓ {cikti_klasor}/{CIKTI_RAPOR}")
+        return
+    if bicim != "csv":
+        raise ValueError(f"Bilinmeyen biçim: {bicim} (seçenekler: {', '.join(BICIMLER)})")
+
+    json_path   = f"{cikti_klasor}/orders_full.json"
+    csv_path    = f"{cikti_klasor}/orders_summary.csv"
+    basket_path = f"{cikti_klasor}/market_basket.csv"
+    apr_path    = f"{cikti_klasor}/apriori_transactions.csv"
 
     # ── 8b. orders_summary.csv (özellik tablosu) ──
     csv_fields = [
@@ -425,68 +1078,89 @@ def kaydet(siparisler: list, cikti_klasor: str = "."):
         "hava_durumu","sicaklik_c","toplam_tutar",
         "ikram_var","iptal_var","urun_sayisi","siparis_icerigi"
     ]
-    csv_path = f"{cikti_klasor}/orders_summary.csv"
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=csv_fields)
-        writer.writeheader()
-        for s in siparisler:
-            writer.writerow({k: s[k] for k in csv_fields})
-    print(f"✓ {csv_path}")
-
-    # ── 8c. market_basket.csv (one-hot, Apriori için) ──
     urun_adlari = [MENU[i][0] for i in sorted(MENU.keys())]
-    basket_path = f"{cikti_klasor}/market_basket.csv"
-    with open(basket_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["siparis_id"] + urun_adlari)
-        for s in siparisler:
-            satir = [s["siparis_id"]] + [s["one_hot"].get(u, 0) for u in urun_adlari]
-            writer.writerow(satir)
-    print(f"✓ {basket_path}")
+    istatistik = CevrimiciIstatistik()
+
+    with open(json_path, "w", encoding="utf-8") as f_json, \
+         open(csv_path, "w", newline="", encoding="utf-8") as f_csv, \
+         open(basket_path, "w", newline="", encoding="utf-8") as f_basket, \
+         open(apr_path, "w", newline="", encoding="utf-8") as f_apr:
+        ozet_writer = csv.DictWriter(f_csv, fieldnames=csv_fields)
+        ozet_writer.writeheader()
+        basket_writer = csv.writer(f_basket)
+        basket_writer.writerow(["siparis_id"] + urun_adlari)
+        apr_writer = csv.writer(f_apr)
 
-    # ── 8d. apriori_transactions.csv (mlxtend formatı – liste olarak) ──
-    apr_path = f"{cikti_klasor}/apriori_transactions.csv"
-    with open(apr_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
+        f_json.write("[")
         for s in siparisler:
-            urunler = [urun_adi(i) for i in s["sepet_ids"]]
-            writer.writerow(urunler)
+            # ── 8a. orders_full.json (json.dump(…, indent=2) ile aynı biçim) ──
+            f_json.write(",\n  " if istatistik.adet else "\n  ")
+            f_json.write(json.dumps(s, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+
+            ozet_writer.writerow({k: s[k] for k in csv_fields})
+
+            # ── 8c. market_basket.csv (one-hot, Apriori için) ──
+            basket_writer.writerow(
+                [s["siparis_id"]] + [s["one_hot"].get(u, 0) for u in urun_adlari])
+
+            # ── 8d. apriori_transactions.csv (mlxtend formatı – liste olarak) ──
+            apr_writer.writerow([urun_adi(i) for i in s["sepet_ids"]])
+
+            istatistik.ekle(s)
+        f_json.write("\n]" if istatistik.adet else "]")
+
+    print(f"✓ {json_path}  ({istatistik.adet} kayıt)")
+    print(f"✓ {csv_path}")
+    print(f"✓ {basket_path}")
     print(f"✓ {apr_path}  (mlxtend TransactionEncoder formatı)")
 
     # ── 8e. İstatistik özeti ──
-    print("\n── İstatistikler ──────────────────────────")
-    print(f"Toplam sipariş  : {len(siparisler)}")
-    tutar_topla = sum(s["toplam_tutar"] for s in siparisler)
-    print(f"Toplam ciro     : {tutar_topla:,.0f} TL")
-    print(f"Ortalama sepet  : {tutar_topla/len(siparisler):,.1f} TL")
-
-    # Ürün frekansı
-    freq: dict = defaultdict(int)
-    for s in siparisler:
-        for iid in s["sepet_ids"]:
-            freq[iid] += 1
-    top5 = sorted(freq.items(), key=lambda x: -x[1])[:5]
-    print("\nEn çok satılan 5 ürün:")
-    for iid, cnt in top5:
-        print(f"  {urun_adi(iid):30s} {cnt:5d} adet")
-
-    yas_freq: dict = defaultdict(int)
-    for s in siparisler:
-        yas_freq[s["yas_grubu"]] += 1
-    print("\nYaş grubu dağılımı:")
-    for yg, cnt in sorted(yas_freq.items()):
-        print(f"  {yg:8s}: {cnt:4d} ({100*cnt/len(siparisler):.1f}%)")
-
-    hava_freq: dict = defaultdict(int)
-    for s in siparisler:
-        hava_freq[s["hava_durumu"]] += 1
-    print("\nHava durumu dağılımı:")
-    for hd, cnt in sorted(hava_freq.items()):
-        print(f"  {hd:15s}: {cnt:4d}")
+    istatistik.yazdir()
+    if istatistik_raporu:
+        rapor_yaz(istatistik.rapor(kaynak=csv_path), f"{cikti_klasor}/{CIKTI_RAPOR}")
+        print(f"✓ {cikti_klasor}/{CIKTI_RAPOR}")
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="CafeML sipariş veri seti üretici")
+    parser.add_argument("-n", "--siparis", type=int, default=2000, help="sipariş sayısı")
+    parser.add_argument("--masa", type=int, default=20, help="masa sayısı")
+    parser.add_argument("--motor", choices=MOTORLAR, default="klasik",
+                        help="üretim motoru (varsayılan: klasik)")
+    parser.add_argument("--cikti", default=".", help="çıktı klasörü")
+    parser.add_argument("--tohum", type=int, default=TOHUM, help="temel rastgelelik tohumu")
+    parser.add_argument("--isci", type=int, default=None,
+                        help="paralel (parçalı) üretim için süreç sayısı; "
+                             "0 = tüm çekirdekler, verilmezse tek süreç")
+    parser.add_argument("--bicim", choices=BICIMLER, default="csv",
+                        help="çıktı biçimi: csv (JSON + CSV dosyaları) ya da tek "
+                             "kolonsal dosya (arrow/parquet, pyarrow gerekir)")
+    parser.add_argument("--akis", action="store_true",
+                        help="siparişleri zaman sırasıyla akış halinde üretip yaz "
+                             "(sabit bellek)")
+    parser.add_argument("--istatistik-raporu", action="store_true",
+                        help="istatistikleri istatistik_raporu.json olarak da yaz "
+                             "(cevrimici_istatistik.py ile karşılaştırılabilir)")
+    args = parser.parse_args()
+
     print("CafeML – Türk Restoranı Dataset Üretici")
     print("=" * 45)
-    veri = uret(n=2000, masa_sayisi=20)
-    kaydet(veri, cikti_klasor=".")
+    if args.akis:
+        veri = uret_akis(n=args.siparis, masa_sayisi=args.masa, motor=args.motor,
+                         tohum=args.tohum, kompakt=True)
+    elif args.isci is not None:
+        veri = uret_paralel(n=args.siparis, masa_sayisi=args.masa, motor=args.motor,
+                            isci_sayisi=args.isci or None, tohum=args.tohum, kompakt=True)
+    elif args.motor == "vektorel":
+        veri = uret_vektorel(n=args.siparis, masa_sayisi=args.masa, tohum=args.tohum,
+                             kompakt=True)
+    else:
+        random.seed(args.tohum)
+        veri = uret(n=args.siparis, masa_sayisi=args.masa, kompakt=True)
+    try:
+        kaydet(veri, cikti_klasor=args.cikti, bicim=args.bicim,
+               istatistik_raporu=args.istatistik_raporu)
+    except RuntimeError as hata:
+        print(f"❌ {hata}")
+        raise SystemExit(1)
     print("\n✅ Dataset hazır! Sonraki adım: apriori_train.py çalıştırın.")
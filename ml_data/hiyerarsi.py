@@ -0,0 +1,74 @@
+"""
+CafeML – Çok Seviyeli (Kategori → Ürün) Madencilik
+==================================================
+generate_dataset.MENU her ürüne bir kategori verir ("Ana Yemek - Kebap",
+"İçecek - Soğuk", "Tatlı", …). Seyrek ürünler tek başına eşiği geçemese de
+kategorileri geçer; "Kebap → Soğuk İçecek" gibi kurallar kategori
+düzeyinde ucuza bulunur.
+
+1. Sepet, sipariş × kategori matrisine indirgenir (X · M > 0) ve
+   kategori_destek eşiğiyle Eclat çalıştırılır (~15 sütun, çok ucuz).
+2. Ürün düzeyinde Eclat yalnız kategori kümesi (1)'de sık olan ürün
+   kümelerine iner: bir ürün kümesinin desteği kategori kümesinin
+   desteğini aşamaz ve sık kategori kümeleri alt kümeye kapalıdır, bu
+   yüzden kısıtı ihlal eden dallar kesişim yapılmadan budanır
+   (madencilik.eclat grup kısıtı).
+
+kategori_destek ≤ urun_destek iken sonuç düz Eclat ile aynıdır (kısıt hiçbir
+sık kümeyi elemez). Asıl kazanç urun_destek'i kategori_destek'in altına
+indirip seyrek ürünleri yalnız sık kategori örüntüleri içinde aramaktır.
+"""
+
+import numpy as np
+
+from generate_dataset import MENU
+
+DIGER = "Diğer"   # MENU'de olmayan ürünlerin kategorisi
+
+
+_KATEGORILER = {ad: kategori for ad, kategori, *_ in MENU.values()}
+
+
+def urun_kategorisi(ad: str) -> str:
+    """Ürün adının MENU kategorisi; bench_hatti kopyaları ("Çay·3") asıl ürününkidir."""
+    return _KATEGORILER.get(ad.split("·")[0], DIGER)
+
+
+def kategori_eslemesi(urun_adlari: list):
+    """(kategori adları, sütun başına kategori no) – kategoriler ilk görülme sırasıyla."""
+    kategoriler = {}
+    sutun_kategorisi = np.array(
+        [kategoriler.setdefault(urun_kategorisi(ad), len(kategoriler)) for ad in urun_adlari],
+        dtype=np.int64)
+    return list(kategoriler), sutun_kategorisi
+
+
+def kategori_sepeti(X, sutun_kategorisi: np.ndarray, kategori_sayisi: int):
+    """Sipariş × kategori boolean CSR matrisi (siparişte kategoriden en az bir ürün)."""
+    from scipy.sparse import csr_matrix
+    M = csr_matrix((np.ones(len(sutun_kategorisi), dtype=np.int32),
+                    (np.arange(len(sutun_kategorisi)), sutun_kategorisi)),
+                   shape=(len(sutun_kategorisi), kategori_sayisi))
+    C = (X.tocsr().astype(np.int32) @ M).tocsr()
+    C.data[:] = 1
+    return C.astype(bool)
+
+
+def cok_seviyeli_madencilik(X, urun_adlari: list, kategori_destek: float,
+                            urun_destek: float, max_len: int = None, sayac: dict = None):
+    """Önce kategori, sonra sık kategori örüntüleri içinde ürün düzeyinde Eclat.
+
+    Dönüş: (kategori sık kümeleri, ürün sık kümeleri) – ikisi de mlxtend
+    biçimli (support, itemsets) tablolar.
+    """
+    from madencilik import eclat
+    kategori_adlari, sutun_kategorisi = kategori_eslemesi(urun_adlari)
+    C = kategori_sepeti(X, sutun_kategorisi, len(kategori_adlari))
+    kategori_kumeleri = eclat(C, kategori_adlari, kategori_destek, max_len)
+
+    no = {ad: i for i, ad in enumerate(kategori_adlari)}
+    izinli = {sum(1 << no[k] for k in kume) for kume in kategori_kumeleri["itemsets"]}
+    grup_biti = np.array([1 << int(k) for k in sutun_kategorisi], dtype=object)
+    urun_kumeleri = eclat(X, urun_adlari, urun_destek, max_len, sayac,
+                          grup_biti=grup_biti, izinli_gruplar=izinli)
+    return kategori_kumeleri, urun_kumeleri
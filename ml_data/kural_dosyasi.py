@@ -0,0 +1,210 @@
+"""
+CafeML – İkili Kural Dosyası
+============================
+apriori_train.py'nin yazdığı association_rules.bin biçimi. Sunucu süreçleri
+dosyayı memory-map ile açar; ayrıştırma yoktur, diziler doğrudan sayfa
+önbelleğinden okunur ve aynı makinedeki tüm işçiler tek kopyayı paylaşır.
+
+Düzen (little-endian, her dizi 64 bayt hizalı):
+    SIHIR (8 bayt) | başlık uzunluğu (uint64) | başlık JSON'u | diziler
+
+    başlık    : {"surum", "urunler": [ad, …] (ürün id = sıra), "kural_sayisi",
+                 "oncul_sayisi", "en_uzun", "diziler": {ad: [dtype, ofset, uzunluk]}}
+    support, confidence, lift, leverage, conviction : float64[R]
+    oncul_ofset, sonuc_ofset : uint32[R+1]  (kural i'nin id'leri ofset[i]:ofset[i+1])
+    oncul_id, sonuc_id       : uint16[…]    (ürün id listeleri)
+    sonuc_anahtar            : uint64[R]    (sonuç kümesinin özeti)
+    anahtar                  : uint64[A]    (farklı öncüllerin sıralı özetleri)
+    grup_ofset               : uint32[A+1]  (öncül j'nin kuralları grup_ofset[j]:grup_ofset[j+1])
+    confidence_sira          : uint32[R]    (her grup içinde confidence'a göre azalan kural no'ları)
+
+Kurallar öncül özetine, aynı öncülde lift'e göre azalan sıralıdır. Küme özeti,
+ürün id'lerinin splitmix64 karmalarının XOR'udur; eşleşmeler id listesiyle
+doğrulanır.
+"""
+
+import heapq
+import json
+import mmap
+from functools import reduce
+from itertools import combinations
+from operator import xor
+
+import numpy as np
+
+from oneri import OLCUTLER, Oneri
+
+SIHIR = b"CAFEKRL\x01"
+HIZALAMA = 64
+METRIKLER = ("support", "confidence", "lift", "leverage", "conviction")
+
+
+def _karma(ids) -> np.ndarray:
+    """Ürün id'lerinin splitmix64 karması (uint64, taşma modüler)."""
+    z = np.asarray(ids, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _kume_anahtarlari(ofset: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Ofset kodlu kümelerin özetleri: her kümedeki karmaların XOR'u."""
+    karma = _karma(ids)
+    bos = ofset[:-1] == ofset[1:]
+    bas = np.minimum(ofset[:-1], max(len(karma) - 1, 0))
+    anahtar = np.bitwise_xor.reduceat(karma, bas) if len(karma) else np.zeros(len(bas), np.uint64)
+    anahtar[bos] = 0
+    return anahtar
+
+
+def _ofset_kodla(kumeler: list, sutun_no: dict):
+    uzunluk = np.fromiter((len(k) for k in kumeler), dtype=np.uint32, count=len(kumeler))
+    ofset = np.zeros(len(kumeler) + 1, dtype=np.uint32)
+    np.cumsum(uzunluk, out=ofset[1:])
+    ids = np.fromiter((sutun_no[ad] for k in kumeler for ad in sorted(k)),
+                      dtype=np.uint16, count=int(ofset[-1]))
+    return ofset, ids
+
+
+def kural_dosyasi_yaz(rules, yol: str):
+    """mlxtend association_rules DataFrame'ini ikili kural dosyasına yaz."""
+    oncul = list(rules["antecedents"])
+    sonuc = list(rules["consequents"])
+    urunler = sorted({ad for k in oncul + sonuc for ad in k})
+    sutun_no = {ad: i for i, ad in enumerate(urunler)}
+
+    oncul_ofset, oncul_id = _ofset_kodla(oncul, sutun_no)
+    anahtar = _kume_anahtarlari(oncul_ofset, oncul_id)
+    metrik = {m: rules[m].to_numpy(dtype=np.float64) for m in METRIKLER}
+    sira = np.lexsort((-metrik["lift"], anahtar))  # öncül özeti, sonra lift azalan
+
+    oncul = [oncul[i] for i in sira]
+    sonuc = [sonuc[i] for i in sira]
+    oncul_ofset, oncul_id = _ofset_kodla(oncul, sutun_no)
+    sonuc_ofset, sonuc_id = _ofset_kodla(sonuc, sutun_no)
+    anahtar = anahtar[sira]
+    grup_bas = np.flatnonzero(np.r_[True, anahtar[1:] != anahtar[:-1]]) if len(anahtar) else \
+        np.zeros(0, dtype=np.int64)
+
+    diziler = {m: metrik[m][sira] for m in METRIKLER}
+    diziler.update({
+        "oncul_ofset": oncul_ofset, "oncul_id": oncul_id,
+        "sonuc_ofset": sonuc_ofset, "sonuc_id": sonuc_id,
+        "sonuc_anahtar": _kume_anahtarlari(sonuc_ofset, sonuc_id),
+        "anahtar": anahtar[grup_bas],
+        "grup_ofset": np.r_[grup_bas, len(anahtar)].astype(np.uint32),
+        "confidence_sira": np.lexsort((-diziler["confidence"], np.cumsum(
+            np.isin(np.arange(len(sira)), grup_bas)))).astype(np.uint32),
+    })
+
+    # başlık uzunluğu dizilerin ofsetlerine bağlı; ofsetleri göreli tutup sonra kaydır
+    tanim, konum = {}, 0
+    for ad, dizi in diziler.items():
+        tanim[ad] = [dizi.dtype.str, konum, len(dizi)]
+        konum += -(-dizi.nbytes // HIZALAMA) * HIZALAMA
+    baslik = {"surum": 1, "urunler": urunler, "kural_sayisi": len(sira),
+              "oncul_sayisi": len(grup_bas),
+              "en_uzun": int(np.diff(oncul_ofset).max()) if len(sira) else 0,
+              "diziler": tanim}
+    ham = json.dumps(baslik, ensure_ascii=False).encode("utf-8")
+    # ofsetler büyüyünce JSON uzar: dizi başına 16 basamaklık pay bırak
+    veri_bas = -(-(len(SIHIR) + 8 + len(ham) + 16 * len(tanim)) // HIZALAMA) * HIZALAMA
+    for t in tanim.values():
+        t[1] += veri_bas
+    ham = json.dumps(baslik, ensure_ascii=False).encode("utf-8")  # kaydırılmış ofsetlerle
+
+    with open(yol, "wb") as f:
+        f.write(SIHIR)
+        f.write(np.uint64(len(ham)).tobytes())
+        f.write(ham)
+        for ad, dizi in diziler.items():
+            f.write(b"\0" * (tanim[ad][1] - f.tell()))
+            f.write(np.ascontiguousarray(dizi).tobytes())
+
+
+class KuralDosyasi:
+    """İkili kural dosyasını memory-map ile açar; OneriIndeksi ile aynı oner() arayüzü."""
+
+    def __init__(self, yol: str):
+        # np.memmap dilimleri memmap alt sınıfıdır ve her erişimde ek maliyet getirir;
+        # mmap üzerine np.frombuffer ile düz ndarray görünümleri kurulur
+        with open(yol, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.bellek = np.frombuffer(self._mmap, dtype=np.uint8)
+        if bytes(self.bellek[:len(SIHIR)]) != SIHIR:
+            raise ValueError(f"{yol} bir CafeML kural dosyası değil")
+        uzunluk = int(self.bellek[len(SIHIR):len(SIHIR) + 8].view(np.uint64)[0])
+        bas = len(SIHIR) + 8
+        self.baslik = json.loads(bytes(self.bellek[bas:bas + uzunluk]).decode("utf-8"))
+        self.urunler = self.baslik["urunler"]
+        self.id = {ad: i for i, ad in enumerate(self.urunler)}
+        self.en_uzun = self.baslik["en_uzun"]
+        for ad, (dtype, ofset, adet) in self.baslik["diziler"].items():
+            dt = np.dtype(dtype)
+            setattr(self, ad, self.bellek[ofset:ofset + adet * dt.itemsize].view(dt))
+        self._urun_karmasi = [int(z) for z in _karma(np.arange(len(self.urunler)))]
+
+    def __len__(self) -> int:
+        return self.baslik["kural_sayisi"]
+
+    def _adlar(self, ofset, ids, i: int) -> tuple:
+        return tuple(self.urunler[j] for j in ids[ofset[i]:ofset[i + 1]])
+
+    def kural(self, i: int) -> dict:
+        """i. kural: öncül/sonuç adları ve metrikler."""
+        kayit = {"antecedent": self._adlar(self.oncul_ofset, self.oncul_id, i),
+                 "consequent": self._adlar(self.sonuc_ofset, self.sonuc_id, i)}
+        kayit.update({m: float(getattr(self, m)[i]) for m in METRIKLER})
+        return kayit
+
+    def eslesen_gruplar(self, sepet) -> list:
+        """Öncülü sepetin alt kümesi olan öncül gruplarının sıra numaraları."""
+        ids = sorted({self.id[ad] for ad in sepet if ad in self.id})
+        if not ids or not len(self.anahtar):
+            return []
+        # sepetin en_uzun boyutuna kadar tüm alt kümelerinin özetleri
+        secimler = [s for r in range(1, min(len(ids), self.en_uzun) + 1)
+                    for s in combinations(ids, r)]
+        karma = self._urun_karmasi
+        ozet = np.array([reduce(xor, (karma[j] for j in s)) for s in secimler], dtype=np.uint64)
+        yer = np.searchsorted(self.anahtar, ozet)
+        yer[yer == len(self.anahtar)] = 0
+        gruplar = []
+        for b in np.flatnonzero(self.anahtar[yer] == ozet).tolist():
+            g = int(yer[b])
+            ilk = self.grup_ofset[g]
+            # özet çakışmasına karşı grubun öncülünü doğrula
+            if self.oncul_id[self.oncul_ofset[ilk]:self.oncul_ofset[ilk + 1]].tolist() == list(secimler[b]):
+                gruplar.append(g)
+        return gruplar
+
+    def oner(self, sepet, k: int = 5, olcut: str = "lift") -> list:
+        """OneriIndeksi.oner ile aynı sonuç: sepetle kesişmeyen en iyi k sonuç.
+
+        Gruplar lift'e (confidence_sira ile confidence'a) göre azalan okunur;
+        her grupta k geçerli sonuçtan sonrası top-k'ya giremez.
+        """
+        if olcut not in OLCUTLER:
+            raise ValueError(f"olcut {OLCUTLER} içinden olmalı: {olcut!r}")
+        sepette = {self.id[ad] for ad in sepet if ad in self.id}
+        skor = getattr(self, olcut)
+        en_iyi = {}  # sonuç özeti → kural no
+        for g in self.eslesen_gruplar(sepet):
+            bas, son = int(self.grup_ofset[g]), int(self.grup_ofset[g + 1])
+            sira = range(bas, son) if olcut == "lift" else self.confidence_sira[bas:son].tolist()
+            alinan = 0
+            for i in sira:
+                if not sepette.isdisjoint(self.sonuc_id[self.sonuc_ofset[i]:self.sonuc_ofset[i + 1]].tolist()):
+                    continue
+                anahtar = int(self.sonuc_anahtar[i])
+                onceki = en_iyi.get(anahtar)
+                if onceki is None or skor[i] > skor[onceki]:
+                    en_iyi[anahtar] = i
+                alinan += 1
+                if alinan == k:
+                    break
+        secilen = heapq.nlargest(k, en_iyi.values(), key=lambda i: skor[i])
+        return [Oneri(self._adlar(self.sonuc_ofset, self.sonuc_id, i),
+                      self._adlar(self.oncul_ofset, self.oncul_id, i),
+                      float(self.support[i]), float(self.confidence[i]), float(self.lift[i]))
+                for i in secilen]
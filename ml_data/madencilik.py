@@ -0,0 +1,369 @@
+"""
+CafeML – Sık Ürün Kümesi Madenciliği
+====================================
+mlxtend.frequent_patterns.apriori ile aynı biçimde (support, itemsets)
+DataFrame'i üreten yerleşik madenciler. Çıktı doğrudan
+mlxtend.frequent_patterns.association_rules'a verilebilir.
+
+seyrek_apriori : CSR/CSC sepet matrisi üzerinde seviye seviye Apriori.
+                 İkililer seyrek XᵀX çarpımıyla, daha uzun kümeler sıralı
+                 tid-listesi (sipariş no) kesişimiyle sayılır; yoğun
+                 sipariş × ürün matrisi hiç kurulmaz.
+eclat          : Derinlik öncelikli Eclat. Her sık ürünün tid-listesi
+                 64 bitlik kelimelere paketlenmiş bir bit dizisidir;
+                 destek AND + popcount ile sayılır. Aday üretimi yoktur,
+                 düşük destek eşiklerinde (ör. 0.005) Apriori'den hızlıdır.
+paralel_apriori: Seviye seviye Apriori; aday destekleri süreç havuzunda
+                 sayılır. Bit tid-listeleri paylaşımlı bellekte (shared
+                 memory) tek kopya durur, her işçi siparişlerin bir
+                 dilimini sayar, sayımlar toplanır. Sonuç seri çalışmayla
+                 birebir aynıdır.
+segmentli_eclat: Aynı bit tid-listeleri üzerinde her segment (ör. gün
+                 dilimi) için ayrı Eclat; segment maskesiyle AND'lenir,
+                 veri bir kez okunur.
+destek_say     : Verilen ürün kümelerinin destek adetlerini bit
+                 tid-listeleriyle sayar (artımsal güncelleme için).
+
+eclat isteğe bağlı bir grup kısıtı alır (grup_biti + izinli_gruplar): her
+sütunun bir grubu (ör. menü kategorisi) vardır ve yalnız grup kümesi izinli
+olan ürün kümeleri aranır. İzinli aile alt kümeye kapalıysa (ör. sık kategori
+kümeleri) kısıtı ihlal eden önekin hiçbir genişlemesi izinli olamaz; dal
+kesişim yapılmadan budanır (hiyerarsi.py).
+
+seyrek_apriori / eclat / paralel_apriori isteğe bağlı bir sayac sözlüğü alır;
+her küme uzunluğu için desteği sayılan aday sayısı ona eklenir ({k: adet}).
+"""
+
+import numpy as np
+
+
+def _sonuc_tablosu(sonuclar: list, urun_adlari: list, n: int):
+    """[(ürün sütun no'ları, adet), …] → mlxtend biçimli DataFrame."""
+    import pandas as pd
+    return pd.DataFrame({
+        "support":  [adet / n for _, adet in sonuclar],
+        "itemsets": [frozenset(urun_adlari[j] for j in kume) for kume, _ in sonuclar],
+    })
+
+
+def _aday_say(sayac, k: int, adet: int):
+    if sayac is not None and adet:
+        sayac[k] = sayac.get(k, 0) + int(adet)
+
+
+def _aday_uret(onceki: list) -> list:
+    """Sıralı (k-1)'lilerden ortak öneke sahip çiftleri birleştirip k'lı aday üret.
+
+    Alt kümelerinden biri sık değilse aday elenir (Apriori budaması).
+    """
+    sik = set(onceki)
+    adaylar = []
+    for i, a in enumerate(onceki):
+        for b in onceki[i + 1:]:
+            if a[:-1] != b[:-1]:
+                break
+            aday = a + (b[-1],)
+            if all(aday[:j] + aday[j + 1:] in sik for j in range(len(aday) - 2)):
+                adaylar.append((aday, a, b))
+    return adaylar
+
+
+def seyrek_apriori(X, urun_adlari: list, min_support: float, max_len: int = None,
+                   sayac: dict = None):
+    """Seyrek sepet matrisinde sık ürün kümelerini bul.
+
+    X           : scipy.sparse matris (sipariş × ürün, boolean)
+    urun_adlari : X sütunlarının adları
+    Dönüş       : DataFrame[support, itemsets] (mlxtend apriori ile aynı)
+    """
+    X = X.tocsc()
+    X.sort_indices()
+    n = X.shape[0]
+    if n == 0:
+        return _sonuc_tablosu([], urun_adlari, 1)
+
+    # ── 1'li kümeler: sütun başına kalem sayısı ──
+    adetler = np.diff(X.indptr)
+    _aday_say(sayac, 1, len(adetler))
+    sik_sutunlar = np.flatnonzero(adetler / n >= min_support)
+    sonuclar = [((int(j),), int(adetler[j])) for j in sik_sutunlar]
+    if max_len == 1 or len(sik_sutunlar) < 2:
+        return _sonuc_tablosu(sonuclar, urun_adlari, n)
+
+    def tid(j):
+        return X.indices[X.indptr[j]:X.indptr[j + 1]]
+
+    # ── 2'li kümeler: sık sütunlarla XᵀX (seyrek) ──
+    alt = X[:, sik_sutunlar].astype(np.int32)
+    ikili = (alt.T @ alt).tocoo()
+    _aday_say(sayac, 2, np.count_nonzero(ikili.row < ikili.col))  # birlikte görülen çiftler
+    ust = (ikili.row < ikili.col) & (ikili.data / n >= min_support)
+    ciftler = sorted(
+        ((int(sik_sutunlar[r]), int(sik_sutunlar[c])), int(d))
+        for r, c, d in zip(ikili.row[ust], ikili.col[ust], ikili.data[ust])
+    )
+    sonuclar += ciftler
+    tidler = {kume: np.intersect1d(tid(kume[0]), tid(kume[1]), assume_unique=True)
+              for kume, _ in ciftler}
+
+    # ── k ≥ 3: aday üret, tid-listelerini kesiştir ──
+    k = 2
+    while tidler and (max_len is None or k < max_len):
+        k += 1
+        yeni = {}
+        adaylar = _aday_uret(sorted(tidler))
+        _aday_say(sayac, k, len(adaylar))
+        for aday, a, b in adaylar:
+            ortak = np.intersect1d(tidler[a], tidler[b], assume_unique=True)
+            if len(ortak) / n >= min_support:
+                yeni[aday] = ortak
+                sonuclar.append((aday, len(ortak)))
+        tidler = yeni
+
+    return _sonuc_tablosu(sonuclar, urun_adlari, n)
+
+
+# ─────────────────────────────────────────────
+# ECLAT (paketlenmiş bit tid-listeleri)
+# ─────────────────────────────────────────────
+def _popcount_fonksiyonu():
+    """Satır başına bit sayan fonksiyon (NumPy ≥ 2.0'da donanım popcount)."""
+    if hasattr(np, "bitwise_count"):
+        return lambda kelimeler: np.bitwise_count(kelimeler).sum(axis=-1, dtype=np.int64)
+    tablo = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return lambda kelimeler: tablo[kelimeler.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def bit_tidleri(X, sutunlar) -> np.ndarray:
+    """Seçili sütunların tid-listelerini (len(sutunlar) × ⌈n/64⌉) uint64 bit dizisine paketle."""
+    X = X.tocsc()
+    n = X.shape[0]
+    kelime = (n + 63) // 64
+    bitler = np.zeros((len(sutunlar), kelime * 8), dtype=np.uint8)
+    satir_maskesi = np.zeros(kelime * 64, dtype=bool)
+    for r, j in enumerate(sutunlar):
+        satirlar = X.indices[X.indptr[j]:X.indptr[j + 1]]
+        satir_maskesi[satirlar] = True
+        # bit sırası little-endian: sipariş t → bayt t//8, bit t%8
+        bitler[r] = np.packbits(satir_maskesi, bitorder="little")
+        satir_maskesi[satirlar] = False
+    return bitler.view(np.uint64)
+
+
+def destek_say(X, kumeler: list) -> np.ndarray:
+    """Verilen ürün kümelerinin (sütun no demetleri) X içindeki destek adetleri."""
+    sayimlar = np.zeros(len(kumeler), dtype=np.int64)
+    if not kumeler or X.shape[0] == 0:
+        return sayimlar
+    X = X.tocsc()
+    sutunlar = sorted({j for kume in kumeler for j in kume})
+    satir_no = {j: r for r, j in enumerate(sutunlar)}
+    bitler = bit_tidleri(X, sutunlar)
+    uzunluklar = np.array([len(k) for k in kumeler])
+    for k in np.unique(uzunluklar):
+        secim = np.flatnonzero(uzunluklar == k)
+        adaylar = np.array([[satir_no[j] for j in kumeler[i]] for i in secim], dtype=np.int64)
+        sayimlar[secim] = _dilim_say(bitler, 0, bitler.shape[1], adaylar)
+    return sayimlar
+
+
+def _bitlerden_eclat(bitler: np.ndarray, sutunlar: np.ndarray, n: int,
+                     min_support: float, max_len: int = None, sayac: dict = None,
+                     grup_biti: np.ndarray = None, izinli_gruplar: set = None) -> list:
+    """Tekil destekleri eşiği geçen sütunların bit dizilerinden Eclat; [(küme, adet), …].
+
+    grup_biti (sütun no → grubunun biti) verilirse yalnız grup maskesi
+    izinli_gruplar içinde olan kümelere genişletilir.
+    """
+    popcount = _popcount_fonksiyonu()
+    sonuclar = []
+
+    def genislet(onek: tuple, maske: int, ogeler: np.ndarray, oge_bitleri: np.ndarray):
+        # ogeler[i] önekle birlikte sık; her biri sonrakilerle tek adımda kesiştirilir
+        for i in range(len(ogeler) - 1):
+            sonrakiler = np.arange(i + 1, len(ogeler))
+            if grup_biti is None:
+                oge_maskesi = 0
+                kesisim = oge_bitleri[i] & oge_bitleri[i + 1:]
+            else:
+                # izinli olmayan grup kümesine giden dallar kesişimden önce budanır
+                oge_maskesi = maske | int(grup_biti[ogeler[i]])
+                izinli = [(oge_maskesi | int(g)) in izinli_gruplar
+                          for g in grup_biti[ogeler[i + 1:]].tolist()]
+                sonrakiler = sonrakiler[np.array(izinli, dtype=bool)]
+                if not len(sonrakiler):
+                    continue
+                kesisim = oge_bitleri[i] & oge_bitleri[sonrakiler]
+            _aday_say(sayac, len(onek) + 2, len(kesisim))
+            destek = popcount(kesisim)
+            sik = np.flatnonzero(destek / n >= min_support)
+            if not len(sik):
+                continue
+            yeni_onek = onek + (int(ogeler[i]),)
+            for j in sik:
+                sonuclar.append((yeni_onek + (int(ogeler[sonrakiler[j]]),), int(destek[j])))
+            if len(sik) > 1 and (max_len is None or len(yeni_onek) + 1 < max_len):
+                genislet(yeni_onek, oge_maskesi, ogeler[sonrakiler[sik]], kesisim[sik])
+
+    if len(sutunlar) > 1 and max_len != 1:
+        genislet((), 0, sutunlar, bitler)
+    return sonuclar
+
+
+def eclat(X, urun_adlari: list, min_support: float, max_len: int = None, sayac: dict = None,
+          grup_biti: np.ndarray = None, izinli_gruplar: set = None):
+    """Paketlenmiş bit tid-listeleriyle Eclat. Çıktı seyrek_apriori ile aynıdır.
+
+    grup_biti / izinli_gruplar: grup kısıtı (modül açıklaması); izinli aile
+    alt kümeye kapalı olmalıdır.
+    """
+    X = X.tocsc()
+    n = X.shape[0]
+    if n == 0:
+        return _sonuc_tablosu([], urun_adlari, 1)
+
+    adetler = np.diff(X.indptr)
+    _aday_say(sayac, 1, len(adetler))
+    sik_mi = adetler / n >= min_support
+    if grup_biti is not None:
+        sik_mi &= np.array([int(g) in izinli_gruplar for g in grup_biti.tolist()], dtype=bool)
+    sik_sutunlar = np.flatnonzero(sik_mi)
+    sonuclar = [((int(j),), int(adetler[j])) for j in sik_sutunlar]
+    if max_len == 1 or len(sik_sutunlar) < 2:
+        return _sonuc_tablosu(sonuclar, urun_adlari, n)
+
+    bitler = bit_tidleri(X, sik_sutunlar)
+    sonuclar += _bitlerden_eclat(bitler, sik_sutunlar, n, min_support, max_len, sayac,
+                                 grup_biti, izinli_gruplar)
+    return _sonuc_tablosu(sonuclar, urun_adlari, n)
+
+
+def segmentli_eclat(X, urun_adlari: list, segmentler: dict, min_support: float,
+                    max_len: int = None) -> dict:
+    """Her segment için Eclat; sepet matrisi bir kez okunur, bit dizileri bir kez kurulur.
+
+    segmentler : {segment adı: sipariş başına boolean maske}
+    Dönüş      : {segment adı: DataFrame[support, itemsets]} (destek segment içi orandır)
+    """
+    X = X.tocsc()
+    popcount = _popcount_fonksiyonu()
+    tum_bitler = bit_tidleri(X, range(X.shape[1]))
+    sonuc = {}
+    for ad, maske in segmentler.items():
+        n = int(np.count_nonzero(maske))
+        if n == 0:
+            sonuc[ad] = _sonuc_tablosu([], urun_adlari, 1)
+            continue
+        kelime = tum_bitler.shape[1]
+        segment_biti = np.zeros(kelime * 64, dtype=bool)
+        segment_biti[:len(maske)] = maske
+        segment_biti = np.packbits(segment_biti, bitorder="little").view(np.uint64)
+        # segmentin siparişlerine kısıtlanmış tid-listeleri
+        bitler = tum_bitler & segment_biti
+        adetler = popcount(bitler)
+        sik_sutunlar = np.flatnonzero(adetler / n >= min_support)
+        sonuclar = [((int(j),), int(adetler[j])) for j in sik_sutunlar]
+        sonuclar += _bitlerden_eclat(bitler[sik_sutunlar], sik_sutunlar, n, min_support, max_len)
+        sonuc[ad] = _sonuc_tablosu(sonuclar, urun_adlari, n)
+    return sonuc
+
+
+# ─────────────────────────────────────────────
+# PARALEL DESTEK SAYIMI (paylaşımlı bellek)
+# ─────────────────────────────────────────────
+DILIM_CARPANI = 4          # işçi başına sipariş dilimi sayısı
+ADAY_BELLEK = 1 << 25      # bir sayım adımında en fazla ~32 MB ara kesişim
+
+_isci_bitleri = None       # işçi süreçte paylaşımlı bit matrisi (görünüm)
+_isci_bellek = None        # SharedMemory nesnesi (referans tutulmalı)
+
+
+def _isci_baslat(bellek_adi: str, sekil: tuple):
+    global _isci_bitleri, _isci_bellek
+    from multiprocessing import shared_memory
+    _isci_bellek = shared_memory.SharedMemory(name=bellek_adi)
+    _isci_bitleri = np.ndarray(sekil, dtype=np.uint64, buffer=_isci_bellek.buf)
+
+
+def _dilim_say(bitler, kelime_bas: int, kelime_son: int, adaylar: np.ndarray) -> np.ndarray:
+    """adaylar (c × k, bit satır no'ları) için [kelime_bas, kelime_son) dilimindeki destekler."""
+    popcount = _popcount_fonksiyonu()
+    dilim = bitler[:, kelime_bas:kelime_son]
+    parti = max(1, ADAY_BELLEK // max(1, (kelime_son - kelime_bas) * 8))
+    sayimlar = np.empty(len(adaylar), dtype=np.int64)
+    for bas in range(0, len(adaylar), parti):
+        grup = adaylar[bas:bas + parti]
+        kesisim = dilim[grup[:, 0]].copy()
+        for t in range(1, grup.shape[1]):
+            kesisim &= dilim[grup[:, t]]
+        sayimlar[bas:bas + parti] = popcount(kesisim)
+    return sayimlar
+
+
+def _isci_say(is_tanimi):
+    kelime_bas, kelime_son, adaylar = is_tanimi
+    return _dilim_say(_isci_bitleri, kelime_bas, kelime_son, adaylar)
+
+
+def paralel_apriori(X, urun_adlari: list, min_support: float, isci_sayisi: int = None,
+                    max_len: int = None, sayac: dict = None):
+    """Aday desteklerini isci_sayisi süreçte sayan Apriori.
+
+    isci_sayisi=None → os.cpu_count(); 1 → aynı kod süreç açmadan çalışır.
+    Çıktı seyrek_apriori / eclat ile aynıdır.
+    """
+    import os
+    X = X.tocsc()
+    n = X.shape[0]
+    if n == 0:
+        return _sonuc_tablosu([], urun_adlari, 1)
+
+    adetler = np.diff(X.indptr)
+    _aday_say(sayac, 1, len(adetler))
+    sik_sutunlar = np.flatnonzero(adetler / n >= min_support)
+    sonuclar = [((int(j),), int(adetler[j])) for j in sik_sutunlar]
+    if max_len == 1 or len(sik_sutunlar) < 2:
+        return _sonuc_tablosu(sonuclar, urun_adlari, n)
+
+    bitler = bit_tidleri(X, sik_sutunlar)
+    kelime = bitler.shape[1]
+    isci_sayisi = isci_sayisi or os.cpu_count() or 1
+    dilim_sayisi = min(kelime, isci_sayisi * DILIM_CARPANI)
+    sinirlar = np.linspace(0, kelime, dilim_sayisi + 1).astype(int)
+    dilimler = [(int(a), int(b)) for a, b in zip(sinirlar[:-1], sinirlar[1:]) if b > a]
+
+    havuz = bellek = None
+    if isci_sayisi > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        bellek = shared_memory.SharedMemory(create=True, size=bitler.nbytes)
+        np.ndarray(bitler.shape, dtype=np.uint64, buffer=bellek.buf)[:] = bitler
+        havuz = ProcessPoolExecutor(max_workers=isci_sayisi, initializer=_isci_baslat,
+                                    initargs=(bellek.name, bitler.shape))
+
+    def say(adaylar: np.ndarray) -> np.ndarray:
+        if havuz is None:
+            return sum(_dilim_say(bitler, a, b, adaylar) for a, b in dilimler)
+        return sum(havuz.map(_isci_say, [(a, b, adaylar) for a, b in dilimler]))
+
+    try:
+        # Seviye 2: tüm sık ürün çiftleri; k ≥ 3: Apriori aday üretimi
+        m = len(sik_sutunlar)
+        onceki = [(a,) for a in range(m)]
+        adaylar = [(a, b) for a in range(m) for b in range(a + 1, m)]
+        k = 2
+        while adaylar and (max_len is None or k <= max_len):
+            _aday_say(sayac, k, len(adaylar))
+            destekler = say(np.array(adaylar, dtype=np.int64))
+            onceki = [aday for aday, d in zip(adaylar, destekler) if d / n >= min_support]
+            sonuclar += [(tuple(int(sik_sutunlar[i]) for i in aday), int(d))
+                         for aday, d in zip(adaylar, destekler) if d / n >= min_support]
+            adaylar = [aday for aday, _, _ in _aday_uret(onceki)]
+            k += 1
+    finally:
+        if havuz is not None:
+            havuz.shutdown()
+            bellek.close()
+            bellek.unlink()
+
+    return _sonuc_tablosu(sonuclar, urun_adlari, n)
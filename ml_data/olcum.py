@@ -0,0 +1,203 @@
+"""
+CafeML – Aşama Ölçümü ve Çalıştırma Raporu
+==========================================
+apriori_train.py ve bench_hatti.py için ortak ölçüm katmanı. Her aşama için:
+
+    sure_sn      : duvar saati süresi
+    cpu_sn       : süreç CPU süresi (işçi süreçleri hariç)
+    tepe_rss_mb  : aşama boyunca tepe RSS (VmHWM; Linux'ta aşama başında
+                   /proc/self/clear_refs ile sıfırlanır, başka sistemlerde
+                   sürecin o ana kadarki tepesi – tepe_asamaya_ozel=False)
+    rss_mb       : aşama sonundaki RSS (tutulan bellek)
+
+İsteğe bağlı:
+    profil=True      → cProfile tüm çalıştırma boyunca açık; rapora en pahalı
+                       fonksiyonlar, yanına <rapor>.prof (snakeviz / pstats)
+    bellek_izi=True  → tracemalloc; aşama başına Python/numpy tahsis tepesi
+                       ve rapora en çok bellek ayıran satırlar
+
+Kullanım:
+    olcer = Olcer(profil=args.profil)
+    ek = olcer.baslat("oku")          # önceki aşamayı kapatır
+    ek["siparis"] = X.shape[0]
+    with olcer.asama("madencilik") as ek:
+        ...
+    olcer.rapor_yaz("egitim_raporu.json", kural_sayisi=len(rules))
+"""
+
+import json
+import os
+import platform
+import time
+from contextlib import contextmanager
+
+PROFIL_SATIR = 25      # rapordaki en pahalı fonksiyon sayısı
+BELLEK_IZI_SATIR = 15  # rapordaki en çok ayıran satır sayısı
+
+
+def _tepe_sifirla() -> bool:
+    """Sürecin tepe RSS'ini (VmHWM) sıfırla; desteklenmiyorsa False."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _proc_durum(alan: str):
+    try:
+        with open("/proc/self/status") as f:
+            for satir in f:
+                if satir.startswith(alan):
+                    return int(satir.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def tepe_rss_mb() -> float:
+    tepe = _proc_durum("VmHWM:")
+    if tepe is not None:
+        return tepe
+    import resource
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return tepe / (1 << 20) if platform.system() == "Darwin" else tepe / 1024
+
+
+def ortam_bilgisi() -> dict:
+    """Sonuçları sürümler arasında karşılaştırmak için çalışma ortamı."""
+    import subprocess
+    surumler = {}
+    for paket in ("numpy", "pandas", "scipy", "mlxtend", "pyarrow"):
+        try:
+            surumler[paket] = __import__(paket).__version__
+        except ImportError:
+            surumler[paket] = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "zaman":    time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit":   commit,
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "cpu":      os.cpu_count(),
+        "paketler": surumler,
+    }
+
+
+class Olcer:
+    """Aşama başına duvar / CPU süresi ve tepe RSS biriktirir."""
+
+    def __init__(self, profil: bool = False, bellek_izi: bool = False, **ortak):
+        self.ortak = ortak
+        self.satirlar = []
+        self._acik = None
+        self._baslangic = time.perf_counter()
+        self.profil = None
+        self.bellek_izi = bellek_izi
+        if bellek_izi:
+            import tracemalloc
+            tracemalloc.start()
+        if profil:
+            import cProfile
+            self.profil = cProfile.Profile()
+            self.profil.enable()
+
+    def baslat(self, ad: str) -> dict:
+        """Açık aşamayı kapatıp yenisini başlat; aşamaya sayım eklemek için sözlük döner."""
+        self.bitir()
+        ek = {}
+        ozel = _tepe_sifirla()
+        if self.bellek_izi:
+            import tracemalloc
+            tracemalloc.reset_peak()
+        self._acik = (ad, ek, time.perf_counter(), time.process_time(), ozel)
+        return ek
+
+    def bitir(self):
+        if self._acik is None:
+            return
+        ad, ek, bas, cpu, ozel = self._acik
+        self._acik = None
+        satir = {
+            **self.ortak,
+            "asama":        ad,
+            "sure_sn":      round(time.perf_counter() - bas, 4),
+            "cpu_sn":       round(time.process_time() - cpu, 4),
+            "tepe_rss_mb":  round(tepe_rss_mb(), 1),
+            "tepe_asamaya_ozel": ozel,
+        }
+        rss = _proc_durum("VmRSS:")
+        if rss is not None:
+            satir["rss_mb"] = round(rss, 1)
+        if self.bellek_izi:
+            import tracemalloc
+            satir["tracemalloc_tepe_mb"] = round(tracemalloc.get_traced_memory()[1] / (1 << 20), 1)
+        self.satirlar.append({**satir, **ek})
+
+    @contextmanager
+    def asama(self, ad: str):
+        ek = self.baslat(ad)
+        try:
+            yield ek
+        finally:
+            self.bitir()
+
+    def ozet_yazdir(self):
+        print("\n── Aşamalar ──────────────────────────────────")
+        print(f"{'Aşama':<18} {'Süre (s)':>9} {'CPU (s)':>9} {'Tepe MB':>8}")
+        for s in self.satirlar:
+            print(f"{s['asama']:<18} {s['sure_sn']:>9.3f} {s['cpu_sn']:>9.3f} {s['tepe_rss_mb']:>8.1f}")
+
+    def _profil_ozeti(self, prof_yolu: str) -> list:
+        import pstats
+        self.profil.disable()
+        self.profil.dump_stats(prof_yolu)
+        istatistik = pstats.Stats(self.profil)
+        satirlar = []
+        for (dosya, satir, fonk), (_, cagri, toplam, kumulatif, _) in istatistik.stats.items():
+            satirlar.append({
+                "fonksiyon":     f"{os.path.basename(dosya)}:{satir}({fonk})",
+                "cagri":         cagri,
+                "toplam_sn":     round(toplam, 4),
+                "kumulatif_sn":  round(kumulatif, 4),
+            })
+        satirlar.sort(key=lambda s: s["kumulatif_sn"], reverse=True)
+        return satirlar[:PROFIL_SATIR]
+
+    def _bellek_izi_ozeti(self) -> list:
+        import tracemalloc
+        anlik = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        return [{"yer": str(s.traceback[0]), "mb": round(s.size / (1 << 20), 2), "adet": s.count}
+                for s in anlik.statistics("lineno")[:BELLEK_IZI_SATIR]]
+
+    def rapor(self, prof_yolu: str = None, **ek) -> dict:
+        """Açık aşamayı kapatıp çalıştırma raporunu döndür (profil/izleme burada durur)."""
+        self.bitir()
+        rapor = {
+            "ortam":        ortam_bilgisi(),
+            **ek,
+            "toplam_sure_sn": round(time.perf_counter() - self._baslangic, 4),
+            "tepe_rss_mb":  max((s["tepe_rss_mb"] for s in self.satirlar), default=None),
+            "asamalar":     self.satirlar,
+        }
+        if self.profil is not None and prof_yolu:
+            rapor["profil"] = {"dosya": prof_yolu, "en_pahali": self._profil_ozeti(prof_yolu)}
+            self.profil = None
+        if self.bellek_izi:
+            rapor["bellek_izi"] = self._bellek_izi_ozeti()
+            self.bellek_izi = False
+        return rapor
+
+    def rapor_yaz(self, yol: str, **ek) -> dict:
+        """Raporu JSON olarak yaz; profil açıksa yanına <yol>.prof."""
+        rapor = self.rapor(prof_yolu=os.path.splitext(yol)[0] + ".prof", **ek)
+        with open(yol, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2, default=str)
+        return rapor
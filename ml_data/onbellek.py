@@ -0,0 +1,84 @@
+"""
+CafeML – Sık Küme Önbelleği
+===========================
+apriori_train.py aynı sepet dosyası ve aynı madencilik parametreleriyle
+tekrar çalıştığında (ör. yalnız güven/lift eşiği değiştiğinde) sık kümeleri
+yeniden madenlemek yerine diskten yükler.
+
+Anahtar = sepet dosyası içeriğinin BLAKE2b özeti + parametreler (min_support,
+madenci, …) + biçim sürümü. Dosya adı/tarihi anahtara girmez; içerik aynıysa
+kopyalar da isabet eder. Girdiler <anahtar>.pkl olarak saklanır; toplam boyut
+sınırı aşılınca en uzun süredir kullanılmayanlar (mtime) silinir.
+
+Önbellek isteğe bağlıdır (apriori_train.py --onbellek [KLASOR]). Girdiler
+pickle ile yüklendiğinden klasör yalnız güvenilir içerik barındırmalıdır.
+"""
+
+import hashlib
+import json
+import os
+
+SURUM = 1
+OKUMA_PARCASI = 1 << 20
+
+
+def dosya_ozeti(yol: str) -> str:
+    """Dosya içeriğinin BLAKE2b özeti (1 MB'lık parçalarla, sabit bellek)."""
+    ozet = hashlib.blake2b(digest_size=20)
+    with open(yol, "rb") as f:
+        while parca := f.read(OKUMA_PARCASI):
+            ozet.update(parca)
+    return ozet.hexdigest()
+
+
+class Onbellek:
+    """Boyut sınırlı, LRU tahliyeli sık küme önbelleği."""
+
+    def __init__(self, klasor: str = ".cafeml_onbellek", sinir_mb: float = 512):
+        self.klasor = klasor
+        self.sinir = int(sinir_mb * (1 << 20))
+
+    def anahtar(self, girdi: str, **parametreler) -> str:
+        tanim = json.dumps({"surum": SURUM, "girdi": dosya_ozeti(girdi), **parametreler},
+                           sort_keys=True)
+        return hashlib.blake2b(tanim.encode(), digest_size=20).hexdigest()
+
+    def _yol(self, anahtar: str) -> str:
+        return os.path.join(self.klasor, f"{anahtar}.pkl")
+
+    def getir(self, anahtar: str):
+        """Önbellekteki tabloyu döndür; yoksa (ya da okunamıyorsa) None."""
+        import pandas as pd
+        yol = self._yol(anahtar)
+        if not os.path.exists(yol):
+            return None
+        try:
+            tablo = pd.read_pickle(yol)
+        except Exception:
+            os.remove(yol)  # bozuk girdi: sil, yeniden madenlensin
+            return None
+        os.utime(yol)  # LRU: son kullanım zamanı
+        return tablo
+
+    def koy(self, anahtar: str, tablo):
+        os.makedirs(self.klasor, exist_ok=True)
+        gecici = self._yol(anahtar) + ".tmp"
+        tablo.to_pickle(gecici)
+        os.replace(gecici, self._yol(anahtar))
+        self._tahliye(koru=anahtar)
+
+    def _tahliye(self, koru: str):
+        """Toplam boyut sınırın altına inene kadar en eski girdileri sil (yeni yazılan hariç)."""
+        girdiler = []
+        for ad in os.listdir(self.klasor):
+            if ad.endswith(".pkl"):
+                bilgi = os.stat(os.path.join(self.klasor, ad))
+                girdiler.append((bilgi.st_mtime, bilgi.st_size, ad))
+        toplam = sum(boyut for _, boyut, _ in girdiler)
+        for _, boyut, ad in sorted(girdiler):
+            if toplam <= self.sinir:
+                break
+            if ad == f"{koru}.pkl":
+                continue
+            os.remove(os.path.join(self.klasor, ad))
+            toplam -= boyut
@@ -0,0 +1,210 @@
+"""
+CafeML – Sepet Önerisi (Top-k Kural Araması)
+=============================================
+apriori_train.py çıktısındaki kuralları bir kez yükleyip sepete göre
+öneri döndürür. Sipariş ekranı her ürün eklemede çağırır; bu yüzden
+sorgu sırasında metin bölme ya da tüm kuralları tarama yapılmaz:
+
+- Her ürün bir bite eşlenir, kuralın öncülü (tetikleyici) bir bit maskesidir.
+- İndeks: öncül maskesi → o öncülün kuralları, her ölçüt için önceden
+  azalan sırada. Sorgu her listeden yalnız k geçerli sonuç bulana kadar okur.
+- Sorguda sepetin en fazla "en uzun öncül" boyutundaki alt kümeleri
+  sözlükte aranır (3 ürünlük sepet, 3'lü öncüllerle: 7 arama).
+  Çok büyük sepetlerde alt küme sayısı TARAMA_ESIGI'ni aşarsa öncül
+  maskeleri tek tek (m & ~sepet == 0) kontrol edilir.
+
+Kullanım:
+    from oneri import OneriIndeksi
+    indeks = OneriIndeksi.csv_den("association_rules.csv")
+    indeks.oner(["Lahmacun", "Ayran"], k=3)            # lift'e göre
+    indeks.oner(["Lahmacun"], k=3, olcut="confidence")
+
+    python oneri.py Lahmacun Ayran                      # komut satırından dene
+    python oneri.py Lahmacun --kurallar association_rules.bin   # mmap'li ikili dosyadan
+
+    # segmentli kurallar (apriori_train.py --segment)
+    from oneri import SegmentliOneri
+    segmentli = SegmentliOneri.csv_den("segment_kurallari.csv", genel=indeks)
+    segmentli.oner(["Lahmacun"], k=3, dilim="aksam", hava="soguk_yagisli")
+    python oneri.py Lahmacun --segment dilim=aksam
+"""
+
+import csv
+import heapq
+import json
+from collections import namedtuple
+from itertools import combinations
+from math import comb
+
+Oneri = namedtuple("Oneri", ["urunler", "tetikleyici", "support", "confidence", "lift"])
+
+OLCUTLER = ("lift", "confidence")
+TARAMA_ESIGI = 4096  # bu kadar alt kümeden fazlası varsa indeksi doğrudan tara
+
+
+class OneriIndeksi:
+    """Öncül bit maskesine göre indekslenmiş birliktelik kuralları."""
+
+    def __init__(self, kurallar):
+        """kurallar: (öncül adları, sonuç adları, support, confidence, lift) demetleri."""
+        self.bit = {}      # ürün adı → bit değeri (1 << i)
+        self.adlar = []    # bit sırası → ürün adı
+        self.en_uzun = 0
+        oncul_kurallari = {}
+        for oncul, sonuc, support, confidence, lift in kurallar:
+            oneri = Oneri(tuple(sorted(sonuc)), tuple(sorted(oncul)),
+                          float(support), float(confidence), float(lift))
+            oncul_kurallari.setdefault(self._maske(oncul, ekle=True), []).append(
+                (self._maske(sonuc, ekle=True), oneri))
+            self.en_uzun = max(self.en_uzun, len(oneri.tetikleyici))
+        # ölçüt → öncül maskesi → [(sonuç maskesi, Oneri), …] (ölçüte göre azalan)
+        self.indeks = {
+            olcut: {m: sorted(liste, key=lambda x: getattr(x[1], olcut), reverse=True)
+                    for m, liste in oncul_kurallari.items()}
+            for olcut in OLCUTLER
+        }
+
+    @classmethod
+    def csv_den(cls, yol: str = "association_rules.csv"):
+        """association_rules.csv (antecedent, consequent, support, confidence, lift, …)."""
+        with open(yol, newline="", encoding="utf-8") as f:
+            return cls((r["antecedent"].split(", "), r["consequent"].split(", "),
+                        r["support"], r["confidence"], r["lift"])
+                       for r in csv.DictReader(f))
+
+    @classmethod
+    def json_dan(cls, yol: str = "menu_oneriler.json"):
+        """menu_oneriler.json (yalnız yüksek güvenli kurallar)."""
+        with open(yol, encoding="utf-8") as f:
+            return cls((k["tetikleyici"].split(", "), k["oneri"].split(", "),
+                        k["support"], k["confidence"], k["lift"])
+                       for k in json.load(f))
+
+    @classmethod
+    def tablodan(cls, rules):
+        """mlxtend association_rules DataFrame'inden (frozenset sütunları)."""
+        return cls(zip(rules["antecedents"], rules["consequents"],
+                       rules["support"], rules["confidence"], rules["lift"]))
+
+    def _maske(self, adlar, ekle: bool = False) -> int:
+        maske = 0
+        for ad in adlar:
+            b = self.bit.get(ad)
+            if b is None:
+                if not ekle:
+                    continue  # kurallarda geçmeyen ürün eşleşmeye katkı vermez
+                b = self.bit[ad] = 1 << len(self.adlar)
+                self.adlar.append(ad)
+            maske |= b
+        return maske
+
+    def eslesen_kurallar(self, sepet, olcut: str = "lift"):
+        """Öncülü sepetin alt kümesi olan öncüllerin kural listelerini üret."""
+        indeks = self.indeks[olcut]
+        bitler = [self.bit[ad] for ad in set(sepet) if ad in self.bit]
+        ust = min(len(bitler), self.en_uzun)
+        if sum(comb(len(bitler), r) for r in range(1, ust + 1)) > TARAMA_ESIGI:
+            sepet_maskesi = sum(bitler)
+            for oncul, kurallar in indeks.items():
+                if oncul & ~sepet_maskesi == 0:
+                    yield kurallar
+            return
+        for r in range(1, ust + 1):
+            for secim in combinations(bitler, r):
+                kurallar = indeks.get(sum(secim))
+                if kurallar:
+                    yield kurallar
+
+    def oner(self, sepet, k: int = 5, olcut: str = "lift") -> list:
+        """Sepete eklenebilecek en iyi k sonucu (Oneri listesi, olcut'a göre azalan) döndür.
+
+        Sonucu sepetle kesişen kurallar atlanır; aynı sonuç birden çok
+        öncülden gelirse en yüksek skorlu kural tutulur. Listeler sıralı
+        olduğundan bir öncülde k geçerli sonuçtan sonrası top-k'ya giremez.
+        """
+        if olcut not in OLCUTLER:
+            raise ValueError(f"olcut {OLCUTLER} içinden olmalı: {olcut!r}")
+        sepet_maskesi = self._maske(sepet)
+        en_iyi = {}
+        for kurallar in self.eslesen_kurallar(sepet, olcut):
+            alinan = 0
+            for sonuc, oneri in kurallar:
+                if sonuc & sepet_maskesi:
+                    continue
+                onceki = en_iyi.get(sonuc)
+                if onceki is None or getattr(oneri, olcut) > getattr(onceki, olcut):
+                    en_iyi[sonuc] = oneri
+                alinan += 1
+                if alinan == k:
+                    break
+        return heapq.nlargest(k, en_iyi.values(), key=lambda o: getattr(o, olcut))
+
+
+class SegmentliOneri:
+    """Segment başına OneriIndeksi; verilen segmentlerin önerileri birleştirilir.
+
+    Verilen segmentlerde eşleşen kural yoksa (ya da segment verilmezse)
+    genel indekse düşülür.
+    """
+
+    def __init__(self, indeksler: dict, genel: OneriIndeksi = None):
+        self.indeksler = indeksler  # (aile, segment) → OneriIndeksi
+        self.genel = genel
+
+    @classmethod
+    def csv_den(cls, yol: str = "segment_kurallari.csv", genel: OneriIndeksi = None):
+        gruplar = {}
+        with open(yol, newline="", encoding="utf-8") as f:
+            for r in csv.DictReader(f):
+                gruplar.setdefault((r["segment_ailesi"], r["segment"]), []).append(
+                    (r["antecedent"].split(", "), r["consequent"].split(", "),
+                     r["support"], r["confidence"], r["lift"]))
+        return cls({anahtar: OneriIndeksi(kurallar) for anahtar, kurallar in gruplar.items()}, genel)
+
+    def oner(self, sepet, k: int = 5, olcut: str = "lift", **segmentler) -> list:
+        """segmentler: aile=segment (ör. dilim="aksam", gun_tipi="hafta_sonu")."""
+        en_iyi = {}
+        for aile, segment in segmentler.items():
+            indeks = self.indeksler.get((aile, segment))
+            for oneri in indeks.oner(sepet, k, olcut) if indeks else ():
+                onceki = en_iyi.get(oneri.urunler)
+                if onceki is None or getattr(oneri, olcut) > getattr(onceki, olcut):
+                    en_iyi[oneri.urunler] = oneri
+        if not en_iyi and self.genel is not None:
+            return self.genel.oner(sepet, k, olcut)
+        return heapq.nlargest(k, en_iyi.values(), key=lambda o: getattr(o, olcut))
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="CafeML sepet önerisi")
+    parser.add_argument("sepet", nargs="+", help="sepetteki ürün adları")
+    parser.add_argument("--kurallar", default="association_rules.csv")
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--olcut", choices=OLCUTLER, default="lift")
+    parser.add_argument("--segment", nargs="*", default=[], metavar="AILE=SEGMENT",
+                        help="segment_kurallari.csv'den öneri (ör. dilim=aksam hava=ilik)")
+    parser.add_argument("--segment-kurallari", default="segment_kurallari.csv")
+    args = parser.parse_args()
+
+    if args.kurallar.endswith(".bin"):
+        from kural_dosyasi import KuralDosyasi
+        indeks = KuralDosyasi(args.kurallar)
+        print(f"📥 {args.kurallar}: {len(indeks)} kural, {indeks.baslik['oncul_sayisi']} farklı öncül (mmap)")
+    else:
+        indeks = OneriIndeksi.csv_den(args.kurallar)
+        print(f"📥 {args.kurallar}: {sum(map(len, indeks.indeks['lift'].values()))} kural, "
+              f"{len(indeks.indeks['lift'])} farklı öncül")
+    segmentler = dict(s.split("=", 1) for s in args.segment)
+    if segmentler:
+        indeks = SegmentliOneri.csv_den(args.segment_kurallari, genel=indeks)
+        print(f"📥 {args.segment_kurallari}: {len(indeks.indeksler)} segment; seçilen {segmentler}")
+    bas = time.perf_counter()
+    oneriler = indeks.oner(args.sepet, k=args.k, olcut=args.olcut, **segmentler)
+    sure = (time.perf_counter() - bas) * 1e6
+    for o in oneriler:
+        print(f"  + {', '.join(o.urunler):<40} ← {{{', '.join(o.tetikleyici)}}}  "
+              f"conf={o.confidence:.3f} lift={o.lift:.3f}")
+    print(f"⏱  {sure:.0f} µs")
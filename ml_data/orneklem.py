@@ -0,0 +1,197 @@
+"""
+CafeML – Örneklem Üzerinde Yaklaşık Madencilik
+===============================================
+On milyonlarca siparişlik geçmişte keşif amaçlı çalıştırmalar için sık
+kümeler bir örneklem üzerinde madenlenir (Toivonen yaklaşımı):
+
+1. Örneklem: CSV sepet dosyaları (apriori_transactions.csv, market_basket.csv)
+   akış halinde okunur – adet verilirse rezervuar örneklemesi (Algorithm L),
+   oran verilirse Bernoulli; Arrow / Parquet girdide önce satır numaraları
+   seçilir, yalnız o satırların sepetleri alınır.
+2. Örneklem, eşiğin z·σ kadar altında (dusurulmus_esik) madenlenir; böylece
+   gerçekte sık olup örneklemde eşiğin biraz altında kalan kümeler de aday
+   olarak tutulur. Kurallar için nokta tahmini ≥ min_support olanlar kullanılır.
+3. Her kuralın support / confidence için Wilson, lift için log-delta
+   yöntemiyle %95 güven aralığı raporlanır. Aralıklar kural başınadır;
+   kuralların örneklemde eşiği geçtikleri için seçilmesinden doğan yanlılığı
+   (özellikle eşiğe yakın lift'lerde) düzeltmez – kesin değer için doğrulama.
+4. İsteğe bağlı doğrulama: yalnız adaylar ve negatif sınırları tam veri
+   üzerinde bit tid-listeleriyle sayılır; destekler kesinleşir. Sınırdan
+   eşiği geçen küme çıkarsa (örneklemin kaçırdığı kümeler) yalnız onlardan
+   türeyen yeni adaylar sayılarak sonuç tam madencilikle aynı hale getirilir.
+"""
+
+import csv
+from array import array
+
+import numpy as np
+
+Z = 1.96  # %95 güven aralığı
+
+
+def _rezervuar(satirlar, m: int, rng):
+    """Algorithm L: tek geçişte m satırlık düzgün örneklem; (örneklem, toplam satır)."""
+    ornek = []
+    w = np.exp(np.log(rng.random()) / m)
+    sonraki = m + int(np.floor(np.log(rng.random()) / np.log1p(-w)))
+    toplam = 0
+    for i, satir in enumerate(satirlar):
+        toplam = i + 1
+        if i < m:
+            ornek.append(satir)
+        elif i == sonraki:
+            ornek[rng.integers(m)] = satir
+            w *= np.exp(np.log(rng.random()) / m)
+            sonraki += 1 + int(np.floor(np.log(rng.random()) / np.log1p(-w)))
+    return ornek, toplam
+
+
+def _bernoulli(satirlar, oran: float, rng):
+    ornek, toplam = [], 0
+    for satir in satirlar:
+        toplam += 1
+        if rng.random() < oran:
+            ornek.append(satir)
+    return ornek, toplam
+
+
+def _satirlardan_csr(satirlar: list):
+    from scipy.sparse import csr_matrix
+    sutun_no: dict = {}
+    indices, indptr = array("i"), array("q", [0])
+    for satir in satirlar:
+        for ad in dict.fromkeys(satir):
+            indices.append(sutun_no.setdefault(ad, len(sutun_no)))
+        indptr.append(len(indices))
+    indices = np.frombuffer(indices, dtype=np.int32)
+    X = csr_matrix((np.ones(len(indices), dtype=bool), indices, np.frombuffer(indptr, dtype=np.int64)),
+                   shape=(len(indptr) - 1, len(sutun_no)))
+    X.sort_indices()
+    return X, list(sutun_no)
+
+
+def _onehot_ornek_csr(satirlar: list, genislik: int):
+    """Örneklenen market_basket.csv satırları (siparis_id + 0/1 hücreler) → CSR."""
+    from scipy.sparse import csr_matrix
+    indices, indptr = array("i"), array("q", [0])
+    for satir in satirlar:
+        indices.extend(j for j, v in enumerate(satir[1:]) if v and float(v))
+        indptr.append(len(indices))
+    indices = np.frombuffer(indices, dtype=np.int32)
+    return csr_matrix((np.ones(len(indices), dtype=bool), indices, np.frombuffer(indptr, dtype=np.int64)),
+                      shape=(len(indptr) - 1, genislik))
+
+
+def _kolonsal_ornek(yol: str, boyut: float, rng):
+    """Önce satır numaralarını seç, sonra yalnız o satırların sepetlerini al.
+
+    Arrow IPC memory-map ile açılır (take yalnız seçilen satırlara dokunur);
+    Parquet sepet sütunu parti parti çözülür, tablo bütünüyle kurulmaz.
+    """
+    import pyarrow as pa
+    from sepet_okuyucu import _sepet_csr
+    if yol.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        dosya = pq.ParquetFile(yol, memory_map=True)
+        n, sema = dosya.metadata.num_rows, dosya.schema_arrow
+        partiler = dosya.iter_batches(columns=["sepet"])
+    else:
+        okuyucu = pa.ipc.open_file(pa.memory_map(yol))
+        sema = okuyucu.schema
+        partiler = [okuyucu.get_batch(i) for i in range(okuyucu.num_record_batches)]
+        n = sum(p.num_rows for p in partiler)
+    m = min(n, int(round(boyut * n)) if boyut < 1 else int(boyut))
+    secim = np.sort(rng.choice(n, size=m, replace=False))
+
+    alinan, bas = [], 0
+    for parti in partiler:
+        son = bas + parti.num_rows
+        yerel = secim[np.searchsorted(secim, bas):np.searchsorted(secim, son)] - bas
+        if len(yerel):
+            alinan.append(parti.column("sepet").take(pa.array(yerel)))
+        bas = son
+    sepet = pa.concat_arrays(alinan) if alinan else pa.array([], type=sema.field("sepet").type)
+    return (*_sepet_csr(sepet, sema), n)
+
+
+def orneklem_oku(yol: str, boyut: float, tohum: int = 42):
+    """Sepet dosyasından örneklem; (CSR örneklem, ürün adları, toplam sipariş sayısı).
+
+    boyut < 1 ise oran, aksi halde sipariş adedi. CSV biçimleri satır satır
+    akış halinde örneklenir; kolonsal girdide yalnız seçilen satırlar okunur.
+    """
+    from sepet_okuyucu import bicim_tespit
+    rng = np.random.default_rng(tohum)
+    bicim = bicim_tespit(yol)
+    if bicim == "kolonsal":
+        return _kolonsal_ornek(yol, boyut, rng)
+    with open(yol, newline="", encoding="utf-8") as f:
+        satirlar = csv.reader(f)
+        if bicim == "onehot":
+            urun_adlari = next(satirlar)[1:]
+        ornek, toplam = (_bernoulli(satirlar, boyut, rng) if boyut < 1
+                         else _rezervuar(satirlar, int(boyut), rng))
+    if bicim == "onehot":
+        return _onehot_ornek_csr(ornek, len(urun_adlari)), urun_adlari, toplam
+    return (*_satirlardan_csr(ornek), toplam)
+
+
+def dusurulmus_esik(min_support: float, m: int, z: float = Z) -> float:
+    """Örneklemde kullanılacak eşik: min_support − z·√(s(1−s)/m)."""
+    return max(min_support - z * np.sqrt(min_support * (1 - min_support) / m), 1 / m)
+
+
+def wilson(k, n, z: float = Z):
+    """k/n oranı için Wilson skor aralığı (vektörel)."""
+    k, n = np.asarray(k, dtype=float), np.asarray(n, dtype=float)
+    p = k / n
+    payda = 1 + z * z / n
+    merkez = (p + z * z / (2 * n)) / payda
+    yari = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / payda
+    return merkez - yari, merkez + yari
+
+
+def guven_araliklari(rules, m: int, z: float = Z):
+    """association_rules tablosuna *_alt / *_ust sütunlarını ekle (m = örneklem boyutu)."""
+    n_ab = rules["support"].to_numpy() * m
+    n_a = rules["antecedent support"].to_numpy() * m
+    n_b = rules["consequent support"].to_numpy() * m
+    rules = rules.copy()
+    rules["support_alt"], rules["support_ust"] = wilson(n_ab, m, z)
+    rules["confidence_alt"], rules["confidence_ust"] = wilson(n_ab, n_a, z)
+    # log(lift) = log m + log n_ab − log n_a − log n_b; 2×2 tablonun çok terimli
+    # dağılımı üzerinde delta yöntemi (hücreler: n_ab, n_a−n_ab, n_b−n_ab, kalan)
+    g = 1 / n_ab - 1 / n_a - 1 / n_b
+    varyans = (n_ab * g * g + (n_a - n_ab) / n_a ** 2 + (n_b - n_ab) / n_b ** 2 - 1 / m)
+    sapma = z * np.sqrt(np.maximum(varyans, 0))
+    rules["lift_alt"] = rules["lift"].to_numpy() * np.exp(-sapma)
+    rules["lift_ust"] = rules["lift"].to_numpy() * np.exp(sapma)
+    return rules
+
+
+def dogrula(X, urun_adlari: list, adaylar, min_support: float):
+    """Aday kümeleri ve negatif sınırlarını tam veri X üzerinde say.
+
+    adaylar : örneklemden (düşürülmüş eşikle) gelen DataFrame[support, itemsets]
+    Dönüş   : (kesin destekli sık kümeler DataFrame'i, örneklemin kaçırıp
+               ek taramayla eklenen küme sayısı)
+    """
+    from madencilik import _aday_uret, _sonuc_tablosu, destek_say
+    sutun_no = {ad: j for j, ad in enumerate(urun_adlari)}
+    kumeler = {tuple(sorted(sutun_no[ad] for ad in k if ad in sutun_no))
+               for k in adaylar["itemsets"]} - {()}
+    n = X.shape[0]
+    sayim = {}
+    # ilk tur: adaylar + tüm tekiller; sonraki turlar: yeni sık kümelerin uzantıları
+    sayilacak = sorted(kumeler | {(j,) for j in range(len(urun_adlari))})
+    while sayilacak:
+        for k, adet in zip(sayilacak, destek_say(X, sayilacak)):
+            sayim[k] = int(adet)
+        seviyeler: dict = {}
+        for k in sorted(k for k, a in sayim.items() if a / n >= min_support):
+            seviyeler.setdefault(len(k), []).append(k)
+        sayilacak = [aday for k in sorted(seviyeler) for aday, _, _ in _aday_uret(seviyeler[k])
+                     if aday not in sayim]
+    sik = sorted((k for k, a in sayim.items() if a / n >= min_support), key=lambda k: (len(k), k))
+    kacan = sum(1 for k in sik if k not in kumeler)
+    return _sonuc_tablosu([(k, sayim[k]) for k in sik], urun_adlari, n), kacan
@@ -0,0 +1,100 @@
+"""
+CafeML – Segmentli Kural Madenciliği
+====================================
+Kahvaltı eşleşmeleri akşam yemeği eşleşmelerini bastırmasın diye kurallar
+segment başına ayrı çıkarılır:
+
+    dilim    : gün dilimi (saat_bazli_urun_havuzu sınırları)
+               kahvalti 08-12 · ogle 12-14 · ogleden_sonra 14-17 ·
+               aksamustu 17-19 · aksam 19+
+    gun_tipi : hafta_ici / hafta_sonu (generate_dataset.hafta_sonu_mu)
+    hava     : soguk_yagisli (Yağmurlu, Soğuk/Karlı) / ilik (diğerleri)
+
+Sipariş nitelikleri orders_summary.csv'den (siparis_id ile eşlenir) ya da
+kolonsal girdide aynı dosyadan okunur. Tüm segmentler madencilik.segmentli_eclat
+ile tek geçişte sayılır; destek/güven/lift segment içi oranlardır.
+
+Çıktı segment_kurallari.csv = association_rules.csv sütunları + başta
+segment_ailesi, segment. Sunum: oneri.SegmentliOneri.csv_den().
+"""
+
+import numpy as np
+
+GUN_DILIMLERI = ("kahvalti", "ogle", "ogleden_sonra", "aksamustu", "aksam")
+DILIM_SINIRLARI = (12, 14, 17, 19)          # saat < 12 → kahvalti, …, ≥ 19 → aksam
+SOGUK_YAGISLI = ("Yağmurlu", "Soğuk/Karlı")  # akşam havuzunu değiştiren hava durumları
+NITELIK_SUTUNLARI = ("saat", "hafta_sonu", "hava_durumu")
+
+
+def siparis_nitelikleri(yol: str, siparisler: np.ndarray) -> dict:
+    """Sepet satırlarıyla aynı sırada saat / hafta_sonu / hava_durumu dizileri.
+
+    yol        : orders_summary.csv ya da orders.arrow / orders.parquet
+    siparisler : sepet satırlarının sipariş numaraları (int)
+    """
+    import pandas as pd
+    if yol.endswith((".arrow", ".parquet")):
+        from sepet_okuyucu import _kolonsal_tablo
+        if yol.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            tablo = pq.read_table(yol, columns=["siparis_no", *NITELIK_SUTUNLARI], memory_map=True)
+        else:
+            tablo = _kolonsal_tablo(yol).select(["siparis_no", *NITELIK_SUTUNLARI])
+        df = tablo.to_pandas().set_index("siparis_no")  # hava_durumu: Categorical
+    else:
+        df = pd.read_csv(yol, usecols=["siparis_id", *NITELIK_SUTUNLARI])
+        df.index = df.pop("siparis_id").str.rsplit("-", n=1).str[-1].astype(int)
+    yer = df.index.get_indexer(siparisler)
+    if (yer < 0).any():
+        raise ValueError(f"{int((yer < 0).sum())} siparişin niteliği {yol} içinde yok")
+    return {s: np.asarray(df[s])[yer] for s in NITELIK_SUTUNLARI}
+
+
+def segment_maskeleri(nitelik: dict) -> dict:
+    """{(aile, segment): sipariş maskesi}."""
+    dilim = np.searchsorted(DILIM_SINIRLARI, nitelik["saat"].astype(int), side="right")
+    hafta_sonu = nitelik["hafta_sonu"].astype(bool)
+    soguk = np.isin(nitelik["hava_durumu"], SOGUK_YAGISLI)
+    maskeler = {("dilim", ad): dilim == i for i, ad in enumerate(GUN_DILIMLERI)}
+    maskeler[("gun_tipi", "hafta_ici")] = ~hafta_sonu
+    maskeler[("gun_tipi", "hafta_sonu")] = hafta_sonu
+    maskeler[("hava", "ilik")] = ~soguk
+    maskeler[("hava", "soguk_yagisli")] = soguk
+    return maskeler
+
+
+def segment_kurallari(X, urun_adlari: list, maskeler: dict, min_support: float,
+                      min_confidence: float, min_lift: float):
+    """Tüm segmentlerin kurallarını tek tabloda döndür (segment içinde lift'e göre azalan).
+
+    Dönüş: (DataFrame, {(aile, segment): (sipariş sayısı, sık küme sayısı)})
+    """
+    import pandas as pd
+    from mlxtend.frequent_patterns import association_rules
+    from madencilik import segmentli_eclat
+
+    sik_kumeler = segmentli_eclat(X, urun_adlari, maskeler, min_support)
+    tablolar, ozet = [], {}
+    for (aile, segment), fi in sik_kumeler.items():
+        ozet[(aile, segment)] = (int(np.count_nonzero(maskeler[(aile, segment)])), len(fi))
+        if fi.empty:
+            continue
+        rules = association_rules(fi, metric="confidence", min_threshold=min_confidence)
+        rules = rules[rules["lift"] >= min_lift].sort_values("lift", ascending=False)
+        if rules.empty:
+            continue
+        tablolar.append(pd.DataFrame({
+            "segment_ailesi": aile,
+            "segment":        segment,
+            "antecedent":     rules["antecedents"].map(lambda x: ", ".join(sorted(x))),
+            "consequent":     rules["consequents"].map(lambda x: ", ".join(sorted(x))),
+            "support":        rules["support"],
+            "confidence":     rules["confidence"],
+            "lift":           rules["lift"],
+            "leverage":       rules["leverage"],
+            "conviction":     rules["conviction"],
+        }))
+    sutunlar = ["segment_ailesi", "segment", "antecedent", "consequent",
+                "support", "confidence", "lift", "leverage", "conviction"]
+    tablo = pd.concat(tablolar, ignore_index=True) if tablolar else pd.DataFrame(columns=sutunlar)
+    return tablo, ozet
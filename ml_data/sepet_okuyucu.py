@@ -0,0 +1,129 @@
+"""
+CafeML – Sepet Dosyası Okuyucu
+==============================
+generate_dataset.py çıktılarını Apriori girdisine çevirir:
+- market_basket.csv         (one-hot, başlıklı)
+- apriori_transactions.csv  (satır başına ürün adı listesi, başlıksız)
+- orders.arrow / orders.parquet (kolonsal, sepet = ürün id listesi)
+
+seyrek_sepet_oku() hiçbir aşamada sipariş × ürün yoğun matrisi kurmaz;
+bellek, satılan kalem sayısıyla (nnz) orantılıdır. sepet_oku() mlxtend'in
+beklediği yoğun boolean DataFrame'i döndürür.
+"""
+
+import csv
+import json
+from array import array
+
+import numpy as np
+
+PARCA_SATIR = 100_000  # one-hot CSV parça parça okunurken satır sayısı
+
+
+def bicim_tespit(yol: str) -> str:
+    """Dosya biçimini bul: "kolonsal", "onehot" ya da "liste"."""
+    if yol.endswith((".arrow", ".parquet")):
+        return "kolonsal"
+    with open(yol, newline="", encoding="utf-8") as f:
+        ilk = next(csv.reader(f), [])
+    return "onehot" if ilk[:1] == ["siparis_id"] else "liste"
+
+
+def _kolonsal_tablo(yol: str):
+    """Arrow IPC dosyasını memory-map ile, Parquet'i memory_map=True ile aç."""
+    import pyarrow as pa
+    if yol.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.read_table(yol, columns=["siparis_no", "sepet"], memory_map=True)
+    return pa.ipc.open_file(pa.memory_map(yol)).read_all()
+
+
+def _sepet_csr(sepet, sema):
+    """Sepet liste sütunu zaten CSR'dir: offsets → indptr, değerler → indices.
+
+    sema: ürün sözlüğünü ("urunler" metadata) taşıyan Arrow şeması.
+    """
+    from scipy.sparse import csr_matrix
+    urunler = json.loads(sema.metadata[b"urunler"])
+    ids = np.array([int(i) for i in urunler])
+    sutun_no = np.zeros(ids.max() + 1, dtype=np.int32)
+    sutun_no[ids] = np.arange(len(ids))
+
+    offsetler = sepet.offsets.to_numpy()
+    degerler = sepet.values.to_numpy(zero_copy_only=True)[offsetler[0]:offsetler[-1]]
+    X = csr_matrix(
+        (np.ones(len(degerler), dtype=bool), sutun_no[degerler], offsetler - offsetler[0]),
+        shape=(len(sepet), len(ids)),
+    )
+    return X, list(urunler.values())
+
+
+def _kolonsal_csr(yol: str):
+    tablo = _kolonsal_tablo(yol)
+    X, urun_adlari = _sepet_csr(tablo.column("sepet").combine_chunks(), tablo.schema)
+    return X, urun_adlari, tablo.column("siparis_no").to_numpy()
+
+
+def _liste_csr(yol: str):
+    """apriori_transactions.csv → CSR (ürün sütunları ilk görülme sırasıyla)."""
+    from scipy.sparse import csr_matrix
+    sutun_no: dict = {}
+    indices = array("i")
+    indptr = array("q", [0])
+    with open(yol, newline="", encoding="utf-8") as f:
+        for satir in csv.reader(f):
+            for ad in dict.fromkeys(satir):  # satır içi tekrarları at
+                indices.append(sutun_no.setdefault(ad, len(sutun_no)))
+            indptr.append(len(indices))
+    indices = np.frombuffer(indices, dtype=np.int32)
+    X = csr_matrix(
+        (np.ones(len(indices), dtype=bool), indices, np.frombuffer(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, len(sutun_no)),
+    )
+    X.sort_indices()
+    return X, list(sutun_no), None
+
+
+def _onehot_csr(yol: str):
+    """market_basket.csv → CSR, PARCA_SATIR'lık parçalar halinde."""
+    import pandas as pd
+    from scipy.sparse import csr_matrix, vstack
+    parcalar, idler = [], []
+    urun_adlari = None
+    for parca in pd.read_csv(yol, index_col=0, chunksize=PARCA_SATIR):
+        urun_adlari = list(parca.columns)
+        parcalar.append(csr_matrix(parca.to_numpy(dtype=bool)))
+        idler.append(parca.index.to_numpy())
+    if not parcalar:
+        return csr_matrix((0, 0), dtype=bool), [], None
+    return vstack(parcalar, format="csr"), urun_adlari, np.concatenate(idler)
+
+
+def seyrek_sepet_oku(yol: str, idler: bool = False):
+    """Sepet dosyasını (CSR matrisi, ürün adları) olarak oku.
+
+    idler=True ise üçüncü eleman satırların sipariş numaralarıdır (int);
+    apriori_transactions.csv sipariş numarası taşımadığından orada None'dır.
+    """
+    bicim = bicim_tespit(yol)
+    if bicim == "kolonsal":
+        X, urun_adlari, siparisler = _kolonsal_csr(yol)
+    elif bicim == "onehot":
+        X, urun_adlari, siparisler = _onehot_csr(yol)
+        if siparisler is not None:
+            # "ORD-01332" → 1332
+            siparisler = np.array([int(str(s).rsplit("-", 1)[-1]) for s in siparisler])
+    else:
+        X, urun_adlari, siparisler = _liste_csr(yol)
+    return (X, urun_adlari, siparisler) if idler else (X, urun_adlari)
+
+
+def sepet_oku(yol: str):
+    """Sepet dosyasını mlxtend için yoğun boolean DataFrame olarak oku."""
+    import pandas as pd
+    bicim = bicim_tespit(yol)
+    if bicim == "onehot":
+        # one-hot formatında oku (siparis_id sütununu atla), boolean'a çevir
+        return pd.read_csv(yol, index_col=0).astype(bool)
+    X, urun_adlari, idler = _kolonsal_csr(yol) if bicim == "kolonsal" else _liste_csr(yol)
+    return pd.DataFrame(X.toarray(), columns=urun_adlari, index=idler)
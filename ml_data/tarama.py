@@ -0,0 +1,106 @@
+"""
+CafeML – Eşik Taraması
+======================
+Sık kümeler en düşük destek eşiğinde bir kez madenlenir, kurallar en düşük
+güven eşiğinde bir kez türetilir; destek × güven × lift ızgarasının her
+noktası bu tek kural tablosunun süzülmesiyle elde edilir. Bir kuralın
+desteği tüm ürünlerinin birlikte görülme oranı olduğundan, "support ≥ s"
+süzgeci o eşikte baştan madenlemeyle birebir aynı kuralları verir.
+
+Her nokta için:
+    kural_sayisi    : conf ve lift süzgecinden geçen kural sayısı
+    yuksek_guven    : menu_oneriler.json'a girecek (conf ≥ 0.55) kural sayısı
+    urun_kapsami    : kurallarda geçen farklı ürünlerin menüye oranı
+    siparis_kapsami : en az bir kuralın tetiklendiği (öncülü sepette olan)
+                      siparişlerin oranı
+    sure_ms         : noktanın türetilme süresi (süzgeç + kapsam)
+"""
+
+import time
+from itertools import combinations, product
+
+import numpy as np
+
+from madencilik import _popcount_fonksiyonu, bit_tidleri
+
+YUKSEK_GUVEN = 0.55  # apriori_train.py menu_oneriler.json eşiği
+
+
+def _en_kucuk_onculler(onculler: set) -> list:
+    """Başka bir öncülü alt küme olarak içermeyen öncüller (kapsamı yalnız bunlar belirler)."""
+    secilen = []
+    for oncul in sorted(onculler, key=len):
+        if not any(frozenset(alt) in onculler
+                   for r in range(1, len(oncul)) for alt in combinations(oncul, r)):
+            secilen.append(oncul)
+    return secilen
+
+
+def esik_taramasi(frequent_itemsets, X, urun_adlari: list,
+                  destekler, guvenler, liftler):
+    """Izgaradaki her (destek, güven, lift) noktası için kural istatistiklerini döndür.
+
+    frequent_itemsets : min(destekler) ile madenlenmiş mlxtend biçimli tablo
+    X                 : sipariş × ürün seyrek matris (sipariş kapsamı için)
+    Dönüş             : (DataFrame, kural türetme süresi sn)
+    """
+    import pandas as pd
+    from mlxtend.frequent_patterns import association_rules
+
+    bas = time.perf_counter()
+    if frequent_itemsets.empty:  # en düşük destekte bile sık küme yok: her nokta boş
+        rules = pd.DataFrame(columns=["antecedents", "consequents", "support", "confidence",
+                                      "lift"])
+    else:
+        rules = association_rules(frequent_itemsets, metric="confidence",
+                                  min_threshold=min(guvenler))
+    turetme = time.perf_counter() - bas
+
+    sutun_no = {ad: j for j, ad in enumerate(urun_adlari)}
+    urun_bitleri = bit_tidleri(X, range(len(urun_adlari)))
+    popcount = _popcount_fonksiyonu()
+    oncul_bitleri = {}  # öncül → sipariş bit dizisi (noktalar arasında paylaşılır)
+
+    def oncul_biti(oncul):
+        if oncul not in oncul_bitleri:
+            satirlar = [sutun_no[ad] for ad in oncul]
+            oncul_bitleri[oncul] = np.bitwise_and.reduce(urun_bitleri[satirlar], axis=0)
+        return oncul_bitleri[oncul]
+
+    support = rules["support"].to_numpy()
+    confidence = rules["confidence"].to_numpy()
+    lift = rules["lift"].to_numpy()
+    satirlar = []
+    for s, c, l in product(sorted(destekler, reverse=True), sorted(guvenler, reverse=True),
+                           sorted(liftler, reverse=True)):
+        bas = time.perf_counter()
+        secim = (support >= s) & (confidence >= c) & (lift >= l)
+        onculler = set(rules["antecedents"][secim])
+        urunler = set().union(*onculler, *rules["consequents"][secim])
+        kapsam = np.zeros(urun_bitleri.shape[1], dtype=np.uint64)
+        for oncul in _en_kucuk_onculler(onculler):
+            kapsam |= oncul_biti(oncul)
+        satirlar.append({
+            "min_support":     s,
+            "min_confidence":  c,
+            "min_lift":        l,
+            "kural_sayisi":    int(secim.sum()),
+            "yuksek_guven":    int((secim & (confidence >= YUKSEK_GUVEN)).sum()),
+            "urun_kapsami":    len(urunler) / len(urun_adlari),
+            "siparis_kapsami": int(popcount(kapsam)) / X.shape[0],
+            "sure_ms":         (time.perf_counter() - bas) * 1000,
+        })
+    return pd.DataFrame(satirlar), turetme
+
+
+def tablo_yazdir(tablo):
+    print("─" * 88)
+    print(f"{'Destek':>7} {'Güven':>6} {'Lift':>5} │ {'Kural':>8} {'Conf≥.55':>8} "
+          f"{'Ürün %':>7} {'Sipariş %':>9} │ {'Süre ms':>8}")
+    print("─" * 88)
+    for _, r in tablo.iterrows():
+        print(f"{r['min_support']:>7.3f} {r['min_confidence']:>6.2f} {r['min_lift']:>5.2f} │ "
+              f"{int(r['kural_sayisi']):>8} {int(r['yuksek_guven']):>8} "
+              f"{r['urun_kapsami'] * 100:>6.1f}% {r['siparis_kapsami'] * 100:>8.1f}% │ "
+              f"{r['sure_ms']:>8.1f}")
+    print("─" * 88)
@@ -0,0 +1,23 @@
+"""ml_data betikleri paket değil; testler onları düz modül olarak içe aktarır."""
+
+import os
+import sys
+
+import pytest
+
+ML_DATA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ML_DATA)
+
+
+@pytest.fixture(scope="session")
+def sepet():
+    """Depodaki 2000 siparişlik market_basket.csv → (CSR, ürün adları)."""
+    from sepet_okuyucu import seyrek_sepet_oku
+    X, urun_adlari = seyrek_sepet_oku(os.path.join(ML_DATA, "market_basket.csv"))
+    return X.tocsr(), urun_adlari
+
+
+
+def kume_sozlugu(tablo) -> dict:
+    """mlxtend biçimli sık küme tablosu → {frozenset(ürünler): destek}."""
+    return {frozenset(k): float(s) for s, k in zip(tablo["support"], tablo["itemsets"])}
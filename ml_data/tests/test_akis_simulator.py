@@ -0,0 +1,38 @@
+import io
+import json
+
+import pytest
+
+from akis_simulator import ndjson_akisi, oynat, siparis_akisi
+
+
+def satirlar(cikis: io.BytesIO) -> list:
+    return cikis.getvalue().decode("utf-8").splitlines()
+
+
+@pytest.mark.parametrize("motor,n", [("vektorel", 5000), ("klasik", 600)])
+def test_n_siniri_ve_zaman_sirasi(motor, n):
+    # küçük gunluk: akış birçok gün ve vektörel blok sınırı boyunca ilerler
+    cikis = io.BytesIO()
+    ist = oynat(ndjson_akisi(n, motor, gunluk=300, tohum=4), cikis)
+    okunan = [json.loads(s) for s in satirlar(cikis)]
+    assert ist["siparis"] == len(okunan) == n and ist["kesildi"] is None
+    zamanlar = [s["tarih_saat"] for s in okunan]
+    assert zamanlar == sorted(zamanlar) and zamanlar[0][:10] != zamanlar[-1][:10]
+    assert okunan == [{k: v for k, v in s.items() if k != "one_hot"}
+                      for s in siparis_akisi(n, motor, gunluk=300, tohum=4)]
+
+
+def test_hiz_siniri():
+    hiz, n = 10_000, 3000
+    ist = oynat(ndjson_akisi(n, tohum=4), io.BytesIO(), hiz=hiz)
+    # son dilim (n - dilim) / hiz anında yazılır; bekleme yoksa süre ~0 olurdu
+    assert ist["siparis"] == n
+    assert (n - hiz * 0.01) / hiz <= ist["sure_sn"] < n / hiz + 0.5
+
+
+def test_sure_siniri():
+    cikis = io.BytesIO()
+    ist = oynat(ndjson_akisi(None, tohum=4), cikis, hiz=2000, sure=0.2)
+    assert 0 < ist["siparis"] == len(satirlar(cikis)) <= 2000 * 0.2 + 20
+    assert ist["sure_sn"] < 0.7
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from scipy.sparse import vstack
+
+from artimsal import durum_guncelle, durum_olustur, sik_kume_tablosu
+from conftest import kume_sozlugu
+from madencilik import eclat
+
+
+def parti(X, urun_adlari, satirlar, rng):
+    """Satırlar + karışık sütun sırası; partide hiç satılmayan ürünler atlanır."""
+    P = X[satirlar]
+    sutunlar = rng.permutation(np.flatnonzero(np.asarray(P.sum(axis=0)).ravel()))
+    return P[:, sutunlar], [urun_adlari[j] for j in sutunlar]
+
+
+@pytest.mark.parametrize("tohum,destekler", [
+    (0, [0.05, 0.05, 0.05, 0.05]),
+    (1, [0.04, 0.03, 0.03, 0.02]),    # düşen eşik: sınırdan terfi + sınırlı tarama
+    (2, [0.02, 0.03, 0.05, 0.04]),    # yükselen eşik: budama
+    (3, [0.03, 0.03, 0.015, 0.03]),
+])
+def test_tam_madencilikle_ayni(sepet, tmp_path, tohum, destekler):
+    X, urun_adlari = sepet
+    rng = np.random.default_rng(tohum)
+    sira = rng.permutation(X.shape[0])
+    # en az satılan ürünün siparişleri sona: ürün ilk partide yok, sonradan eklenir
+    adetler = np.asarray(X.sum(axis=0)).ravel()
+    nadir = int(np.argmin(np.where(adetler > 0, adetler, np.inf)))
+    icerir = X[sira, nadir].toarray().ravel() > 0
+    sira = np.concatenate([sira[~icerir], sira[icerir]])
+    kesimler = np.sort(rng.choice(np.arange(50, X.shape[0] - 50), size=len(destekler) - 1,
+                                  replace=False))
+    gorulen, yeni_urun = [], 0
+    for i, (satirlar, destek) in enumerate(zip(np.split(sira, kesimler), destekler)):
+        P, adlar = parti(X, urun_adlari, satirlar, rng)
+        if i == 0:
+            durum = durum_olustur(str(tmp_path), P, adlar, destek)
+        else:
+            durum, ozet = durum_guncelle(str(tmp_path), P, adlar, destek)
+            yeni_urun += ozet["yeni_urun"]
+        gorulen.append(satirlar)
+
+        tam = X[np.concatenate(gorulen)]
+        beklenen = kume_sozlugu(eclat(tam, urun_adlari, destek))
+        bulunan = kume_sozlugu(sik_kume_tablosu(durum))
+        assert bulunan.keys() == beklenen.keys(), f"parti {i}"
+        for kume, destek_degeri in beklenen.items():
+            assert bulunan[kume] == pytest.approx(destek_degeri)
+    assert yeni_urun >= 1
+
+
+def test_esik_verilmezse_korunur(sepet, tmp_path):
+    X, urun_adlari = sepet
+    durum_olustur(str(tmp_path), X[:1000], urun_adlari, 0.04)
+    durum, ozet = durum_guncelle(str(tmp_path), X[1000:], urun_adlari)
+    assert durum["min_support"] == 0.04 and ozet["yeni_siparis"] == X.shape[0] - 1000
+    assert kume_sozlugu(sik_kume_tablosu(durum)).keys() == \
+        kume_sozlugu(eclat(vstack([X[:1000], X[1000:]]).tocsr(), urun_adlari, 0.04)).keys()
+
+
+def test_ayni_parti_iki_kez_sayilmaz(sepet, tmp_path):
+    X, urun_adlari = sepet
+    rng = np.random.default_rng(7)
+    ilk, ikinci = np.split(rng.permutation(X.shape[0]), [1200])
+    durum_olustur(str(tmp_path), X[ilk], urun_adlari, 0.03)
+    P, adlar = parti(X, urun_adlari, ikinci, rng)
+    durum_guncelle(str(tmp_path), P, adlar)
+    durum, ozet = durum_guncelle(str(tmp_path), P, adlar)
+    assert ozet["tekrar"] and ozet["yeni_siparis"] == 0
+    assert durum["n"] == X.shape[0] and len(durum["parcalar"]) == 2
+    # sütun sırası farklı aynı parti de tanınır; eşik değişikliği yine uygulanır
+    sutunlar = rng.permutation(len(adlar))
+    durum, ozet = durum_guncelle(str(tmp_path), P[:, sutunlar], [adlar[j] for j in sutunlar],
+                                 0.02)
+    assert ozet["tekrar"] and durum["n"] == X.shape[0] and durum["min_support"] == 0.02
+    assert kume_sozlugu(sik_kume_tablosu(durum)).keys() == \
+        kume_sozlugu(eclat(X, urun_adlari, 0.02)).keys()
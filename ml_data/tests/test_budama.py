@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+import pytest
+
+from budama import baskin_kurallari_buda, kapali_kumeler, maksimal_kumeler
+from conftest import kume_sozlugu
+from madencilik import eclat
+
+
+@pytest.fixture(scope="module")
+def sik_kumeler(sepet):
+    X, urun_adlari = sepet
+    return eclat(X, urun_adlari, 0.01)
+
+
+def kaba_baskin(rules) -> set:
+    """Aynı sonuçlu, öncülü öz alt küme ve güveni ≥ bir kural varsa kural atılır."""
+    gruplar = defaultdict(list)
+    for a, c, g in zip(rules["antecedents"], rules["consequents"], rules["confidence"]):
+        gruplar[c].append((a, g))
+    return {(a, c) for c, kurallar in gruplar.items() for a, g in kurallar
+            if not any(a2 < a and g2 >= g for a2, g2 in kurallar)}
+
+
+def kaba_kumeler(sik: dict, kapali: bool) -> set:
+    """Her üst kümeyle karşılaştırarak kapalı ya da maksimal kümeler."""
+    return {k for k, s in sik.items()
+            if not any(k < ust and (not kapali or ust_s == pytest.approx(s))
+                       for ust, ust_s in sik.items())}
+
+
+@pytest.mark.parametrize("guven,lift", [(0.3, 0.0), (0.2, 1.2)])
+def test_baskin_kurallar_kaba_kuvvetle_ayni(sik_kumeler, guven, lift):
+    from mlxtend.frequent_patterns import association_rules
+    rules = association_rules(sik_kumeler, metric="confidence", min_threshold=guven)
+    rules = rules[rules["lift"] >= lift]
+    budanmis = baskin_kurallari_buda(rules)
+    assert len(budanmis) < len(rules)
+    assert set(zip(budanmis["antecedents"], budanmis["consequents"])) == kaba_baskin(rules)
+
+
+@pytest.mark.parametrize("kapali", [True, False])
+def test_kapali_maksimal_kaba_kuvvetle_ayni(sik_kumeler, kapali):
+    sik = kume_sozlugu(sik_kumeler)
+    bulunan = (kapali_kumeler if kapali else maksimal_kumeler)(sik_kumeler)
+    beklenen = kaba_kumeler(sik, kapali)
+    assert set(kume_sozlugu(bulunan)) == beklenen
+    assert 0 < len(beklenen) < len(sik)
+
@@ -0,0 +1,60 @@
+import os
+import random
+from collections import Counter
+from contextlib import redirect_stdout
+
+import pytest
+
+import generate_dataset as gd
+from cevrimici_istatistik import (AgirVurucular, CevrimiciIstatistik, akis_istatistigi,
+                                  rapor_olustur, sapma_raporu)
+
+
+@pytest.mark.parametrize("kapasite", [8, 64, 256])
+def test_agir_vurucu_sinirlari(kapasite):
+    rng = random.Random(kapasite)
+    akis = [(f"u{rng.randrange(600)}" if rng.random() < 0.5 else f"u{rng.randrange(10)}",
+             rng.randint(1, 4)) for _ in range(50_000)]
+    taslak, gercek = AgirVurucular(kapasite), Counter()
+    for anahtar, agirlik in akis:
+        taslak.ekle(anahtar, agirlik)
+        gercek[anahtar] += agirlik
+    toplam = sum(gercek.values())
+    assert len(taslak.sayac) == kapasite and not taslak.kesin
+    assert sum(taslak.sayac.values()) == toplam
+    for anahtar, sayim, hata in taslak.ilk():
+        assert sayim - hata <= gercek[anahtar] <= sayim
+    assert all(a in taslak.sayac for a, c in gercek.items() if c > toplam / kapasite)
+
+
+def test_kapasite_altinda_kesin():
+    taslak = AgirVurucular(10)
+    for anahtar in "abcabca":
+        taslak.ekle(anahtar)
+    assert taslak.kesin and taslak.ilk() == [("a", 3, 0), ("b", 2, 0), ("c", 2, 0)]
+
+
+def test_girdiler_ayni_raporu_verir(tmp_path):
+    pytest.importorskip("pyarrow")
+    with open(os.devnull, "w") as bos, redirect_stdout(bos):
+        for bicim in ("csv", "arrow", "parquet"):
+            gd.kaydet(gd.uret_akis(4000, motor="vektorel", tohum=9, kompakt=True),
+                      str(tmp_path), bicim)
+    akis = akis_istatistigi(gd.uret_akis(4000, motor="vektorel", tohum=9, kompakt=True))
+    beklenen = {**akis.rapor(), "kaynak": None}
+    beklenen["ciro"] = {k: pytest.approx(v) for k, v in beklenen["ciro"].items()}
+    for dosya in ("orders_summary.csv", "orders.arrow", "orders.parquet"):
+        assert {**rapor_olustur(str(tmp_path / dosya)), "kaynak": None} == beklenen, dosya
+
+
+def test_sapma():
+    raporlar = [akis_istatistigi(gd.uret_akis(6000, motor="vektorel", tohum=t, kompakt=True))
+                .rapor(kaynak=str(t)) for t in (1, 2)]
+    assert sapma_raporu(*raporlar)["boyutlar"]["saat"]["durum"] == "kararlı"
+
+    aksam = CevrimiciIstatistik()
+    for k in gd.uret_akis(6000, motor="vektorel", tohum=3, kompakt=True):
+        if k.dakika % 1440 >= 17 * 60:
+            aksam.ekle(k)
+    sapma = sapma_raporu(raporlar[0], aksam.rapor(kaynak="aksam"))
+    assert sapma["boyutlar"]["saat"]["durum"] == "belirgin" and sapma["en_kotu"] == "saat"
@@ -0,0 +1,27 @@
+import json
+import os
+
+import pytest
+
+from apriori_train import MADENCILER, egit, tarama_egit
+from conftest import ML_DATA
+
+GIRDI = os.path.join(ML_DATA, "market_basket.csv")
+
+
+@pytest.mark.parametrize("madenci", MADENCILER)
+def test_sik_kume_yoksa_bos_cikti(tmp_path, madenci):
+    sonuc = egit(GIRDI, min_support=0.9, madenci=madenci, cikti_klasor=str(tmp_path))
+    assert sonuc["frequent_itemsets"].empty and sonuc["rules"].empty
+    with open(sonuc["dosyalar"]["csv"], encoding="utf-8") as f:
+        assert f.read().splitlines() == [
+            "antecedent,consequent,support,confidence,lift,leverage,conviction"]
+    with open(sonuc["dosyalar"]["oneri"], encoding="utf-8") as f:
+        assert json.load(f) == []
+    assert sonuc["rapor"]["kural_sayisi"] == 0
+
+
+def test_sik_kume_yoksa_bos_tarama(tmp_path):
+    tablo = tarama_egit(GIRDI, [0.9, 0.95], [0.4], [1.2], madenci="eclat",
+                        cikti_klasor=str(tmp_path))
+    assert len(tablo) == 2 and (tablo["kural_sayisi"] == 0).all()
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from conftest import kume_sozlugu
+from hiyerarsi import cok_seviyeli_madencilik, urun_kategorisi
+from madencilik import eclat
+
+
+@pytest.fixture(scope="module")
+def yogun(sepet):
+    """(ürün DataFrame'i, kategori DataFrame'i) – mlxtend girdileri."""
+    X, urun_adlari = sepet
+    urunler = pd.DataFrame(X.toarray().astype(bool), columns=urun_adlari)
+    kategoriler = urunler.T.groupby([urun_kategorisi(ad) for ad in urun_adlari]).any().T
+    return urunler, kategoriler
+
+
+@pytest.mark.parametrize("kategori_destek,urun_destek", [(0.1, 0.005), (0.05, 0.01)])
+def test_sik_kategori_kumeleriyle_sinirli_apriori(sepet, yogun, kategori_destek, urun_destek):
+    from mlxtend.frequent_patterns import apriori
+    X, urun_adlari = sepet
+    urunler, kategoriler = yogun
+    kategori_kumeleri, urun_kumeleri = cok_seviyeli_madencilik(
+        X, urun_adlari, kategori_destek, urun_destek)
+
+    sik_kategoriler = kume_sozlugu(apriori(kategoriler, min_support=kategori_destek,
+                                           use_colnames=True))
+    bulunan_kategoriler = kume_sozlugu(kategori_kumeleri)
+    assert bulunan_kategoriler.keys() == sik_kategoriler.keys()
+    for kume, destek in sik_kategoriler.items():
+        assert bulunan_kategoriler[kume] == pytest.approx(destek)
+
+    beklenen = {kume: destek for kume, destek in kume_sozlugu(
+                    apriori(urunler, min_support=urun_destek, use_colnames=True)).items()
+                if frozenset(map(urun_kategorisi, kume)) in sik_kategoriler}
+    bulunan = kume_sozlugu(urun_kumeleri)
+    assert bulunan.keys() == beklenen.keys()
+    for kume, destek in beklenen.items():
+        assert bulunan[kume] == pytest.approx(destek)
+
+
+@pytest.mark.parametrize("kategori_destek,urun_destek", [(0.01, 0.01), (0.005, 0.02)])
+def test_kategori_esigi_dusukse_duz_eclat(sepet, kategori_destek, urun_destek):
+    X, urun_adlari = sepet
+    _, urun_kumeleri = cok_seviyeli_madencilik(X, urun_adlari, kategori_destek, urun_destek)
+    assert kume_sozlugu(urun_kumeleri) == kume_sozlugu(eclat(X, urun_adlari, urun_destek))
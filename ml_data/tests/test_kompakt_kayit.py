@@ -0,0 +1,35 @@
+import sys
+
+import numpy as np
+import pytest
+
+import generate_dataset as gd
+
+
+def test_kayitlar_sozluklerle_ayni():
+    kayitlar = gd.uret_vektorel(n=1500, tohum=3, kompakt=True)
+    assert [gd.kaydi_coz(k) for k in kayitlar] == gd.uret_vektorel(n=1500, tohum=3)
+
+
+def test_255_ustu_urun_numaralari_tasinir():
+    blok = gd.vektorel_blok_uret(np.random.default_rng(0), 20)
+    genis = np.zeros((20, 1001), dtype=blok["adet"].dtype)
+    genis[:, :blok["adet"].shape[1]] = blok["adet"]
+    genis[:, 300] = 2
+    genis[:, 1000] = 1
+    for kayit in gd.blok_kayitlari({**blok, "adet": genis}):
+        ciftler = dict(zip(kayit.sepet[0::2], kayit.sepet[1::2]))
+        assert ciftler[300] == 2 and ciftler[1000] == 1
+
+
+def test_uint16_disindaki_menu_reddedilir(monkeypatch):
+    monkeypatch.setitem(gd.MENU, 1 << 16, ("Taşan", "Tatlı", 1.0, 1, 10))
+    monkeypatch.setattr(gd, "_vektorel_tablolar", None)
+    with pytest.raises(ValueError, match="uint16"):
+        gd._tablolari_hazirla()
+
+
+def test_pyarrow_yoksa_yazici_hata_verir(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        gd.KolonsalYazici(str(tmp_path / "orders.arrow"), "arrow")
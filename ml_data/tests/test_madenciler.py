@@ -0,0 +1,69 @@
+import os
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import ML_DATA, kume_sozlugu
+from madencilik import eclat, paralel_apriori, segmentli_eclat, seyrek_apriori
+
+
+@pytest.fixture(scope="module")
+def mlxtend_sonuclari(sepet):
+    from mlxtend.frequent_patterns import apriori
+    X, urun_adlari = sepet
+    df = pd.DataFrame(X.toarray(), columns=urun_adlari)
+    return lambda destek, max_len=None: kume_sozlugu(
+        apriori(df, min_support=destek, use_colnames=True, max_len=max_len))
+
+
+MADENCILER = {
+    "eclat": eclat,
+    "seyrek": seyrek_apriori,
+    "paralel-1": partial(paralel_apriori, isci_sayisi=1),
+    "paralel-2": partial(paralel_apriori, isci_sayisi=2),
+}
+
+
+@pytest.mark.parametrize("destek,max_len", [(0.05, None), (0.01, None), (0.005, 3)])
+@pytest.mark.parametrize("madenci", list(MADENCILER))
+def test_mlxtend_ile_ayni(sepet, mlxtend_sonuclari, madenci, destek, max_len):
+    X, urun_adlari = sepet
+    beklenen = mlxtend_sonuclari(destek, max_len)
+    bulunan = kume_sozlugu(MADENCILER[madenci](X, urun_adlari, destek, max_len=max_len))
+    assert bulunan.keys() == beklenen.keys()
+    for kume, destek_degeri in beklenen.items():
+        assert bulunan[kume] == pytest.approx(destek_degeri)
+
+
+@pytest.fixture(scope="module")
+def segment_maskeleri_(sepet):
+    from segmentler import segment_maskeleri, siparis_nitelikleri
+    from sepet_okuyucu import seyrek_sepet_oku
+    _, _, siparisler = seyrek_sepet_oku(os.path.join(ML_DATA, "market_basket.csv"), idler=True)
+    maskeler = segment_maskeleri(
+        siparis_nitelikleri(os.path.join(ML_DATA, "orders_summary.csv"), siparisler))
+    n = sepet[0].shape[0]
+    maskeler[("test", "bos")] = np.zeros(n, dtype=bool)
+    maskeler[("test", "son_siparis")] = np.arange(n) == n - 1   # son 64-bit kelimenin dolgusu
+    return maskeler
+
+
+@pytest.mark.parametrize("destek,max_len", [(0.05, None), (0.02, 3)])
+def test_segmentli_eclat_mlxtend_ile_ayni(sepet, segment_maskeleri_, destek, max_len):
+    from mlxtend.frequent_patterns import apriori
+    X, urun_adlari = sepet
+    yogun = pd.DataFrame(X.toarray().astype(bool), columns=urun_adlari)
+    sonuc = segmentli_eclat(X, urun_adlari, segment_maskeleri_, destek, max_len=max_len)
+    assert sonuc.keys() == segment_maskeleri_.keys()
+    for segment, maske in segment_maskeleri_.items():
+        bulunan = kume_sozlugu(sonuc[segment])
+        if not maske.any():
+            assert not bulunan, segment
+            continue
+        beklenen = kume_sozlugu(apriori(yogun[maske].reset_index(drop=True), min_support=destek,
+                                        use_colnames=True, max_len=max_len))
+        assert bulunan.keys() == beklenen.keys(), segment
+        for kume, destek_degeri in beklenen.items():
+            assert bulunan[kume] == pytest.approx(destek_degeri), segment
@@ -0,0 +1,61 @@
+import json
+
+import pandas as pd
+import pytest
+
+import apriori_train
+from apriori_train import ONERI_GUVEN, kurallari_turet, oneri_json_yaz
+from madencilik import eclat
+
+
+def eski_json(rules) -> str:
+    """Vektörleştirme öncesi apriori_train.py'nin iterrows + json.dump çıktısı."""
+    oneriler = []
+    for _, row in rules[rules["confidence"] >= ONERI_GUVEN].iterrows():
+        oneriler.append({
+            "tetikleyici":  row["antecedents_str"],
+            "oneri":        row["consequents_str"],
+            "confidence":   round(float(row["confidence"]), 3),
+            "lift":         round(float(row["lift"]), 3),
+            "support":      round(float(row["support"]), 3),
+            "oneri_metni":  f"'{row['antecedents_str']}' ile birlikte "
+                            f"'{row['consequents_str']}' de ekleyin? "
+                            f"(%{int(row['confidence']*100)} müşteri tercih etti)"
+        })
+    return json.dumps(oneriler, ensure_ascii=False, indent=2)
+
+
+def yazilan(rules, tmp_path) -> str:
+    yol = tmp_path / "menu_oneriler.json"
+    adet = oneri_json_yaz(rules, str(yol))
+    assert adet == int((rules["confidence"] >= ONERI_GUVEN).sum())
+    return yol.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("parti", [10_000, 7])
+def test_depodaki_kurallarla_ayni(sepet, tmp_path, monkeypatch, parti):
+    monkeypatch.setattr(apriori_train, "JSON_PARTI", parti)
+    X, urun_adlari = sepet
+    rules = kurallari_turet(eclat(X, urun_adlari, 0.01), min_confidence=0.3, min_lift=1.0)
+    if parti < 10_000:  # küçük parti: birden çok parti sınırı geçilsin
+        assert (rules["confidence"] >= ONERI_GUVEN).sum() > 2 * parti
+    assert yazilan(rules, tmp_path) == eski_json(rules)
+
+
+def test_kacis_ve_sinir_degerleri(tmp_path):
+    adlar = ['Tırnaklı "Özel" Döner', "Ters\\Bölü", "Satır\nSonu\tSekme", "Kahve ☕",
+             "</script>", " ayırıcı", "", "Çay (Bardak)"]
+    rules = pd.DataFrame({
+        "antecedents_str": adlar,
+        "consequents_str": list(reversed(adlar)),
+        "confidence": [ONERI_GUVEN, 0.5499999, 1.0, 0.5555, 0.9999, 0.7, 0.57, 0.29 * 2],
+        "lift":       [1.0005, 2.2225, 12.0, 1e-4, 3.14159, 1.5, 1.0, 7.0],
+        "support":    [0.0125, 0.0135, 0.5, 0.001, 0.0004999, 0.3, 0.2, 0.1],
+    })
+    assert yazilan(rules, tmp_path) == eski_json(rules)
+
+
+def test_bos(tmp_path):
+    rules = pd.DataFrame({"antecedents_str": ["A"], "consequents_str": ["B"],
+                          "confidence": [0.1], "lift": [1.2], "support": [0.05]})
+    assert yazilan(rules, tmp_path) == eski_json(rules) == "[]"
@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pytest
+
+from orneklem import orneklem_oku
+
+ML_DATA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def satir_kumeleri(X, urun_adlari) -> set:
+    adlar = np.array(urun_adlari)
+    return {frozenset(adlar[X[i].indices]) for i in range(X.shape[0])}
+
+
+@pytest.fixture(scope="module")
+def kolonsal(tmp_path_factory):
+    """Aynı tohumla üretilmiş Arrow / Parquet dosyaları ve CSV karşılığı."""
+    pytest.importorskip("pyarrow")
+    import generate_dataset as gd
+    from contextlib import redirect_stdout
+    klasor = tmp_path_factory.mktemp("kolonsal")
+    with open(os.devnull, "w") as bos, redirect_stdout(bos):
+        for bicim in ("csv", "arrow", "parquet"):
+            gd.kaydet(gd.uret_vektorel(n=3000, tohum=5, kompakt=True), str(klasor), bicim)
+    return klasor
+
+
+@pytest.mark.parametrize("dosya", ["market_basket.csv", "apriori_transactions.csv",
+                                   "orders.arrow", "orders.parquet"])
+@pytest.mark.parametrize("boyut", [0.1, 400])
+def test_ornekler_gercek_siparisler(kolonsal, dosya, boyut):
+    from sepet_okuyucu import seyrek_sepet_oku
+    yol = str(kolonsal / dosya)
+    X, urun_adlari = seyrek_sepet_oku(yol)
+    O, ornek_adlari, toplam = orneklem_oku(yol, boyut, tohum=3)
+    assert toplam == X.shape[0] == 3000
+    if boyut >= 1:
+        assert O.shape[0] == boyut
+    else:
+        assert 200 <= O.shape[0] <= 400
+    assert O.shape[1] == len(ornek_adlari)
+    assert satir_kumeleri(O, ornek_adlari) <= satir_kumeleri(X, urun_adlari)
+    assert orneklem_oku(yol, boyut, tohum=3)[0].nnz == O.nnz   # tohum → aynı örneklem
+
+
+def test_onehot_sutunlari_baslik_sirasinda():
+    yol = os.path.join(ML_DATA, "market_basket.csv")
+    with open(yol, encoding="utf-8") as f:
+        baslik = f.readline().rstrip("\r\n").split(",")[1:]
+    assert orneklem_oku(yol, 100)[1] == baslik
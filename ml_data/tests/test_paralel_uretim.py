@@ -0,0 +1,12 @@
+import pytest
+
+import generate_dataset as gd
+
+
+@pytest.mark.parametrize("motor", gd.MOTORLAR)
+def test_isci_sayisi_ciktiyi_degistirmez(motor):
+    ortak = {"n": 2500, "motor": motor, "tohum": 7, "parca_boyutu": 600}
+    tek = gd.uret_paralel(isci_sayisi=1, **ortak)
+    assert len(tek) == 2500
+    assert gd.uret_paralel(isci_sayisi=3, **ortak) == tek
+
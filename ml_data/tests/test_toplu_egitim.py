@@ -0,0 +1,19 @@
+import pytest
+
+from toplu_egitim import planla
+
+
+@pytest.mark.parametrize("ad", ["../x", "/tmp/x", "a/b", "a\\b", "..", ".", "", "x..y"])
+def test_cikti_disina_tasan_ad_reddedilir(ad):
+    with pytest.raises(ValueError, match="geçersiz şube adı"):
+        planla([{"ad": ad, "girdi": "yok.csv"}])
+
+
+def test_buyukten_kucuge(tmp_path):
+    kucuk, buyuk = tmp_path / "kucuk.csv", tmp_path / "buyuk.csv"
+    kucuk.write_text("a\n")
+    buyuk.write_text("a\n" * 100)
+    subeler = planla([{"ad": "kucuk", "girdi": str(kucuk)}, {"ad": "buyuk", "girdi": str(buyuk)}])
+    assert [s["ad"] for s in subeler] == ["buyuk", "kucuk"]
+    with pytest.raises(ValueError, match="birden çok"):
+        planla([{"ad": "a", "girdi": str(kucuk)}, {"ad": "a", "girdi": str(buyuk)}])
@@ -0,0 +1,56 @@
+import random
+import statistics
+from collections import Counter
+
+import pytest
+
+import generate_dataset as gd
+
+N = 20_000
+TOLERANS = 0.04   # toplam değişim uzaklığı; iki klasik tohum arasında ~0.015
+
+
+def toplam_degisim(a: Counter, b: Counter) -> float:
+    na, nb = sum(a.values()), sum(b.values())
+    return 0.5 * sum(abs(a[k] / na - b[k] / nb) for k in a.keys() | b.keys())
+
+
+@pytest.fixture(scope="module")
+def siparisler():
+    klasik = [gd.kaydi_coz(k) for k in gd._uret_klasik(N, 20, random.Random(11))]
+    return klasik, gd.uret_vektorel(N, tohum=11)
+
+
+def test_vektorel_siparisler_gecerli(siparisler):
+    _, vektorel = siparisler
+    bas, son = gd.BASLANGIC_TARIHI.strftime("%Y-%m-%d"), gd.BITIS_TARIHI.strftime("%Y-%m-%d")
+    assert len({s["siparis_id"] for s in vektorel}) == N
+    assert [s["tarih_saat"] for s in vektorel] == sorted(s["tarih_saat"] for s in vektorel)
+    for s in vektorel:
+        miktarlar = {gd.urun_adi(i): 0 for i in s["sepet_ids"]}
+        for parca in s["siparis_icerigi"].split(", "):
+            adet, _, ad = parca.partition(" ")
+            miktarlar[ad] += int(adet)
+        assert s["sepet_ids"] and set(s["sepet_ids"]) <= gd.MENU.keys()
+        assert len(miktarlar) == len(s["sepet_ids"]) and all(miktarlar.values())
+        assert {ad for ad, v in s["one_hot"].items() if v} == miktarlar.keys()
+        assert s["urun_sayisi"] == sum(miktarlar.values())
+        assert s["toplam_tutar"] == pytest.approx(
+            sum(gd.urun_fiyat(i) * miktarlar[gd.urun_adi(i)] for i in s["sepet_ids"]))
+        assert s["saat"] in gd.SAAT_DAGITIM and int(s["tarih_saat"][11:13]) == s["saat"]
+        assert bas <= s["tarih_saat"][:10] <= son
+
+
+@pytest.mark.parametrize("alan", ["saat", "sepet_boyutu", "urunler", "urun_sayisi",
+                                  "yas_grubu", "hava_durumu", "kisi_sayisi", "hafta_sonu"])
+def test_marjinaller_klasik_motorla_uyumlu(siparisler, alan):
+    secici = {"sepet_boyutu": lambda s: [len(s["sepet_ids"])],
+              "urunler": lambda s: s["sepet_ids"]}.get(alan, lambda s: [s[alan]])
+    klasik, vektorel = (Counter(x for s in liste for x in secici(s)) for liste in siparisler)
+    assert toplam_degisim(klasik, vektorel) < TOLERANS
+
+
+def test_ortalama_tutar_klasik_motorla_uyumlu(siparisler):
+    klasik, vektorel = (statistics.fmean(s["toplam_tutar"] for s in liste)
+                        for liste in siparisler)
+    assert vektorel == pytest.approx(klasik, rel=0.02)
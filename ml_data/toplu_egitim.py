@@ -0,0 +1,260 @@
+"""
+CafeML – Çok Şubeli Toplu Eğitim
+================================
+Her şubenin sepet dosyası için apriori_train.egit() çalıştırır; şube başına
+yeni yorumlayıcı açılmaz. Şubeler kalıcı bir süreç havuzuna büyükten küçüğe
+(girdi boyutu) dağıtılır, böylece en uzun işler başta başlar ve sona tek
+büyük iş kalmaz. Her işçi pandas / mlxtend'i bir kez yükler.
+
+Şube kaynakları:
+    KLASOR          : her .csv / .arrow / .parquet dosyası bir şube (ad = dosya adı),
+                      her alt klasör bir şube (içindeki orders.arrow, orders.parquet,
+                      market_basket.csv ya da apriori_transactions.csv)
+    --manifest JSON : [{"ad": "kadikoy", "girdi": "kadikoy/orders.arrow",
+                        "destek": 0.02, "guven": 0.5, "lift": 1.5}, …]
+                      ya da {"kadikoy": "kadikoy/orders.arrow", …}
+                      (eşikler isteğe bağlı; göreli yollar manifeste göre)
+
+Çıktılar:
+    <cikti>/<şube>/   apriori_train çıktıları (kurallar, öneriler, egitim_raporu.json),
+                      egitim.log (şubenin konsol çıktısı) ve --onbellek ile sık küme önbelleği
+    <cikti>/toplu_rapor.json   şube başına süre, kural sayısı, durum + toplamlar
+
+Kullanım:
+    python toplu_egitim.py subeler/
+    python toplu_egitim.py --manifest subeler.json --isci 8 --madenci eclat
+    python toplu_egitim.py subeler/ --cikti gece/ --destek 0.02 --sube kadikoy besiktas
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+
+from apriori_train import MIN_CONFIDENCE, MIN_LIFT, MIN_SUPPORT, ONBELLEK
+
+GIRDI_UZANTILARI = (".csv", ".arrow", ".parquet")
+KLASOR_GIRDILERI = ("orders.arrow", "orders.parquet", "market_basket.csv",
+                    "apriori_transactions.csv")
+MADENCILER = ("mlxtend", "seyrek", "eclat")   # paralel: işçi içinde ayrıca süreç açar
+CIKTI_KLASOR = "toplu_egitim"
+CIKTI_RAPOR = "toplu_rapor.json"
+CIKTI_LOG = "egitim.log"
+OZET_SATIR = 10   # özet tablosundaki en yavaş şube sayısı
+
+
+# ─── 1. ŞUBELER ───
+def klasor_subeleri(klasor: str) -> list:
+    """Klasördeki sepet dosyalarını / şube alt klasörlerini şube listesine çevir."""
+    subeler = []
+    for ad in sorted(os.listdir(klasor)):
+        yol = os.path.join(klasor, ad)
+        if os.path.isdir(yol):
+            girdi = next((os.path.join(yol, g) for g in KLASOR_GIRDILERI
+                          if os.path.exists(os.path.join(yol, g))), None)
+            if girdi:
+                subeler.append({"ad": ad, "girdi": girdi})
+        elif ad.endswith(GIRDI_UZANTILARI):
+            subeler.append({"ad": os.path.splitext(ad)[0], "girdi": yol})
+    return subeler
+
+
+def manifest_subeleri(yol: str) -> list:
+    with open(yol, encoding="utf-8") as f:
+        icerik = json.load(f)
+    if isinstance(icerik, dict):
+        icerik = [{"ad": ad, "girdi": girdi} for ad, girdi in icerik.items()]
+    kok = os.path.dirname(os.path.abspath(yol))
+    subeler = []
+    for s in icerik:
+        if not isinstance(s, dict) or "ad" not in s or "girdi" not in s:
+            raise ValueError(f"manifest girdisinde 'ad' ve 'girdi' gerekli: {s}")
+        subeler.append({**s, "girdi": os.path.join(kok, s["girdi"])})
+    return subeler
+
+
+def gecerli_ad(ad) -> bool:
+    """Şube adı <cikti>/ altında tek bir klasör adı mı (yol ayırıcı, "..", mutlak yol yok)."""
+    return (isinstance(ad, str) and ad not in ("", ".") and ".." not in ad
+            and "/" not in ad and "\\" not in ad and ad == os.path.basename(ad))
+
+
+def planla(subeler: list) -> list:
+    """Adları ve çakışmaları denetle; şubeleri girdi boyutuna göre büyükten küçüğe sırala."""
+    gorulen = set()
+    for s in subeler:
+        if not gecerli_ad(s["ad"]):
+            raise ValueError(f"geçersiz şube adı (yol ayırıcı ya da '..' içeremez): {s['ad']!r}")
+        if s["ad"] in gorulen:
+            raise ValueError(f"şube adı birden çok kez geçiyor: {s['ad']}")
+        gorulen.add(s["ad"])
+        s["bayt"] = os.path.getsize(s["girdi"]) if os.path.exists(s["girdi"]) else 0
+    return sorted(subeler, key=lambda s: -s["bayt"])
+
+
+# ─── 2. İŞÇİ ───
+def _isci_hazirla(madenci: str):
+    """Havuz işçisinde ağır modülleri ilk işten önce bir kez yükle."""
+    import pandas  # noqa: F401
+    import apriori_train  # noqa: F401
+    if madenci == "mlxtend":
+        import mlxtend.frequent_patterns  # noqa: F401
+
+
+def sube_egit(sube: dict, cikti_kok: str, madenci: str, ayar: dict) -> dict:
+    """Tek şubeyi eğit; konsol çıktısı <cikti>/<şube>/egitim.log'a. Hata yakalanıp döndürülür."""
+    from apriori_train import egit
+    klasor = os.path.join(cikti_kok, sube["ad"])
+    os.makedirs(klasor, exist_ok=True)
+    esik = {a: sube.get(a, ayar[a]) for a in ("destek", "guven", "lift")}
+    sonuc = {"ad": sube["ad"], "girdi": sube["girdi"], "bayt": sube["bayt"],
+             "cikti": klasor, "pid": os.getpid(), **esik}
+    bas = time.perf_counter()
+    with open(os.path.join(klasor, CIKTI_LOG), "w", encoding="utf-8") as log, redirect_stdout(log):
+        try:
+            egitim = egit(sube["girdi"], esik["destek"], esik["guven"], esik["lift"], madenci,
+                          onbellek_klasor=(os.path.join(klasor, ONBELLEK) if ayar["onbellek"]
+                                           else None),
+                          cikti_klasor=klasor,
+                          parametreler={"sube": sube["ad"], "girdi": sube["girdi"],
+                                        "madenci": madenci, **esik})
+        except Exception as hata:
+            traceback.print_exc(file=log)
+            sonuc.update(durum="hata", hata=f"{type(hata).__name__}: {hata}")
+        else:
+            rapor = egitim["rapor"]
+            sonuc.update(durum="tamam", kural_sayisi=rapor["kural_sayisi"],
+                         oneri_sayisi=rapor["oneri_sayisi"], tepe_rss_mb=rapor["tepe_rss_mb"],
+                         asamalar={a["asama"]: a["sure_sn"] for a in rapor["asamalar"]})
+    sonuc["sure_sn"] = round(time.perf_counter() - bas, 4)
+    return sonuc
+
+
+# ─── 3. ZAMANLAMA ───
+def toplu_egit(subeler: list, cikti_kok: str = CIKTI_KLASOR, isci: int = None,
+               madenci: str = "mlxtend", destek: float = MIN_SUPPORT,
+               guven: float = MIN_CONFIDENCE, lift: float = MIN_LIFT,
+               onbellek: bool = False, ilerleme=None) -> dict:
+    """Şubeleri büyükten küçüğe isci süreçlik havuzda eğit; toplu raporu döndür.
+
+    isci=1 ise aynı süreçte sırayla çalışır. ilerleme(sonuc, bitti, toplam)
+    her şube bittiğinde çağrılır.
+    """
+    subeler = planla(subeler)
+    isci = max(1, min(isci or os.cpu_count() or 1, len(subeler) or 1))
+    ayar = {"destek": destek, "guven": guven, "lift": lift, "onbellek": onbellek}
+    os.makedirs(cikti_kok, exist_ok=True)
+
+    bas = time.perf_counter()
+    sonuclar = []
+
+    def bitti(sonuc):
+        sonuclar.append(sonuc)
+        if ilerleme is not None:
+            ilerleme(sonuc, len(sonuclar), len(subeler))
+
+    if isci == 1:
+        _isci_hazirla(madenci)
+        for s in subeler:
+            bitti(sube_egit(s, cikti_kok, madenci, ayar))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        # Havuz işleri gönderim sırasıyla alır: büyükten küçüğe (LPT) zamanlama
+        with ProcessPoolExecutor(isci, initializer=_isci_hazirla, initargs=(madenci,)) as havuz:
+            isler = [havuz.submit(sube_egit, s, cikti_kok, madenci, ayar) for s in subeler]
+            for f in as_completed(isler):
+                bitti(f.result())
+
+    duvar = time.perf_counter() - bas
+    toplam_is = sum(s["sure_sn"] for s in sonuclar)
+    rapor = {
+        "isci":          isci,
+        "madenci":       madenci,
+        "sube":          len(sonuclar),
+        "hata":          sum(s["durum"] != "tamam" for s in sonuclar),
+        "duvar_sure_sn": round(duvar, 3),
+        "is_sure_sn":    round(toplam_is, 3),
+        "verim":         round(toplam_is / (duvar * isci), 3),
+        "subeler":       sorted(sonuclar, key=lambda s: -s["sure_sn"]),
+    }
+    with open(os.path.join(cikti_kok, CIKTI_RAPOR), "w", encoding="utf-8") as f:
+        json.dump(rapor, f, ensure_ascii=False, indent=2)
+    return rapor
+
+
+def ozet_yazdir(rapor: dict, adet: int = OZET_SATIR):
+    subeler = rapor["subeler"]
+    print("\n── En yavaş şubeler ─────────────────────────────────────────")
+    print(f"{'Şube':<24} {'Girdi MB':>9} {'Süre (s)':>9} {'Kural':>8} {'Öneri':>7}")
+    for s in subeler[:adet]:
+        print(f"{s['ad']:<24} {s['bayt'] / (1 << 20):>9.1f} {s['sure_sn']:>9.2f} "
+              f"{s.get('kural_sayisi', '-'):>8} {s.get('oneri_sayisi', '-'):>7}")
+    hatalar = [s for s in subeler if s["durum"] != "tamam"]
+    if hatalar:
+        print(f"\n❌ {len(hatalar)} şube başarısız:")
+        for s in hatalar:
+            print(f"   {s['ad']}: {s['hata']} ({os.path.join(s['cikti'], CIKTI_LOG)})")
+    sureler = sorted(s["sure_sn"] for s in subeler)
+    print("\n── Toplam ────────────────────────────────────────────────────")
+    print(f"Şube / işçi          : {rapor['sube']} / {rapor['isci']}")
+    print(f"Duvar süresi         : {rapor['duvar_sure_sn']:.2f} sn")
+    print(f"Şube süreleri toplamı: {rapor['is_sure_sn']:.2f} sn (verim {rapor['verim']:.0%})")
+    if sureler:
+        print(f"Şube süresi          : medyan {sureler[len(sureler) // 2]:.2f} sn, "
+              f"en uzun {sureler[-1]:.2f} sn")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CafeML çok şubeli toplu Apriori eğitimi")
+    parser.add_argument("klasor", nargs="?", default=None,
+                        help="şube sepet dosyalarını / şube alt klasörlerini içeren klasör")
+    parser.add_argument("--manifest", default=None, help="şube listesi (JSON)")
+    parser.add_argument("--sube", nargs="+", default=None, help="yalnız bu şubeleri eğit")
+    parser.add_argument("--cikti", default=CIKTI_KLASOR, help="şube çıktılarının kök klasörü")
+    parser.add_argument("--isci", type=int, default=None,
+                        help="süreç sayısı (varsayılan: tüm çekirdekler; 1 = aynı süreçte)")
+    parser.add_argument("--madenci", choices=MADENCILER, default="mlxtend",
+                        help="sık küme madencisi (apriori_train.py --madenci)")
+    parser.add_argument("--destek", type=float, default=MIN_SUPPORT, help="min_support")
+    parser.add_argument("--guven", type=float, default=MIN_CONFIDENCE, help="min_confidence")
+    parser.add_argument("--lift", type=float, default=MIN_LIFT, help="min_lift")
+    parser.add_argument("--onbellek", action="store_true",
+                        help="şube başına sık küme önbelleğini kullan (<cikti>/<şube>/.cafeml_onbellek)")
+    args = parser.parse_args()
+    if (args.klasor is None) == (args.manifest is None):
+        parser.error("şube klasörü ya da --manifest (yalnız biri) gerekli")
+
+    try:
+        subeler = (manifest_subeleri(args.manifest) if args.manifest
+                   else klasor_subeleri(args.klasor))
+    except (OSError, ValueError) as hata:
+        sys.exit(f"❌ Şube listesi okunamadı: {hata}")
+    if args.sube:
+        eksik = set(args.sube) - {s["ad"] for s in subeler}
+        if eksik:
+            sys.exit(f"❌ Bilinmeyen şube: {', '.join(sorted(eksik))}")
+        subeler = [s for s in subeler if s["ad"] in args.sube]
+    if not subeler:
+        sys.exit("❌ Eğitilecek şube bulunamadı.")
+
+    def ilerleme(sonuc, bitti, toplam):
+        durum = (f"{sonuc['kural_sayisi']} kural" if sonuc["durum"] == "tamam"
+                 else f"❌ {sonuc['hata']}")
+        print(f"   [{bitti}/{toplam}] {sonuc['ad']:<24} {sonuc['sure_sn']:>7.2f} sn  {durum}",
+              flush=True)
+
+    print(f"⚙️  {len(subeler)} şube eğitiliyor (madenci={args.madenci}, "
+          f"min_support={args.destek}) → {args.cikti}/")
+    try:
+        rapor = toplu_egit(subeler, args.cikti, args.isci, args.madenci, args.destek,
+                           args.guven, args.lift, args.onbellek, ilerleme)
+    except ValueError as hata:
+        sys.exit(f"❌ {hata}")
+    ozet_yazdir(rapor)
+    print(f"✓ {os.path.join(args.cikti, CIKTI_RAPOR)} kaydedildi")
+    if rapor["hata"]:
+        raise SystemExit(1)
+    print("\n✅ Toplu eğitim tamamlandı!")